@@ -16,12 +16,12 @@ a = Analysis(
 )
 pyz = PYZ(a.pure)
 
+# One-dir build: a one-file EXE unpacks Qt and WebEngine to a temp dir on every launch
 exe = EXE(
     pyz,
     a.scripts,
-    a.binaries,
-    a.datas,
     [],
+    exclude_binaries=True,
     name='RogaHora',
     debug=False,
     bootloader_ignore_signals=False,
@@ -36,3 +36,12 @@ exe = EXE(
     codesign_identity=None,
     entitlements_file=None,
 )
+coll = COLLECT(
+    exe,
+    a.binaries,
+    a.datas,
+    strip=False,
+    upx=True,
+    upx_exclude=[],
+    name='RogaHora',
+)
@@ -0,0 +1,43 @@
+# benchmarks/batch_charts.py
+# Charts/second of logic.batch_charts.calculate_charts as the worker count grows.
+# Run from the repo root:  python -m benchmarks.batch_charts --charts 5000
+import argparse
+import os
+import time
+
+from benchmarks.datasets import seeded_births
+from logic.astroniharEng import calculate_chart
+from logic.batch_charts import calculate_charts
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Batch chart engine scaling benchmark")
+    parser.add_argument("--charts", type=int, default=2000)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--verify", type=int, default=50,
+                        help="compare this many batch results against calculate_chart")
+    args = parser.parse_args()
+
+    births = seeded_births(args.charts, args.seed)
+
+    worker_counts = sorted({1, args.max_workers} | {w for w in (2, 4, 8, 16, 32) if w <= args.max_workers})
+    baseline = None
+    print(f"{'workers':>8} {'seconds':>9} {'charts/s':>10} {'speedup':>8}")
+    for workers in worker_counts:
+        start = time.perf_counter()
+        results = calculate_charts(births, workers=workers)
+        elapsed = time.perf_counter() - start
+        rate = len(births) / elapsed
+        baseline = baseline or rate
+        print(f"{workers:>8} {elapsed:>9.2f} {rate:>10.0f} {rate / baseline:>7.2f}x")
+
+    mismatches = sum(
+        1 for birth, result in zip(births[:args.verify], results)
+        if calculate_chart(*birth) != result
+    )
+    print(f"verified {min(args.verify, len(births))} charts against calculate_chart: {mismatches} mismatches")
+
+
+if __name__ == "__main__":
+    main()
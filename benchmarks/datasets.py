@@ -0,0 +1,24 @@
+# benchmarks/datasets.py
+# Fixed, seeded birth datasets shared by the benchmarks.
+import datetime
+import random
+
+IST = datetime.timedelta(hours=5, minutes=30)
+
+
+def seeded_births(count, seed=42):
+    """`count` (dt_utc, lat, lon) tuples spread over 1900-2100 and the Indian subcontinent."""
+    rng = random.Random(seed)
+    epoch = datetime.datetime(1900, 1, 1)
+    span = 200 * 365 * 24 * 60
+    births = []
+    for _ in range(count):
+        dt_utc = epoch + datetime.timedelta(minutes=rng.randrange(span))
+        births.append((dt_utc, round(rng.uniform(8.0, 35.0), 4), round(rng.uniform(68.0, 97.0), 4)))
+    return births
+
+
+def local_strings(dt_utc):
+    """(date_str, time_24h) in IST, the form get_panchang takes."""
+    local = dt_utc + IST
+    return local.strftime("%d-%m-%Y"), local.strftime("%H:%M")
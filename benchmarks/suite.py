@@ -0,0 +1,204 @@
+# benchmarks/suite.py
+# Micro/macro benchmarks for the calculation hot paths, with JSON baselines.
+#
+#   python -m benchmarks.suite                                   # sizes 1 and 1k
+#   python -m benchmarks.suite --sizes 1,1000,100000             # include 100k
+#   python -m benchmarks.suite --save-baseline benchmarks/baseline.json
+#   python -m benchmarks.suite --compare benchmarks/baseline.json --threshold 15
+#
+# Each benchmark calls its target once per birth in the dataset (except
+# load_city_data, which does not depend on the birth: at most
+# CITY_DATA_REPEATS calls at every size). Latency
+# (p50/p99) and ops/sec come from a timed pass; peak memory from a separate
+# tracemalloc pass over at most --memory-sample items, so tracing does not
+# distort the timings. Baselines are machine specific: compare runs made on
+# the same host.
+import argparse
+import datetime
+import json
+import os
+import platform
+import re
+import sys
+import time
+import tracemalloc
+
+import swisseph as swe
+
+from benchmarks.datasets import local_strings, seeded_births
+from helper.gul_man import get_gulika_mandi
+from logic import gazetteer
+from logic.astroniharEng import calculate_chart
+from logic.batch_charts import calculate_charts
+from logic.chakras import vargas
+from logic.geo_lookup import load_city_data
+from logic.panchang import get_panchang
+from logic.solar_events import clear_solar_cache
+
+DEFAULT_SIZES = (1, 1000)
+ASTRO_DATA_VARGAS = (1, 3, 6, 9)
+RAW_VARGAS = (10, 12, 16, 20, 24, 27, 30, 40, 45, 60)
+CITY_DATA_REPEATS = 100        # load_city_data does not depend on the birth
+
+
+def _jd(dt_utc):
+    return swe.julday(dt_utc.year, dt_utc.month, dt_utc.day,
+                      dt_utc.hour + dt_utc.minute / 60 + dt_utc.second / 3600)
+
+
+def _generate_html():
+    try:
+        from gui.chakras.vargasTabWidget import VargasTabWidget
+    except ImportError:
+        return None   # PyQt5 not installed: skip the GUI string benchmark
+    return VargasTabWidget.generate_html
+
+
+def build_benchmarks(births):
+    """name -> (prepared argument tuples, callable). Preparation is not timed."""
+    charts = calculate_charts(births)
+    pairs = [(birth, chart) for birth, chart in zip(births, charts) if chart is not None]
+
+    benches = {
+        "calculate_chart": ([birth for birth in births], calculate_chart),
+        "get_panchang": ([local_strings(dt) + (lat, lon, 5.5) for dt, lat, lon in births], get_panchang),
+        "get_gulika_mandi": ([(_jd(dt), lat, lon) for dt, lat, lon in births],
+                             get_gulika_mandi),
+        # Independent of the birth: a fixed number of reopens at every dataset size
+        "load_city_data": ([()] * min(len(births), CITY_DATA_REPEATS), _cold_load_city_data),
+        "get_varga_charts": ([(chart["planets_raw"],) for _, chart in pairs], vargas.get_varga_charts),
+    }
+    for n in ASTRO_DATA_VARGAS:
+        benches[f"get_d{n}_chart"] = ([(chart,) for _, chart in pairs], getattr(vargas, f"get_d{n}_chart"))
+    for n in RAW_VARGAS:
+        benches[f"get_d{n}_chart"] = ([(chart["planets_raw"], chart["planets_raw"]["Ascendant"])
+                                       for _, chart in pairs], getattr(vargas, f"get_d{n}_chart"))
+    generate_html = _generate_html()
+    if generate_html:
+        benches["generate_html"] = ([(chart,) for _, chart in pairs], generate_html)
+    return benches
+
+
+def _cold_load_city_data():
+    # Reopen the compiled gazetteer each time (the CSV itself is only parsed on change)
+    gazetteer._open.cache_clear()
+    return load_city_data()
+
+
+def _percentile(sorted_values, pct):
+    if not sorted_values:
+        return 0.0
+    k = min(len(sorted_values) - 1, max(0, round(pct / 100 * (len(sorted_values) - 1))))
+    return sorted_values[k]
+
+
+def run_one(args_list, fn, memory_sample):
+    clear_solar_cache()
+    latencies = []
+    clock = time.perf_counter_ns
+    start = clock()
+    for args in args_list:
+        t0 = clock()
+        fn(*args)
+        latencies.append(clock() - t0)
+    total_ns = clock() - start
+
+    clear_solar_cache()
+    tracemalloc.start()
+    for args in args_list[:memory_sample]:
+        fn(*args)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    latencies.sort()
+    return {
+        "ops": len(args_list),
+        "ops_per_sec": len(args_list) / (total_ns / 1e9) if total_ns else 0.0,
+        "mean_us": total_ns / len(args_list) / 1e3 if args_list else 0.0,
+        "p50_us": _percentile(latencies, 50) / 1e3,
+        "p99_us": _percentile(latencies, 99) / 1e3,
+        "peak_kib": peak / 1024,
+    }
+
+
+def run_suite(sizes, seed, only=None, memory_sample=1000, stream=sys.stdout):
+    results = {}
+    pattern = re.compile(only) if only else None
+    for size in sizes:
+        births = seeded_births(size, seed)
+        for name, (args_list, fn) in build_benchmarks(births).items():
+            if pattern and not pattern.search(name):
+                continue
+            key = f"{name}[{size}]"
+            results[key] = run_one(args_list, fn, memory_sample)
+            r = results[key]
+            print(f"{key:<28} {r['ops_per_sec']:>12.1f} ops/s  p50 {r['p50_us']:>9.1f} us  "
+                  f"p99 {r['p99_us']:>9.1f} us  peak {r['peak_kib']:>9.1f} KiB", file=stream)
+    return results
+
+
+def compare(results, baseline, threshold_pct):
+    """Names whose mean time per op grew by more than threshold_pct versus the baseline."""
+    regressions = []
+    for key, current in results.items():
+        base = baseline.get("results", {}).get(key)
+        if not base or not base.get("mean_us"):
+            continue
+        change = (current["mean_us"] - base["mean_us"]) / base["mean_us"] * 100
+        if change > threshold_pct:
+            regressions.append((key, base["mean_us"], current["mean_us"], change))
+    return regressions
+
+
+def machine_info():
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "swisseph": getattr(swe, "version", ""),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="RogaHora calculation benchmarks")
+    parser.add_argument("--sizes", default=",".join(map(str, DEFAULT_SIZES)),
+                        help="comma-separated dataset sizes, e.g. 1,1000,100000")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--only", help="regex selecting benchmark names")
+    parser.add_argument("--memory-sample", type=int, default=1000,
+                        help="items per benchmark traced for peak memory")
+    parser.add_argument("--output", help="write this run's results as JSON")
+    parser.add_argument("--save-baseline", help="write this run as a baseline JSON file")
+    parser.add_argument("--compare", help="baseline JSON to compare against")
+    parser.add_argument("--threshold", type=float, default=10.0,
+                        help="fail when mean time per op grows by more than this percentage")
+    args = parser.parse_args(argv)
+
+    sizes = [int(size) for size in args.sizes.split(",") if size]
+    results = run_suite(sizes, args.seed, args.only, args.memory_sample)
+    report = {
+        "created": datetime.datetime.now().isoformat(timespec="seconds"),
+        "machine": machine_info(),
+        "seed": args.seed,
+        "results": results,
+    }
+
+    for path in (args.output, args.save_baseline):
+        if path:
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(report, f, indent=2)
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.threshold)
+        for key, before, after, change in regressions:
+            print(f"❌ {key}: {before:.1f} us -> {after:.1f} us (+{change:.1f}%)", file=sys.stderr)
+        if regressions:
+            return 1
+        print(f"✅ no benchmark slower than baseline by more than {args.threshold:.0f}%", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
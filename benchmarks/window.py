@@ -0,0 +1,93 @@
+# benchmarks/window.py
+# Time to first paint and resident memory of a MainWindow showing one chart.
+#
+#   python -m benchmarks.window                  # lazy tabs, one shared varga view (current)
+#   python -m benchmarks.window --eager          # every tab built up front, a view per varga host
+#   python -m benchmarks.window --web-charts     # QtWebEngine backend instead of the native painter
+#
+# --eager rebuilds the pre-lazy layout on top of the current window: all
+# tab pages are built when the window opens and each varga host gets its
+# own view. Each run measures a fresh process (--repeat runs, median shown);
+# the chart is computed before timing starts.
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+
+def rss_mb():
+    with open("/proc/self/status") as f:
+        for line in f:
+            if line.startswith("VmRSS"):
+                return int(line.split()[1]) / 1024
+    return float("nan")
+
+
+def measure(eager):
+    from PyQt5.QtWidgets import QApplication
+    from PyQt5.QtCore import QCoreApplication, QThreadPool, Qt
+
+    QCoreApplication.setAttribute(Qt.AA_ShareOpenGLContexts)
+    app = QApplication(sys.argv[:1])
+    from gui.main_window import LazyTab, MainWindow
+    from gui.chakras.vargasTabWidget import VargasTabWidget, create_chart_view
+    from logic.astroniharEng import birth_datetime_utc, calculate_chart
+    from logic.chakras import vargas
+
+    astro_data = calculate_chart(birth_datetime_utc("17-05-1990", "08:50 AM"), 28.61, 77.2)
+    panchang_data = {"tithi": "-", "nakshatra": "-"}
+    app.processEvents()
+
+    before = rss_mb()
+    started = time.perf_counter()
+    window = MainWindow("Bench", "Mark", "17-05-1990", "08:50 AM", 28.61, 77.2,
+                        astro_data=astro_data, panchang_data=panchang_data)
+    if eager:
+        for i in range(window.tabs.count()):
+            page = window.tabs.widget(i)
+            if isinstance(page, LazyTab):
+                page.ensure_built()
+        for host in window.findChildren(VargasTabWidget):
+            if host.browser is None or host.browser is window.varga_view:
+                view = create_chart_view()
+                view.set_charts(vargas.get_varga_charts(astro_data["planets_raw"], vargas.DISPLAY_VARGAS))
+                host.attach_view(view)
+    window.resize(1400, 900)
+    window.show()
+    window.repaint()
+    app.processEvents()
+    elapsed = (time.perf_counter() - started) * 1000
+    print(f"{elapsed:.1f} {rss_mb() - before:.1f} {rss_mb():.1f}")
+    # Tabs built eagerly (Transits) start background work; let it finish before teardown
+    QThreadPool.globalInstance().waitForDone()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="MainWindow first paint and memory")
+    parser.add_argument("--eager", action="store_true", help="build every tab up front, one view per host")
+    parser.add_argument("--web-charts", action="store_true", help="use the QtWebEngine chart backend")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.web_charts:
+        os.environ["ROGAHORA_CHART_BACKEND"] = "web"
+    if args.child:
+        measure(args.eager)
+        sys.exit(0)
+
+    command = [sys.executable, "-m", "benchmarks.window", "--child"] + (["--eager"] if args.eager else [])
+    runs = []
+    for _ in range(args.repeat):
+        out = subprocess.run(command, capture_output=True, text=True, env=os.environ)
+        if out.returncode != 0:
+            print(f"[ERROR] Window benchmark failed:\n{out.stderr.strip()}")
+            sys.exit(1)
+        runs.append([float(x) for x in out.stdout.split()[-3:]])
+    paint, grown, total = (statistics.median(column) for column in zip(*runs))
+    mode = "eager" if args.eager else "lazy"
+    backend = "web" if args.web_charts else "native"
+    print(f"{mode} / {backend}: first paint {paint:.0f} ms, RSS +{grown:.1f} MB (process {total:.0f} MB), "
+          f"median of {len(runs)}")
@@ -8,7 +8,7 @@ from logic.karakas import assign_karakas  # ✅ Import here
 
 
 class BasicsTab(QWidget):
-    def __init__(self, astro_data, panchang_data):
+    def __init__(self, astro_data, panchang_data, varga_view=None):
         super().__init__()
 
         # ✅ Assign karakas before rendering
@@ -23,10 +23,10 @@ class BasicsTab(QWidget):
         left_layout.setContentsMargins(0, 0, 0, 0)
         left_layout.setSpacing(10)
 
-        planet_table = self.create_planet_table(astro_data)
+        self.planet_table = self.create_planet_table(astro_data)
         planet_scroll = QScrollArea()
         planet_scroll.setWidgetResizable(True)
-        planet_scroll.setWidget(planet_table)
+        planet_scroll.setWidget(self.planet_table)
         planet_scroll.setMinimumHeight(280)
 
         panchang_display = self.create_panchang_display(panchang_data)
@@ -42,7 +42,7 @@ class BasicsTab(QWidget):
         layout.addWidget(left_container, 3)
 
         # 🗺️ Right Panel
-        chart_box = create_chart_group_box(astro_data)
+        chart_box = create_chart_group_box(astro_data, view=varga_view)
         chart_box.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
         layout.addWidget(chart_box, 5)
 
@@ -100,6 +100,25 @@ class BasicsTab(QWidget):
 
         return table
 
+    def update_positions(self, astro_data):
+        # ⏱ In-place refresh for the birth-time scrubber: only cells whose text changed are touched
+        if "planets" in astro_data:
+            astro_data["planets"], astro_data["karakas"] = assign_karakas(astro_data["planets"])
+        asc = astro_data.get("ascendant", {})
+        rows = [("Asc", asc)]
+        for planet, data in astro_data.get("planets", {}).items():
+            karaka = data.get("karaka", "")
+            rows.append((f"{planet} ({karaka})" if karaka else planet, data))
+
+        table = self.planet_table
+        for row, (display_name, data) in enumerate(rows[:table.rowCount()]):
+            values = (display_name, str(round(data.get("degree", 0), 5)), data.get("zodiac", ""),
+                      data.get("nakshatra", ""), str(data.get("pada", "")))
+            for column, text in enumerate(values, start=1):
+                item = table.item(row, column)
+                if item is not None and item.text() != text:
+                    item.setText(text)
+
     def create_panchang_display(self, panchang_data):
         container = QWidget()
         layout = QVBoxLayout(container)
@@ -0,0 +1,181 @@
+from PyQt5.QtWidgets import QWidget, QScrollArea, QGridLayout
+from PyQt5.QtCore import Qt, QPointF, QRectF, QSize
+from PyQt5.QtGui import QPainter, QPixmap, QPen, QColor, QFont, QFontMetricsF, QTransform
+
+from gui.chakras.vargasTabWidget import HOUSE_POSITIONS
+
+# 📐 Same geometry as the SVG charts: a 240x240 viewBox drawn at CHART_SIZE px under a title bar
+CHART_SIZE = 450
+TITLE_HEIGHT = 24
+MARGIN = 5
+VIEWBOX = 240.0
+DIAMOND = [(-100, -100, 100, 100), (100, -100, -100, 100),
+           (0, -100, 100, 0), (100, 0, 0, 100), (0, 100, -100, 0), (-100, 0, 0, -100)]
+
+
+def _font(pixels, bold=False):
+    font = QFont("Arial")
+    font.setPixelSize(pixels)
+    font.setBold(bold)
+    return font
+
+
+PLANET_FONT = _font(8)
+ZODIAC_FONT = _font(7)
+TITLE_FONT = _font(14, bold=True)
+
+
+class NorthChartWidget(QWidget):
+    """
+    One North-Indian chart painted with QPainter. The frame and diamond are
+    drawn once into a pixmap shared by every chart of the same size; only
+    the house texts are painted per chart, and set_house() repaints just the
+    area of the house that changed.
+    """
+
+    _frames = {}    # (width, height, device pixel ratio) -> QPixmap
+
+    def __init__(self, key, chart=None, parent=None):
+        super().__init__(parent)
+        self.key = key
+        self.houses = {house: {"zodiac": "", "planets": []} for house in range(1, 13)}
+        self.setFixedSize(CHART_SIZE + 2 * MARGIN, CHART_SIZE + TITLE_HEIGHT + 2 * MARGIN)
+        self.setAttribute(Qt.WA_OpaquePaintEvent)
+        self.transform = QTransform()
+        self.transform.translate(MARGIN + CHART_SIZE / 2, MARGIN + TITLE_HEIGHT + CHART_SIZE / 2)
+        self.transform.scale(CHART_SIZE / VIEWBOX, CHART_SIZE / VIEWBOX)
+        if chart is not None:
+            self.set_chart(chart)
+
+    def sizeHint(self):
+        return QSize(self.width(), self.height())
+
+    def set_chart(self, chart):
+        for house, content in chart.items():
+            self.set_house(house, content)
+
+    def set_house(self, house, content):
+        old = self.houses[house]
+        if old == content:
+            return
+        self.houses[house] = {"zodiac": content["zodiac"], "planets": list(content["planets"])}
+        area = self.house_rect(house, old).united(self.house_rect(house, content))
+        self.update(self.transform.mapRect(area).toAlignedRect().adjusted(-2, -2, 2, 2))
+
+    @staticmethod
+    def house_rect(house, content):
+        """Area of a house's texts in viewBox units (as laid out by house_svg)."""
+        x, y = HOUSE_POSITIONS[house]
+        return QRectF(x - 40, -y - 14, 80, len(content["planets"]) * 9 + 20)
+
+    def frame(self):
+        dpr = self.devicePixelRatioF()
+        cache_key = (self.width(), self.height(), dpr)
+        pixmap = self._frames.get(cache_key)
+        if pixmap is None:
+            pixmap = QPixmap(int(self.width() * dpr), int(self.height() * dpr))
+            pixmap.setDevicePixelRatio(dpr)
+            pixmap.fill(QColor("#f4f4f4"))
+            p = QPainter(pixmap)
+            p.setRenderHint(QPainter.Antialiasing)
+            p.setPen(QPen(QColor("#cccccc")))
+            p.setBrush(QColor("white"))
+            p.drawRect(QRectF(0.5, 0.5, self.width() - 1, self.height() - 1))
+            p.fillRect(QRectF(MARGIN, MARGIN, CHART_SIZE, TITLE_HEIGHT), QColor("#eeeeee"))
+            p.setTransform(self.transform)
+            p.setPen(QPen(QColor("black"), 0))
+            p.setBrush(Qt.NoBrush)
+            p.drawRect(QRectF(-100, -100, 200, 200))
+            for x1, y1, x2, y2 in DIAMOND:
+                p.drawLine(QPointF(x1, y1), QPointF(x2, y2))
+            p.end()
+            self._frames[cache_key] = pixmap
+        return pixmap
+
+    def paintEvent(self, event):
+        p = QPainter(self)
+        p.drawPixmap(0, 0, self.frame())
+        p.setRenderHint(QPainter.Antialiasing)
+        p.setRenderHint(QPainter.TextAntialiasing)
+
+        title = QRectF(MARGIN, MARGIN, CHART_SIZE, TITLE_HEIGHT)
+        if title.intersects(QRectF(event.rect())):
+            p.setFont(TITLE_FONT)
+            p.setPen(QColor("black"))
+            p.drawText(title, Qt.AlignCenter, f"{self.key} Chart")
+
+        # 🏠 Only the houses inside the dirty area
+        p.setTransform(self.transform)
+        dirty = self.transform.inverted()[0].mapRect(QRectF(event.rect()))
+        for house, content in self.houses.items():
+            if not self.house_rect(house, content).intersects(dirty):
+                continue
+            x, y = HOUSE_POSITIONS[house]
+            y = -y
+            planets = content["planets"]
+            p.setFont(PLANET_FONT)
+            p.setPen(QColor("darkred"))
+            for i, planet in enumerate(planets):
+                self.draw_centered(p, x, y + i * 9 - 6, planet)
+            p.setFont(ZODIAC_FONT)
+            p.setPen(QColor("black"))
+            self.draw_centered(p, x, y + len(planets) * 9 + 4, content["zodiac"])
+        p.end()
+
+    @staticmethod
+    def draw_centered(painter, x, baseline, text):
+        # text-anchor="middle": centre the advance width on x
+        painter.drawText(QPointF(x - QFontMetricsF(painter.font()).horizontalAdvance(text) / 2, baseline), text)
+
+
+class VargaChartsView(QScrollArea):
+    """
+    Native backend for the divisional charts: a wrapping grid of
+    NorthChartWidgets with the same interface as the web backend
+    (set_charts / patch).
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setWidgetResizable(True)
+        self.body = QWidget()
+        self.body.setStyleSheet("background-color: #f4f4f4;")
+        self.grid = QGridLayout(self.body)
+        self.grid.setContentsMargins(10, 10, 10, 10)
+        self.grid.setSpacing(10)
+        self.grid.setAlignment(Qt.AlignLeft | Qt.AlignTop)
+        self.setWidget(self.body)
+        self.charts = {}
+        self.columns = 0
+
+    def set_charts(self, charts):
+        """Show {varga key: house dict} (vargas.get_varga_charts); unchanged houses are not repainted."""
+        if list(charts) != list(self.charts):
+            for widget in self.charts.values():
+                widget.deleteLater()
+            self.charts = {key: NorthChartWidget(key, parent=self.body) for key in charts}
+            self.columns = 0
+            self.reflow()
+        for key, chart in charts.items():
+            self.charts[key].set_chart(chart)
+
+    def patch(self, changes):
+        """Redraw only the given houses: [(varga key, house, house dict)] as from logic.scrubber.changed_houses."""
+        for key, house, content in changes:
+            widget = self.charts.get(key)
+            if widget is not None:
+                widget.set_house(house, content)
+
+    def reflow(self):
+        # Wrap like the flex layout of the HTML page
+        cell = CHART_SIZE + 2 * MARGIN + self.grid.spacing()
+        columns = max(1, (self.viewport().width() - 20 + self.grid.spacing()) // cell)
+        if columns == self.columns:
+            return
+        self.columns = columns
+        for i, widget in enumerate(self.charts.values()):
+            self.grid.addWidget(widget, i // columns, i % columns)
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self.reflow()
@@ -1,37 +1,81 @@
+import json
+import os
+
 from PyQt5.QtWidgets import QWidget, QVBoxLayout, QGroupBox, QLabel
-from PyQt5.QtWebEngineWidgets import QWebEngineView
 from logic.chakras import vargas
 
+# 🖼️ "native" paints the charts with QPainter (gui.chakras.northChartWidget);
+# "web" renders the SVG page in QtWebEngine (python main.py --web-charts)
+CHART_BACKEND = os.environ.get("ROGAHORA_CHART_BACKEND", "native")
+
+
+def create_web_view():
+    # QtWebEngine starts Chromium; import it only when a chart is first shown
+    from PyQt5.QtWebEngineWidgets import QWebEngineView
+    return QWebEngineView()
+
+
+def create_chart_view(backend=None):
+    """Divisional-charts view of the configured backend: set_charts(charts) shows, patch(changes) updates."""
+    if (backend or CHART_BACKEND) == "web":
+        return WebChartView()
+    from gui.chakras.northChartWidget import VargaChartsView
+    return VargaChartsView()
+
+
+class WebChartView(QWidget):
+    """QtWebEngine backend: the generate_html page, updated by DOM patches."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        self.browser = create_web_view()
+        layout.addWidget(self.browser)
+
+    def set_charts(self, charts):
+        self.browser.setHtml(VargasTabWidget.charts_html(charts))
+
+    def patch(self, changes):
+        if changes:
+            self.browser.page().runJavaScript(VargasTabWidget.patch_script(changes))
+
 
 class VargasTabWidget(QWidget):
-    def __init__(self, astro_data):
+    """
+    Host for the divisional-charts view (see create_chart_view). Pass `view`
+    to show a view that is shared with other hosts (MainWindow moves it to
+    the visible tab); with only `astro_data` the widget creates and fills
+    its own view.
+    """
+
+    def __init__(self, astro_data=None, view=None):
         super().__init__()
         layout = QVBoxLayout()
-        self.browser = QWebEngineView()
-        html = self.generate_html(astro_data)
-        self.browser.setHtml(html)
-        layout.addWidget(self.browser)
         self.setLayout(layout)
+        self.browser = None
+        if view is not None:
+            self.attach_view(view)
+        elif astro_data is not None:
+            view = create_chart_view()
+            view.set_charts(vargas.get_varga_charts(astro_data["planets_raw"], vargas.DISPLAY_VARGAS))
+            self.attach_view(view)
 
-    def generate_html(self, astro_data):
-        asc_deg = astro_data["ascendant"]["degree"]
-        planets_raw = {k: v["degree"] for k, v in astro_data["planets"].items()}
-
-        charts = {
-            "D1": vargas.get_d1_chart(astro_data),
-            "D3": vargas.get_d3_chart(astro_data),
-            "D6": vargas.get_d6_chart(astro_data),
-            "D9": vargas.get_d9_chart(astro_data),
-            "D10": vargas.get_d10_chart(planets_raw, asc_deg),
-            "D12": vargas.get_d12_chart(planets_raw, asc_deg),
-            "D16": vargas.get_d16_chart(planets_raw, asc_deg),
-            "D20": vargas.get_d20_chart(planets_raw, asc_deg),
-            "D30": vargas.get_d30_chart(planets_raw, asc_deg),
-            "D40": vargas.get_d40_chart(planets_raw, asc_deg),
-            "D60": vargas.get_d60_chart(planets_raw, asc_deg),
-        }
-
-        def chart_to_svg(chart):
+    def attach_view(self, view):
+        if self.browser is view and view.parent() is self:
+            return
+        self.browser = view
+        self.layout().addWidget(view)
+        view.show()
+
+    @staticmethod
+    def generate_html(astro_data):
+        # One vectorized engine pass over absolute longitudes for every varga
+        return VargasTabWidget.charts_html(vargas.get_varga_charts(astro_data["planets_raw"], vargas.DISPLAY_VARGAS))
+
+    @staticmethod
+    def charts_html(charts):
+        def chart_to_svg(key, chart):
             svg = '<svg viewBox="-120 -120 240 240" width="450" height="450">'
             svg += """
                 <rect x="-100" y="-100" width="200" height="200" fill="white" stroke="black"/>
@@ -42,21 +86,8 @@ class VargasTabWidget(QWidget):
                 <line x1="0" y1="100" x2="-100" y2="0" stroke="black"/>
                 <line x1="-100" y1="0" x2="0" y2="-100" stroke="black"/>
             """
-            positions = {
-                1: (0, 55), 2: (-50, 80), 3: (-80, 50), 4: (-60, 0),
-                5: (-80, -45), 6: (-50, -85), 7: (0, -40), 8: (60, -80),
-                9: (90, -50), 10: (40, 0), 11: (80, 50), 12: (55, 80)
-            }
-
             for house in range(1, 13):
-                x, y = positions[house]
-                y = -y
-                planets = chart[house]['planets']
-                zodiac = chart[house]['zodiac']
-                for i, p in enumerate(planets):
-                    svg += f'<text x="{x}" y="{y + i * 9 - 6}" font-size="8" fill="darkred" text-anchor="middle">{p}</text>'
-                svg += f'<text x="{x}" y="{y + len(planets) * 9 + 4}" font-size="7" fill="black" text-anchor="middle">{zodiac}</text>'
-
+                svg += f'<g id="{house_id(key, house)}">{house_svg(house, chart[house])}</g>'
             svg += '</svg>'
             return svg
 
@@ -69,21 +100,50 @@ class VargasTabWidget(QWidget):
         </style></head><body><div class="charts">
         """
         for key, chart in charts.items():
-            html += f'<div class="chart"><h4>{key} Chart</h4>{chart_to_svg(chart)}</div>'
+            html += f'<div class="chart"><h4>{key} Chart</h4>{chart_to_svg(key, chart)}</div>'
         html += '</div></body></html>'
         return html
 
+    @staticmethod
+    def patch_script(changes):
+        """
+        JavaScript that redraws only the given houses of a page from
+        generate_html: [(varga key, house, house dict)] as from
+        logic.scrubber.changed_houses.
+        """
+        patches = {house_id(key, house): house_svg(house, content) for key, house, content in changes}
+        return ("(function(p){for(var id in p){var g=document.getElementById(id);if(g)g.innerHTML=p[id];}})("
+                + json.dumps(patches) + ");")
 
-# ✅ Reusable function to embed in BasicsTab etc.
-def create_chart_group_box(astro_data):
-    from PyQt5.QtWebEngineWidgets import QWebEngineView
-    from PyQt5.QtWidgets import QVBoxLayout
 
-    html = VargasTabWidget(astro_data).generate_html(astro_data)
+# 📍 House text anchors inside the 240x240 chart viewBox
+HOUSE_POSITIONS = {
+    1: (0, 55), 2: (-50, 80), 3: (-80, 50), 4: (-60, 0),
+    5: (-80, -45), 6: (-50, -85), 7: (0, -40), 8: (60, -80),
+    9: (90, -50), 10: (40, 0), 11: (80, 50), 12: (55, 80)
+}
+
+
+def house_id(key, house):
+    return f"{key}-h{house}"
+
+
+def house_svg(house, content):
+    """SVG text of one house: planet labels stacked above the zodiac label."""
+    x, y = HOUSE_POSITIONS[house]
+    y = -y
+    planets = content['planets']
+    svg = ''
+    for i, p in enumerate(planets):
+        svg += f'<text x="{x}" y="{y + i * 9 - 6}" font-size="8" fill="darkred" text-anchor="middle">{p}</text>'
+    svg += f'<text x="{x}" y="{y + len(planets) * 9 + 4}" font-size="7" fill="black" text-anchor="middle">{content["zodiac"]}</text>'
+    return svg
+
+
+# ✅ Reusable function to embed in BasicsTab etc.
+def create_chart_group_box(astro_data=None, view=None):
     box = QGroupBox("Divisional Charts")
     layout = QVBoxLayout()
-    view = QWebEngineView()
-    view.setHtml(html)
-    layout.addWidget(view)
+    layout.addWidget(VargasTabWidget(astro_data, view=view))
     box.setLayout(layout)
     return box
@@ -0,0 +1,190 @@
+from PyQt5.QtWidgets import (
+    QDialog, QVBoxLayout, QHBoxLayout, QLineEdit, QLabel, QPushButton, QTableWidget,
+    QTableWidgetItem, QHeaderView, QAbstractItemView, QFileDialog, QMessageBox, QCheckBox, QDateEdit
+)
+from PyQt5.QtCore import QDate, QTimer
+
+from logic.chart_db import get_chart_db
+
+
+class ChartDBDialog(QDialog):
+    """
+    Search the chart database and pick a client. Rows are fetched one page at
+    a time as the list is scrolled, so the dialog stays instant for any size.
+    """
+
+    COLUMNS = ["Name", "Date of Birth", "Time", "City", "State"]
+    PAGE_SIZE = 100
+
+    def __init__(self, parent=None, db=None):
+        super().__init__(parent)
+        self.setWindowTitle("RogaHora - Open Chart")
+        self.resize(820, 560)
+        self.db = db or get_chart_db()
+        self.records = []
+        self.exhausted = False
+        self.selected = None
+
+        layout = QVBoxLayout(self)
+
+        search_row = QHBoxLayout()
+        self.name_edit = QLineEdit()
+        self.name_edit.setPlaceholderText("First or last name...")
+        self.city_edit = QLineEdit()
+        self.city_edit.setPlaceholderText("City (optional)")
+        search_row.addWidget(self.name_edit, 2)
+        search_row.addWidget(self.city_edit, 1)
+        layout.addLayout(search_row)
+
+        # 📅 Optional birth-date range
+        date_row = QHBoxLayout()
+        self.date_check = QCheckBox("Born between")
+        self.date_from = QDateEdit(QDate(1900, 1, 1))
+        self.date_to = QDateEdit(QDate.currentDate())
+        for edit in (self.date_from, self.date_to):
+            edit.setDisplayFormat("dd-MM-yyyy")
+            edit.setCalendarPopup(True)
+            edit.setEnabled(False)
+        self.date_check.toggled.connect(self.date_from.setEnabled)
+        self.date_check.toggled.connect(self.date_to.setEnabled)
+        date_row.addWidget(self.date_check)
+        date_row.addWidget(self.date_from)
+        date_row.addWidget(QLabel("and"))
+        date_row.addWidget(self.date_to)
+        date_row.addStretch()
+        layout.addLayout(date_row)
+
+        self.count_label = QLabel()
+        layout.addWidget(self.count_label)
+
+        self.table = QTableWidget(0, len(self.COLUMNS))
+        self.table.setHorizontalHeaderLabels(self.COLUMNS)
+        self.table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.table.setSelectionMode(QAbstractItemView.SingleSelection)
+        self.table.verticalHeader().setVisible(False)
+        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        self.table.doubleClicked.connect(self.accept_selected)
+        self.table.verticalScrollBar().valueChanged.connect(self.on_scrolled)
+        layout.addWidget(self.table)
+
+        buttons = QHBoxLayout()
+        for text, slot in [("Import Folder...", self.import_folder), ("Import .rhd...", self.import_files),
+                           ("Export .rhd...", self.export_selected), ("Delete", self.delete_selected)]:
+            button = QPushButton(text)
+            button.clicked.connect(slot)
+            buttons.addWidget(button)
+        buttons.addStretch()
+        open_button = QPushButton("Open")
+        open_button.setDefault(True)
+        open_button.clicked.connect(self.accept_selected)
+        cancel_button = QPushButton("Cancel")
+        cancel_button.clicked.connect(self.reject)
+        buttons.addWidget(open_button)
+        buttons.addWidget(cancel_button)
+        layout.addLayout(buttons)
+
+        # ⌨️ Re-query shortly after typing stops
+        self.search_timer = QTimer(self)
+        self.search_timer.setSingleShot(True)
+        self.search_timer.setInterval(120)
+        self.search_timer.timeout.connect(self.run_search)
+        self.name_edit.textChanged.connect(self.search_timer.start)
+        self.city_edit.textChanged.connect(self.search_timer.start)
+        self.date_check.toggled.connect(self.search_timer.start)
+        self.date_from.dateChanged.connect(self.search_timer.start)
+        self.date_to.dateChanged.connect(self.search_timer.start)
+
+        self.run_search()
+
+    def query(self):
+        query = {"text": self.name_edit.text(), "city": self.city_edit.text().strip() or None}
+        if self.date_check.isChecked():
+            # ChartDB compares yyyy-mm-dd bounds, both inclusive
+            query["date_from"] = self.date_from.date().toString("yyyy-MM-dd")
+            query["date_to"] = self.date_to.date().toString("yyyy-MM-dd")
+        return query
+
+    def run_search(self):
+        self.records = []
+        self.exhausted = False
+        self.table.setRowCount(0)
+        total = self.db.count(**self.query())
+        self.count_label.setText(f"{total} match{'es' if total != 1 else ''}")
+        self.fetch_page()
+
+    def fetch_page(self):
+        if self.exhausted:
+            return
+        after = self.records[-1] if self.records else None
+        page = self.db.search(**self.query(), after=after, limit=self.PAGE_SIZE)
+        self.exhausted = len(page) < self.PAGE_SIZE
+
+        row = self.table.rowCount()
+        self.table.setRowCount(row + len(page))
+        for record in page:
+            values = [f"{record['first_name']} {record['last_name']}", record["date"],
+                      f"{record['time']} {record['ampm']}", record["city"], record["state"]]
+            for column, value in enumerate(values):
+                self.table.setItem(row, column, QTableWidgetItem(value))
+            row += 1
+        self.records.extend(page)
+
+    def on_scrolled(self, value):
+        if value >= self.table.verticalScrollBar().maximum() - 5:
+            self.fetch_page()
+
+    def current_record(self):
+        row = self.table.currentRow()
+        return self.records[row] if 0 <= row < len(self.records) else None
+
+    def accept_selected(self):
+        self.selected = self.current_record()
+        if self.selected is not None:
+            self.accept()
+
+    # 📥 Import / export
+
+    def import_rhd(self, inputs):
+        from logic.gazetteer import load_gazetteer
+
+        added, duplicates, errors = self.db.import_rhd(inputs, resolve=load_gazetteer().lookup)
+        message = f"{added} added, {duplicates} already present."
+        if errors:
+            shown = "\n".join(f"{path}: {error}" for path, error in errors[:10])
+            message += f"\n\n{len(errors)} file(s) could not be imported:\n{shown}"
+        QMessageBox.information(self, "Import", message)
+        self.run_search()
+
+    def import_folder(self):
+        folder = QFileDialog.getExistingDirectory(self, "Import .rhd folder")
+        if folder:
+            self.import_rhd([folder])
+
+    def import_files(self):
+        paths, _ = QFileDialog.getOpenFileNames(self, "Import .rhd files", "", "RogaHora Data (*.rhd)")
+        if paths:
+            self.import_rhd(paths)
+
+    def export_selected(self):
+        record = self.current_record()
+        if record is None:
+            return
+        default = f"{record['first_name']}_{record['last_name']}.rhd"
+        path, _ = QFileDialog.getSaveFileName(self, "Export .rhd", default, "RogaHora Data (*.rhd)")
+        if path:
+            if not path.endswith(".rhd"):
+                path += ".rhd"
+            try:
+                self.db.export_rhd(record["id"], path)
+            except Exception as e:
+                QMessageBox.critical(self, "Error", f"Failed to export: {e}")
+
+    def delete_selected(self):
+        record = self.current_record()
+        if record is None:
+            return
+        answer = QMessageBox.question(self, "Delete", f"Delete {record['first_name']} {record['last_name']}?")
+        if answer == QMessageBox.Yes:
+            self.db.delete(record["id"])
+            self.run_search()
@@ -0,0 +1,81 @@
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal, pyqtSlot
+
+from logic.ephemeris_profile import EphemerisProfile, is_installed, profile_call
+from logic.result_cache import cached_astro_data, cached_panchang_payload
+
+
+class _PartTask(QRunnable):
+    def __init__(self, job, part, fn, args):
+        super().__init__()
+        self.job = job
+        self.part = part
+        self.fn = fn
+        self.args = args
+
+    def run(self):
+        # Cancelled while still queued: skip the ephemeris work entirely
+        if self.job.cancelled:
+            return
+        try:
+            result, error = profile_call(self.job.profile, self.fn, *self.args), ""
+        except Exception as e:
+            result, error = None, str(e)
+        self.job._part_done.emit(self.part, result, error)
+
+
+class ChartComputation(QObject):
+    """
+    Computes astro and panchang data for one birth on a QThreadPool, both parts
+    concurrently. Results arrive as signals on the GUI thread; after cancel()
+    nothing more is emitted, so a newer submission can simply replace this one.
+    """
+
+    progress = pyqtSignal(int, int, str)    # parts done, total parts, message
+    astro_ready = pyqtSignal(object)
+    panchang_ready = pyqtSignal(object)
+    failed = pyqtSignal(str, str)           # part, error message
+    finished = pyqtSignal()
+
+    _part_done = pyqtSignal(str, object, str)
+
+    def __init__(self, date, full_time, time, ampm, lat, lon):
+        super().__init__()
+        self.parts = {
+            # 💾 Served from the on-disk result cache when this birth was computed before
+            "astro": (cached_astro_data, (date, full_time, lat, lon)),
+            "panchang": (cached_panchang_payload, (date, time, ampm, lat, lon)),
+        }
+        # 🔬 Per-chart ephemeris call profile, only when instrumentation is installed
+        self.profile = EphemerisProfile(f"{date} {full_time} ({lat}, {lon})") if is_installed() else None
+        self.cancelled = False
+        self.running = False
+        self._done = 0
+        self._part_done.connect(self._on_part_done)
+
+    def start(self, pool=None):
+        pool = pool or QThreadPool.globalInstance()
+        self.running = True
+        self.progress.emit(0, len(self.parts), "Calculating chart...")
+        for part, (fn, args) in self.parts.items():
+            pool.start(_PartTask(self, part, fn, args))
+
+    def cancel(self):
+        self.cancelled = True
+        self.running = False
+
+    @pyqtSlot(str, object, str)
+    def _on_part_done(self, part, result, error):
+        if self.cancelled:
+            return
+        self._done += 1
+        if self._done == len(self.parts):
+            self.running = False
+        if error or result is None:
+            self.failed.emit(part, error or f"{part} calculation failed")
+        if part == "astro":
+            self.astro_ready.emit(result)
+        else:
+            self.panchang_ready.emit(result)
+        self.progress.emit(self._done, len(self.parts), f"{part.capitalize()} data ready")
+        if not self.running:
+            self.finished.emit()
@@ -0,0 +1,63 @@
+import swisseph as swe
+from PyQt5.QtWidgets import QWidget, QVBoxLayout, QLabel, QTreeWidget, QTreeWidgetItem, QHeaderView
+from PyQt5.QtCore import Qt, QDateTime
+from PyQt5.QtGui import QFont
+
+from logic.dasha import DASHA_LORDS, LEVEL_NAMES, dasha_from_astro_data, format_jd
+
+PATH_ROLE = Qt.UserRole
+
+
+def _now_jd():
+    now = QDateTime.currentDateTimeUtc()
+    date, time = now.date(), now.time()
+    return swe.julday(date.year(), date.month(), date.day(), time.hour() + time.minute() / 60.0)
+
+
+class DashaTab(QWidget):
+    """Vimshottari periods as a tree; sub-periods are computed when a row is expanded."""
+
+    def __init__(self, astro_data):
+        super().__init__()
+        self.dasha = dasha_from_astro_data(astro_data)
+        now = _now_jd()
+        self.active_path = self.dasha.path_at(now)
+
+        layout = QVBoxLayout(self)
+        running = self.dasha.active(now)
+        summary = " / ".join(lord for _, lord, _, _ in running) or "—"
+        layout.addWidget(QLabel(f"<b>Running now:</b> {summary}"))
+
+        self.tree = QTreeWidget()
+        self.tree.setHeaderLabels(["Lord", "Level", "Start", "End"])
+        self.tree.header().setSectionResizeMode(QHeaderView.ResizeToContents)
+        self.tree.itemExpanded.connect(self.populate)
+        layout.addWidget(self.tree)
+
+        self.add_children(self.tree.invisibleRootItem(), ())
+        # 📍 Open the tree down to the running period
+        parent = self.tree.invisibleRootItem()
+        for depth in range(1, len(self.active_path)):
+            item = parent.child(self.active_path[depth - 1])
+            item.setExpanded(True)
+            parent = item
+
+    def add_children(self, parent, path):
+        starts, ends, lords = self.dasha.periods(path)
+        level = len(path)
+        bold = QFont()
+        bold.setBold(True)
+        for position, (start, end, lord) in enumerate(zip(starts, ends, lords)):
+            child_path = path + (position,)
+            item = QTreeWidgetItem([DASHA_LORDS[lord], LEVEL_NAMES[level], format_jd(start), format_jd(end)])
+            item.setData(0, PATH_ROLE, child_path)
+            if self.active_path[:len(child_path)] == child_path:
+                for column in range(4):
+                    item.setFont(column, bold)
+            if level + 1 < len(LEVEL_NAMES):
+                item.setChildIndicatorPolicy(QTreeWidgetItem.ShowIndicator)
+            parent.addChild(item)
+
+    def populate(self, item):
+        if item.childCount() == 0:
+            self.add_children(item, tuple(item.data(0, PATH_ROLE)))
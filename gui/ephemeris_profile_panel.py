@@ -0,0 +1,67 @@
+from PyQt5.QtWidgets import (
+    QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QTableWidget, QTableWidgetItem,
+    QHeaderView, QFileDialog
+)
+from PyQt5.QtCore import Qt
+
+
+class EphemerisProfilePanel(QWidget):
+    """Debug panel listing the Swiss Ephemeris calls made for the current chart."""
+
+    COLUMNS = ["Function", "Call site", "Calls", "Total ms", "Mean µs"]
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.profile = None
+
+        layout = QVBoxLayout(self)
+        header = QHBoxLayout()
+        self.summary = QLabel("No chart profiled yet.")
+        header.addWidget(self.summary, 1)
+        self.export_button = QPushButton("Export JSON...")
+        self.export_button.setEnabled(False)
+        self.export_button.clicked.connect(self.export_json)
+        header.addWidget(self.export_button)
+        layout.addLayout(header)
+
+        self.table = QTableWidget(0, len(self.COLUMNS))
+        self.table.setHorizontalHeaderLabels(self.COLUMNS)
+        self.table.setEditTriggers(QTableWidget.NoEditTriggers)
+        self.table.verticalHeader().setVisible(False)
+        self.table.horizontalHeader().setSectionResizeMode(1, QHeaderView.Stretch)
+        layout.addWidget(self.table)
+
+    def set_profile(self, profile):
+        self.profile = profile
+        self.refresh()
+
+    def refresh(self):
+        profile = self.profile
+        rows = profile.rows() if profile is not None else []
+        self.table.setRowCount(len(rows))
+        for r, (function, site, count, seconds) in enumerate(rows):
+            values = [function, site, str(count), f"{seconds * 1000:.3f}", f"{seconds / count * 1e6:.1f}"]
+            for c, value in enumerate(values):
+                item = QTableWidgetItem(value)
+                if c >= 2:
+                    item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
+                self.table.setItem(r, c, item)
+
+        if profile is None:
+            self.summary.setText("No chart profiled yet.")
+        else:
+            by_function = ", ".join(f"{name} ×{count}" for name, (count, _) in sorted(profile.by_function().items()))
+            self.summary.setText(f"{profile.label}: {profile.total_calls()} calls, "
+                                 f"{profile.total_seconds() * 1000:.2f} ms — {by_function}")
+        self.export_button.setEnabled(profile is not None)
+
+    def export_json(self):
+        if self.profile is None:
+            return
+        path, _ = QFileDialog.getSaveFileName(self, "Export ephemeris profile", "ephemeris_profile.json",
+                                              "JSON files (*.json)")
+        if path:
+            try:
+                self.profile.save(path)
+            except OSError as e:
+                print(f"[ERROR] Failed to export ephemeris profile: {e}")
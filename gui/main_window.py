@@ -1,16 +1,45 @@
 from PyQt5.QtWidgets import (
-    QWidget, QVBoxLayout, QLabel, QTabWidget, QToolBar, QAction, QMainWindow
+    QWidget, QVBoxLayout, QLabel, QTabWidget, QToolBar, QAction, QMainWindow, QDockWidget
 )
 from PyQt5.QtCore import QSize, Qt
 from PyQt5.QtGui import QIcon
 
-from gui.chakras.vargasTabWidget import VargasTabWidget
+from gui.chakras.vargasTabWidget import VargasTabWidget, create_chart_view
 from gui.basic import BasicsTab
 from gui.start_form import StartForm
+from logic.chakras import vargas
+from logic.ephemeris_profile import is_installed as ephemeris_profiling
+
+
+class LazyTab(QWidget):
+    """Tab page whose content is built by `builder` the first time it is shown."""
+
+    def __init__(self, builder):
+        super().__init__()
+        self.builder = builder
+        self.content = None
+        self._layout = QVBoxLayout(self)
+        self._layout.setContentsMargins(0, 0, 0, 0)
+
+    def ensure_built(self):
+        if self.content is None:
+            self.content = self.builder()
+            self._layout.addWidget(self.content)
+
+    def reset(self):
+        if self.content is not None:
+            self._layout.removeWidget(self.content)
+            self.content.deleteLater()
+            self.content = None
+
+
+# Tab pages built from panchang_data
+PANCHANG_TABS = ("Basics", "Panchang")
 
 
 class MainWindow(QMainWindow):
-    def __init__(self, name, surname, date, time, lat, lon, astro_data, panchang_data):
+    def __init__(self, name, surname, date, time, lat, lon, astro_data=None, panchang_data=None,
+                 computation=None):
         super().__init__()
         self.setWindowTitle(f"RogaHora - Chart Viewer for {name} {surname}")
         self.setGeometry(100, 100, 1400, 900)
@@ -25,6 +54,13 @@ class MainWindow(QMainWindow):
         self.astro_data = astro_data
         self.panchang_data = panchang_data
         self.birth_form = None
+        self.computation = None
+        self.scrubber_dock = None
+
+        # 🗺️ One view for the varga charts, moved between Basics and Chakras
+        self.varga_view = None
+        self._varga_charts = None
+        self._varga_view_charts = None
 
         # 🌟 Central Layout
         self.central_widget = QWidget()
@@ -37,7 +73,9 @@ class MainWindow(QMainWindow):
         self.addToolBar(Qt.TopToolBarArea, self.toolbar)
 
         self.toolbar.addAction(QAction(QIcon(), "New", self))
-        self.toolbar.addAction(QAction(QIcon(), "Open", self))
+        open_action = QAction(QIcon(), "Open", self)
+        open_action.triggered.connect(self.open_chart_dialog)
+        self.toolbar.addAction(open_action)
         self.toolbar.addAction(QAction(QIcon(), "Save", self))
 
         edit_action = QAction(QIcon(), "Edit", self)
@@ -63,9 +101,21 @@ class MainWindow(QMainWindow):
         self.iconbar.addSeparator()
         self.iconbar.addAction(QAction(QIcon("icons/settings.png"), "Settings", self))
 
+        # 🔬 Ephemeris call profile (only with --profile-ephemeris)
+        self.profile_panel = None
+        if ephemeris_profiling():
+            from gui.ephemeris_profile_panel import EphemerisProfilePanel
+            self.profile_panel = EphemerisProfilePanel()
+            dock = QDockWidget("Ephemeris Profile", self)
+            dock.setWidget(self.profile_panel)
+            self.addDockWidget(Qt.BottomDockWidgetArea, dock)
+
         # 📑 Tabs
         self.tabs = QTabWidget()
+        self.tabs.currentChanged.connect(self.on_tab_changed)
         self.layout.addWidget(self.tabs)
+        if computation is not None:
+            self.track_computation(computation)
         self.load_tabs()
 
         self.setStyleSheet("""
@@ -90,28 +140,98 @@ class MainWindow(QMainWindow):
         """)
 
     def load_tabs(self):
+        builders = [
+            ("Chakras", self.needs_data(lambda: self.create_chakras_tab(self.astro_data), "astro_data")),
+            ("Basics", self.needs_data(lambda: BasicsTab(self.astro_data, self.panchang_data,
+                                                         varga_view=self.shared_varga_view()),
+                                       "astro_data")),
+            ("Panchang", self.needs_data(lambda: self.create_panchang_tab(self.panchang_data),
+                                         "panchang_data")),
+            ("Strengths", lambda: QLabel("Strength data...")),
+            ("Dasas", self.needs_data(lambda: self.create_dasha_tab(self.astro_data), "astro_data")),
+            ("Transits", self.create_transits_tab),
+            ("Tajaka", lambda: QLabel("Tajaka charts...")),
+            ("Tithi Pravesha", lambda: QLabel("Tithi Pravesha...")),
+            ("Mundane", lambda: QLabel("Mundane info...")),
+            ("Remedies", lambda: QLabel("Remedies...")),
+            ("Research", self.create_research_tab),
+            ("Learn Medical Astrology", lambda: QLabel("Learn Medical Astrology...")),
+        ]
+
+        self.tabs.blockSignals(True)
         self.tabs.clear()
-        self.tabs.addTab(self.create_chakras_tab(self.astro_data), "Chakras")
-        self.tabs.addTab(BasicsTab(self.astro_data, self.panchang_data), "Basics")
-        self.tabs.addTab(self.create_panchang_tab(self.panchang_data), "Panchang")
-        self.tabs.addTab(QLabel("Strength data..."), "Strengths")
-        self.tabs.addTab(QLabel("Vimshottari Dasha..."), "Dasas")
-        self.tabs.addTab(QLabel("Transits..."), "Transits")
-        self.tabs.addTab(QLabel("Tajaka charts..."), "Tajaka")
-        self.tabs.addTab(QLabel("Tithi Pravesha..."), "Tithi Pravesha")
-        self.tabs.addTab(QLabel("Mundane info..."), "Mundane")
-        self.tabs.addTab(QLabel("Remedies..."), "Remedies")
-        self.tabs.addTab(QLabel("Research..."), "Research")
-        self.tabs.addTab(QLabel("Learn Medical Astrology..."), "Learn Medical Astrology")
+        for title, builder in builders:
+            self.tabs.addTab(LazyTab(builder), title)
+        self.tabs.blockSignals(False)
 
         # 🔁 Show "Basics" tab first
         self.tabs.setCurrentIndex(1)
+        self.on_tab_changed(1)
+
+    def needs_data(self, builder, attr):
+        # Placeholder until the background computation delivers `attr`
+        def build():
+            if getattr(self, attr) is not None:
+                return builder()
+            if self.computation is not None and self.computation.running:
+                return QLabel("⏳ Calculating...")
+            return QLabel("Chart data not available.")
+        return build
+
+    def on_tab_changed(self, index):
+        page = self.tabs.widget(index)
+        if not isinstance(page, LazyTab):
+            return
+        page.ensure_built()
+        hosts = page.findChildren(VargasTabWidget)
+        if hosts and self.astro_data is not None:
+            hosts[0].attach_view(self.shared_varga_view())
+        if self.scrubber_dock is not None:
+            # A page built mid-scrub shows the computed chart; bring it to the slider's time
+            self.scrubber_dock.schedule(self.scrubber_dock.minutes)
+
+    def varga_charts(self):
+        # Computed once per chart, shared by every tab that shows the vargas
+        if self._varga_charts is None and self.astro_data is not None:
+            self._varga_charts = vargas.get_varga_charts(self.astro_data["planets_raw"], vargas.DISPLAY_VARGAS)
+        return self._varga_charts
+
+    def shared_varga_view(self):
+        if self.varga_view is None:
+            self.varga_view = create_chart_view()
+        charts = self.varga_charts()
+        if charts is not None and self._varga_view_charts is not charts:
+            self.varga_view.set_charts(charts)
+            self._varga_view_charts = charts
+        return self.varga_view
+
+    def refresh_tabs(self, titles=None):
+        # `titles`: rebuild only those pages; the chart (varga cache, scrubber) is unchanged
+        if titles is None:
+            # A scrubber belongs to the chart it was opened on
+            self.close_time_scrubber()
+            self._varga_charts = None
+        # Keep the shared view alive while the pages that host it are torn down
+        if self.varga_view is not None and (titles is None or self.varga_view_host() in titles):
+            self.varga_view.setParent(None)
+        for i in range(self.tabs.count()):
+            page = self.tabs.widget(i)
+            if isinstance(page, LazyTab) and (titles is None or self.tabs.tabText(i) in titles):
+                page.reset()
+        self.on_tab_changed(self.tabs.currentIndex())
+
+    def varga_view_host(self):
+        # Title of the tab page the shared view currently sits in
+        for i in range(self.tabs.count()):
+            if self.varga_view is not None and self.tabs.widget(i).isAncestorOf(self.varga_view):
+                return self.tabs.tabText(i)
+        return None
 
     def create_chakras_tab(self, astro_data):
         container = QWidget()
         layout = QVBoxLayout()
         sub_tabs = QTabWidget()
-        sub_tabs.addTab(VargasTabWidget(astro_data), "Many Vargas")
+        sub_tabs.addTab(VargasTabWidget(view=self.shared_varga_view()), "Many Vargas")
         sub_tabs.addTab(QLabel("Mixed 2-Vargas coming soon..."), "Mixed 2-Vargas")
         sub_tabs.addTab(QLabel("Kalachakra data..."), "Kalachakra")
         sub_tabs.addTab(QLabel("Sarvatobhadra..."), "Sarvatobhadra")
@@ -120,6 +240,18 @@ class MainWindow(QMainWindow):
         container.setLayout(layout)
         return container
 
+    def create_dasha_tab(self, astro_data):
+        from gui.dasha_tab import DashaTab
+        return DashaTab(astro_data)
+
+    def create_transits_tab(self):
+        from gui.transits_tab import TransitsTab
+        return TransitsTab()
+
+    def create_research_tab(self):
+        from gui.research_tab import ResearchTab
+        return ResearchTab(open_record=self.open_record)
+
     def create_panchang_tab(self, panchang_data):
         container = QWidget()
         layout = QVBoxLayout()
@@ -142,7 +274,87 @@ class MainWindow(QMainWindow):
         self.birth_form.setAttribute(Qt.WA_DeleteOnClose, False)
         self.birth_form.show()
 
-    def update_chart_data(self, name, surname, date, time, lat, lon, astro_data, panchang_data):
+    def open_time_scrubber(self):
+        # ⏱ Birth time +- a few hours, patched into the open views (see gui.scrubber_dock)
+        if self.astro_data is None:
+            self.statusBar().showMessage("⚠️ The chart is still being calculated", 3000)
+            return
+        from gui.scrubber_dock import TimeScrubberDock
+        self.close_time_scrubber()
+        self.scrubber_dock = TimeScrubberDock(self)
+        self.addDockWidget(Qt.BottomDockWidgetArea, self.scrubber_dock)
+
+    def close_time_scrubber(self):
+        if self.scrubber_dock is not None:
+            dock, self.scrubber_dock = self.scrubber_dock, None
+            dock.close()
+            dock.deleteLater()
+
+    def apply_birth_time(self, date, time, ampm):
+        # Same person and place, recomputed for the scrubbed time
+        from gui.chart_worker import ChartComputation
+        full_time = f"{time} {ampm}"
+        computation = ChartComputation(date, full_time, time, ampm, self.lat, self.lon)
+        computation.start()
+        self.update_chart_data(self.name, self.surname, date, full_time, self.lat, self.lon,
+                               computation=computation)
+
+    def open_chart_dialog(self):
+        from gui.chart_db_dialog import ChartDBDialog
+        dialog = ChartDBDialog(self)
+        if dialog.exec_() and dialog.selected is not None:
+            self.open_record(dialog.selected)
+
+    def open_record(self, record):
+        # 📂 A chart database record (see logic.chart_db)
+        from gui.chart_worker import ChartComputation
+        from logic.gazetteer import load_gazetteer
+
+        lat, lon = record.get("lat"), record.get("lon")
+        if lat is None or lon is None:
+            try:
+                lat, lon = load_gazetteer().lookup(record["state"], record["city"])
+            except KeyError:
+                self.statusBar().showMessage(f"⚠️ Unknown city {record['state']} / {record['city']}")
+                return
+        full_time = f"{record['time']} {record['ampm']}"
+        computation = ChartComputation(record["date"], full_time, record["time"], record["ampm"], lat, lon)
+        computation.start()
+        self.update_chart_data(record["first_name"], record["last_name"], record["date"], full_time, lat, lon,
+                               computation=computation)
+
+    # ⚙️ Background computation (see gui.chart_worker)
+
+    def track_computation(self, computation):
+        # A newer submission supersedes whatever is still in flight
+        if self.computation is not None and self.computation is not computation:
+            self.computation.cancel()
+        self.computation = computation
+        computation.progress.connect(self.on_computation_progress)
+        computation.astro_ready.connect(self.set_astro_data)
+        computation.panchang_ready.connect(self.set_panchang_data)
+        computation.failed.connect(self.on_computation_failed)
+        if self.profile_panel is not None:
+            self.profile_panel.set_profile(computation.profile)
+            computation.finished.connect(self.profile_panel.refresh)
+
+    def on_computation_progress(self, done, total, message):
+        self.statusBar().showMessage(f"{message} ({done}/{total})", 0 if done < total else 3000)
+
+    def on_computation_failed(self, part, message):
+        self.statusBar().showMessage(f"⚠️ {part} calculation failed: {message}")
+
+    def set_astro_data(self, astro_data):
+        self.astro_data = astro_data
+        self.refresh_tabs()
+
+    def set_panchang_data(self, panchang_data):
+        # Only the pages that show panchang depend on it
+        self.panchang_data = panchang_data
+        self.refresh_tabs(PANCHANG_TABS)
+
+    def update_chart_data(self, name, surname, date, time, lat, lon, astro_data=None, panchang_data=None,
+                          computation=None):
         self.name = name
         self.surname = surname
         self.date = date
@@ -152,4 +364,6 @@ class MainWindow(QMainWindow):
         self.astro_data = astro_data
         self.panchang_data = panchang_data
         self.setWindowTitle(f"RogaHora - Chart Viewer for {name} {surname}")
-        self.load_tabs()
+        if computation is not None:
+            self.track_computation(computation)
+        self.refresh_tabs()
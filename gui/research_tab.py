@@ -0,0 +1,136 @@
+import time
+
+from PyQt5.QtWidgets import (
+    QWidget, QVBoxLayout, QHBoxLayout, QLineEdit, QPushButton, QLabel, QTableWidget,
+    QTableWidgetItem, QHeaderView, QAbstractItemView
+)
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+
+from logic.batch_charts import SPAWN_CONTEXT
+from logic.chart_db import get_chart_db
+from logic.research import DEFAULT_DIR, QueryError, build_from_chart_db, load_index
+
+MAX_ROWS = 500
+EXAMPLES = "e.g.  Sat in Sco in D9 and Mon in Ashl   ·   AK is Sat   ·   Jup in house 10 in D10 and not Rah in Leo"
+
+
+class _BuildSignals(QObject):
+    progress = pyqtSignal(int, int)
+    done = pyqtSignal(str)
+
+
+class _BuildTask(QRunnable):
+    def __init__(self, directory):
+        super().__init__()
+        self.directory = directory
+        self.signals = _BuildSignals()
+
+    def run(self):
+        try:
+            # Runs on a pool thread: the chart workers must not be forked from the GUI process
+            count = build_from_chart_db(get_chart_db(), self.directory, progress=self.signals.progress.emit,
+                                        mp_context=SPAWN_CONTEXT)
+            self.signals.done.emit(f"Indexed {count} charts.")
+        except Exception as e:
+            self.signals.done.emit(f"⚠️ Index build failed: {e}")
+
+
+class ResearchTab(QWidget):
+    """Query the columnar research index built from the chart database."""
+
+    COLUMNS = ["Name", "Date of Birth", "Time", "City", "State"]
+
+    def __init__(self, directory=DEFAULT_DIR, open_record=None):
+        super().__init__()
+        self.directory = directory
+        self.open_record = open_record
+        self.index = None
+        self.matches = []
+
+        layout = QVBoxLayout(self)
+
+        query_row = QHBoxLayout()
+        self.query_edit = QLineEdit()
+        self.query_edit.setPlaceholderText("Sat in Sco in D9 and Mon in Ashl")
+        self.query_edit.returnPressed.connect(self.run_query)
+        run_button = QPushButton("Run")
+        run_button.clicked.connect(self.run_query)
+        self.build_button = QPushButton("Rebuild Index")
+        self.build_button.clicked.connect(self.rebuild_index)
+        query_row.addWidget(self.query_edit, 1)
+        query_row.addWidget(run_button)
+        query_row.addWidget(self.build_button)
+        layout.addLayout(query_row)
+
+        hint = QLabel(EXAMPLES)
+        hint.setStyleSheet("color: #666;")
+        layout.addWidget(hint)
+
+        self.status = QLabel()
+        layout.addWidget(self.status)
+
+        self.table = QTableWidget(0, len(self.COLUMNS))
+        self.table.setHorizontalHeaderLabels(self.COLUMNS)
+        self.table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.table.verticalHeader().setVisible(False)
+        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        self.table.doubleClicked.connect(self.open_selected)
+        layout.addWidget(self.table)
+
+        self.reload_index()
+
+    def reload_index(self):
+        try:
+            self.index = load_index(self.directory)
+        except (OSError, ValueError) as e:
+            self.index = None
+            self.status.setText(f"⚠️ {e}")
+            return
+        if self.index is None:
+            self.status.setText("No research index yet. Click 'Rebuild Index' to index the chart database.")
+        else:
+            self.status.setText(f"{len(self.index)} charts indexed.")
+
+    def run_query(self):
+        if self.index is None:
+            return
+        started = time.perf_counter()
+        try:
+            ids = self.index.query(self.query_edit.text())
+        except QueryError as e:
+            self.status.setText(f"⚠️ {e}")
+            return
+        elapsed = (time.perf_counter() - started) * 1000
+
+        db = get_chart_db()
+        self.matches = [record for record in (db.get(int(i)) for i in ids[:MAX_ROWS]) if record]
+        self.table.setRowCount(len(self.matches))
+        for row, record in enumerate(self.matches):
+            values = [f"{record['first_name']} {record['last_name']}", record["date"],
+                      f"{record['time']} {record['ampm']}", record["city"], record["state"]]
+            for column, value in enumerate(values):
+                self.table.setItem(row, column, QTableWidgetItem(value))
+        shown = f" (showing first {MAX_ROWS})" if len(ids) > MAX_ROWS else ""
+        self.status.setText(f"{len(ids)} of {len(self.index)} charts match{shown} — {elapsed:.1f} ms")
+
+    def open_selected(self):
+        row = self.table.currentRow()
+        if self.open_record is not None and 0 <= row < len(self.matches):
+            self.open_record(self.matches[row])
+
+    def rebuild_index(self):
+        self.build_button.setEnabled(False)
+        self.index = None   # release the memory maps so the old index can be replaced
+        self.status.setText("Building research index...")
+        task = _BuildTask(self.directory)
+        task.signals.progress.connect(lambda done, total: self.status.setText(f"Indexing {done}/{total} charts..."))
+        task.signals.done.connect(self.on_build_done)
+        self._build_signals = task.signals   # keep the signal object alive until done
+        QThreadPool.globalInstance().start(task)
+
+    def on_build_done(self, message):
+        self.build_button.setEnabled(True)
+        self.reload_index()
+        if self.index is None:
+            self.status.setText(message)
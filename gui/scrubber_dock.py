@@ -0,0 +1,111 @@
+import datetime
+import time
+
+from PyQt5.QtWidgets import QDockWidget, QWidget, QVBoxLayout, QHBoxLayout, QLabel, QSlider, QPushButton
+from PyQt5.QtCore import Qt, QTimer
+
+from gui.basic import BasicsTab
+from logic.astroniharEng import birth_datetime_utc
+from logic.chakras import vargas
+from logic.scrubber import DEFAULT_HOURS, BirthTimeScrubber, changed_houses
+
+IST = datetime.timedelta(hours=5, minutes=30)
+
+
+class TimeScrubberDock(QDockWidget):
+    """
+    Slider through birth time +- `hours` (one-minute steps). Each step
+    interpolates the precomputed trajectories (logic.scrubber), patches only
+    the changed houses into the shared varga view and updates the Basics
+    planet table in place; nothing is rebuilt until "Apply" recomputes the
+    chart for the chosen time.
+    """
+
+    def __init__(self, window, hours=DEFAULT_HOURS):
+        super().__init__("Birth-time Scrubber", window)
+        self.window = window
+        self.dt_utc = birth_datetime_utc(window.date, window.time)
+        self.scrubber = BirthTimeScrubber(self.dt_utc, window.lat, window.lon, hours)
+        self.base_data = window.astro_data
+        self.base = window.varga_charts()
+        self.shown = self.base
+        self.minutes = 0
+        self.pending = None
+        self.applied = False
+
+        body = QWidget()
+        layout = QVBoxLayout(body)
+        self.time_label = QLabel()
+        layout.addWidget(self.time_label)
+
+        self.slider = QSlider(Qt.Horizontal)
+        self.slider.setRange(-int(hours * 60), int(hours * 60))
+        self.slider.setSingleStep(1)
+        self.slider.setPageStep(10)
+        self.slider.setValue(0)
+        self.slider.valueChanged.connect(self.schedule)
+        layout.addWidget(self.slider)
+
+        row = QHBoxLayout()
+        self.step_label = QLabel("")
+        row.addWidget(self.step_label)
+        row.addStretch()
+        reset_button = QPushButton("Reset")
+        reset_button.clicked.connect(lambda: self.slider.setValue(0))
+        row.addWidget(reset_button)
+        apply_button = QPushButton("Apply")
+        apply_button.clicked.connect(self.apply)
+        row.addWidget(apply_button)
+        layout.addLayout(row)
+
+        self.setWidget(body)
+        self.show_time(0)
+
+    def local_time(self, minutes):
+        return self.dt_utc + datetime.timedelta(minutes=minutes) + IST
+
+    def show_time(self, minutes):
+        local = self.local_time(minutes)
+        self.time_label.setText(f"<b>{local:%d-%m-%Y %I:%M %p}</b> IST ({minutes:+d} min)")
+
+    # ⏱ Steps are coalesced: a fast drag renders only the latest slider value
+
+    def schedule(self, minutes):
+        if self.pending is None:
+            QTimer.singleShot(0, self.render_pending)
+        self.pending = minutes
+
+    def render_pending(self):
+        minutes, self.pending = self.pending, None
+        if minutes is None:
+            return
+        started = time.perf_counter()
+        self.minutes = minutes
+        chart = self.scrubber.chart(minutes)
+        self.show_houses(vargas.get_varga_charts(chart.planets_raw, vargas.DISPLAY_VARGAS))
+        for tab in self.window.findChildren(BasicsTab):
+            tab.update_positions(chart.to_dict())
+        self.show_time(minutes)
+        self.step_label.setText(f"step {(time.perf_counter() - started) * 1000:.1f} ms")
+
+    def show_houses(self, charts):
+        changes = changed_houses(self.shown, charts)
+        self.shown = charts
+        view = self.window.varga_view
+        if changes and view is not None:
+            view.patch(changes)
+
+    def apply(self):
+        local = self.local_time(self.minutes)
+        self.applied = True
+        self.window.apply_birth_time(local.strftime("%d-%m-%Y"), local.strftime("%I:%M"), local.strftime("%p"))
+        self.close()
+
+    def closeEvent(self, event):
+        # 🔙 Not applied: put the views back to the computed chart
+        if not self.applied:
+            self.show_houses(self.base)
+            for tab in self.window.findChildren(BasicsTab):
+                tab.update_positions(self.base_data)
+        self.applied = True
+        super().closeEvent(event)
@@ -4,17 +4,16 @@ from PyQt5.QtWidgets import (
 )
 from PyQt5.QtCore import QDate, QTime
 
-from logic.geo_lookup import load_city_data
-from logic.astroniharEng import get_astro_data  
-from logic.panchangWrapper import prepare_panchang_payload
-
-import json
+from logic.gazetteer import load_gazetteer
+from logic.chart_db import get_chart_db
+from logic.rhd_file import save_rhd
+from gui.chart_worker import ChartComputation
 
 class StartForm(QWidget):
     def __init__(self, update_callback=None):
         super().__init__()
         self.setWindowTitle("RogaHora - User Form")
-        self.city_data = load_city_data()
+        self.gazetteer = load_gazetteer()
         self.update_callback = update_callback
 
         layout = QVBoxLayout()
@@ -33,7 +32,7 @@ class StartForm(QWidget):
         self.ampm.addItems(["AM", "PM"])
 
         self.state_dropdown = QComboBox()
-        self.state_dropdown.addItems(sorted(self.city_data.keys()))
+        self.state_dropdown.addItems(self.gazetteer.states())
         self.state_dropdown.currentTextChanged.connect(self.update_cities)
 
         self.city_dropdown = QComboBox()
@@ -68,8 +67,12 @@ class StartForm(QWidget):
         self.btn_save = QPushButton("Save")
         self.btn_save.clicked.connect(self.save_user_data)
 
+        self.btn_open = QPushButton("Open...")
+        self.btn_open.clicked.connect(self.open_saved)
+
         btn_layout.addWidget(self.btn_generate)
         btn_layout.addWidget(self.btn_save)
+        btn_layout.addWidget(self.btn_open)
         layout.addLayout(btn_layout)
 
         self.setLayout(layout)
@@ -77,7 +80,7 @@ class StartForm(QWidget):
 
     def update_cities(self, state):
         self.city_dropdown.clear()
-        self.city_dropdown.addItems(sorted(self.city_data[state].keys()))
+        self.city_dropdown.addItems(self.gazetteer.cities(state))
 
     def handle_generate_chart(self):
         name = self.first_name.text()
@@ -87,47 +90,73 @@ class StartForm(QWidget):
         ampm = self.ampm.currentText()
         state = self.state_dropdown.currentText()
         city = self.city_dropdown.currentText()
-        lat, lon = self.city_data[state][city]
+        lat, lon = self.gazetteer.lookup(state, city)
         full_time = f"{time} {ampm}"
 
-        # Calculate data
-        astro_data = get_astro_data(date, full_time, lat, lon)
-        panchang_data = prepare_panchang_payload(date, time, ampm, lat, lon)
+        # Calculate data off the GUI thread; the main window fills in as results arrive
+        # Results are queued to this thread, so wiring the window up after start() is safe
+        computation = ChartComputation(date, full_time, time, ampm, lat, lon)
+        computation.start()
 
         if self.update_callback:
             # Called from inside main window (edit -> birthdata)
-            self.update_callback(name, surname, date, full_time, lat, lon, astro_data, panchang_data)
-            self.close()
+            self.update_callback(name, surname, date, full_time, lat, lon, computation=computation)
         else:
             # Called from main.py, start main window
             from gui.main_window import MainWindow
-            self.main_win = MainWindow(name, surname, date, full_time, lat, lon, astro_data, panchang_data)
+            self.main_win = MainWindow(name, surname, date, full_time, lat, lon, computation=computation)
             self.main_win.showMaximized()
-            self.close()
+        self.close()
+
+    def form_data(self):
+        return {
+            "first_name": self.first_name.text(),
+            "last_name": self.last_name.text(),
+            "date": self.dob.date().toString("dd-MM-yyyy"),
+            "time": self.time.time().toString("hh:mm"),
+            "ampm": self.ampm.currentText(),
+            "state": self.state_dropdown.currentText(),
+            "city": self.city_dropdown.currentText()
+        }
+
+    def open_saved(self):
+        # 📂 Fill the form from a chart database record
+        from gui.chart_db_dialog import ChartDBDialog
+        dialog = ChartDBDialog(self)
+        if not dialog.exec_() or dialog.selected is None:
+            return
+        record = dialog.selected
+        self.first_name.setText(record["first_name"])
+        self.last_name.setText(record["last_name"])
+        self.dob.setDate(QDate.fromString(record["date"], "dd-MM-yyyy"))
+        self.time.setTime(QTime.fromString(record["time"], "hh:mm"))
+        self.ampm.setCurrentText(record["ampm"])
+        self.state_dropdown.setCurrentText(record["state"])
+        self.city_dropdown.setCurrentText(record["city"])
 
     def save_user_data(self):
+        data = self.form_data()
+
         options = QFileDialog.Options()
         file_path, _ = QFileDialog.getSaveFileName(
             self, "Save User Data", "", "RogaHora Data (*.rhd)", options=options
         )
-
-        if file_path:
-            if not file_path.endswith(".rhd"):
-                file_path += ".rhd"
-
-            data = {
-                "first_name": self.first_name.text(),
-                "last_name": self.last_name.text(),
-                "date": self.dob.date().toString("dd-MM-yyyy"),
-                "time": self.time.time().toString("hh:mm"),
-                "ampm": self.ampm.currentText(),
-                "state": self.state_dropdown.currentText(),
-                "city": self.city_dropdown.currentText()
-            }
-
-            try:
-                with open(file_path, "w") as f:
-                    json.dump(data, f)
-                QMessageBox.information(self, "Saved", "User data saved successfully!")
-            except Exception as e:
-                QMessageBox.critical(self, "Error", f"Failed to save: {e}")
+        if not file_path:
+            return
+        if not file_path.endswith(".rhd"):
+            file_path += ".rhd"
+
+        try:
+            save_rhd(file_path, data)
+        except Exception as e:
+            QMessageBox.critical(self, "Error", f"Failed to save: {e}")
+            return
+
+        # 💾 Every saved client goes into the chart database as well; the file is kept if that fails
+        try:
+            data["lat"], data["lon"] = self.gazetteer.lookup(data["state"], data["city"])
+            get_chart_db().add(data)
+        except Exception as e:
+            QMessageBox.warning(self, "Saved", f"User data saved, but not added to the chart database: {e}")
+            return
+        QMessageBox.information(self, "Saved", "User data saved successfully!")
@@ -5,6 +5,7 @@ def attach_dropdown_to_edit_action(parent, toolbar, edit_action):
 
     # Connect "Birthdata" to parent.open_birthdata_editor
     edit_dropdown_menu.addAction("Birthdata", parent.open_birthdata_editor)
+    edit_dropdown_menu.addAction("Birth-time scrubber", parent.open_time_scrubber)
     edit_dropdown_menu.addAction("Change timezone", lambda: print("Change timezone clicked"))
     edit_dropdown_menu.addAction("User defined special point", lambda: print("Special point clicked"))
     edit_dropdown_menu.addAction("Planetary Special Lagnas (research)", lambda: print("Special Lagnas clicked"))
@@ -0,0 +1,153 @@
+import datetime
+import time
+
+import swisseph as swe
+from PyQt5.QtWidgets import (
+    QWidget, QVBoxLayout, QHBoxLayout, QLabel, QDateEdit, QComboBox, QPushButton, QTableView,
+    QHeaderView, QAbstractItemView
+)
+from PyQt5.QtCore import Qt, QDate, QAbstractTableModel, QModelIndex, QObject, QRunnable, QThreadPool, pyqtSignal
+
+from logic.batch_charts import SPAWN_CONTEXT
+from logic.chart import ZODIAC_SIGNS
+from logic.transits import TRANSIT_BODIES, transit_table
+
+IST = datetime.timedelta(hours=5, minutes=30)
+STEPS = [("Hourly", 1 / 24), ("Daily", 1.0), ("Weekly", 7.0), ("Monthly", 30.0)]
+
+
+def _jd_to_ist(jd):
+    y, m, d, hours = swe.revjul(jd)
+    return datetime.datetime(y, m, d) + datetime.timedelta(minutes=round(hours * 60)) + IST
+
+
+class _TableSignals(QObject):
+    done = pyqtSignal(int, object, float)   # request number, (jds, lon, speed), ms
+    failed = pyqtSignal(int, str)
+
+
+class _TableTask(QRunnable):
+    def __init__(self, request, jd_start, jd_end, step):
+        super().__init__()
+        self.request = request
+        self.args = (jd_start, jd_end, step)
+        self.signals = _TableSignals()
+
+    def run(self):
+        started = time.perf_counter()
+        try:
+            # Runs on a pool thread: long uncached ranges must not fork the GUI process
+            table = transit_table(*self.args, mp_context=SPAWN_CONTEXT)
+        except Exception as e:
+            self.signals.failed.emit(self.request, str(e))
+            return
+        self.signals.done.emit(self.request, table, (time.perf_counter() - started) * 1000)
+
+
+class TransitTableModel(QAbstractTableModel):
+    """Rows of the transit table, formatted only when the view asks for them."""
+
+    def __init__(self):
+        super().__init__()
+        self.jds = self.lon = self.speed = None
+
+    def set_table(self, jds, lon, speed):
+        self.beginResetModel()
+        self.jds, self.lon, self.speed = jds, lon, speed
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if self.jds is None or parent.isValid() else len(self.jds)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 1 + len(TRANSIT_BODIES)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole or orientation != Qt.Horizontal:
+            return None
+        return "Date (IST)" if section == 0 else TRANSIT_BODIES[section - 1]
+
+    def data(self, index, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole or not index.isValid():
+            return None
+        row, column = index.row(), index.column()
+        if column == 0:
+            return _jd_to_ist(self.jds[row]).strftime("%d-%m-%Y %H:%M")
+        lon = float(self.lon[row, column - 1])
+        retro = " ℞" if self.speed[row, column - 1] < 0 and TRANSIT_BODIES[column - 1] not in ("Rah", "Ket") else ""
+        return f"{ZODIAC_SIGNS[int(lon // 30)]} {lon % 30:.2f}°{retro}"
+
+
+class TransitsTab(QWidget):
+    """Sidereal positions of the chart bodies over a date range."""
+
+    def __init__(self):
+        super().__init__()
+        layout = QVBoxLayout(self)
+
+        controls = QHBoxLayout()
+        today = QDate.currentDate()
+        self.from_edit = QDateEdit(today)
+        self.to_edit = QDateEdit(today.addYears(1))
+        for edit in (self.from_edit, self.to_edit):
+            edit.setCalendarPopup(True)
+            edit.setDisplayFormat("dd-MM-yyyy")
+        self.step_combo = QComboBox()
+        for label, step in STEPS:
+            self.step_combo.addItem(label, step)
+        self.step_combo.setCurrentIndex(1)
+        show_button = QPushButton("Show")
+        show_button.clicked.connect(self.refresh)
+        controls.addWidget(QLabel("From"))
+        controls.addWidget(self.from_edit)
+        controls.addWidget(QLabel("To"))
+        controls.addWidget(self.to_edit)
+        controls.addWidget(self.step_combo)
+        controls.addWidget(show_button)
+        controls.addStretch()
+        layout.addLayout(controls)
+
+        self.status = QLabel()
+        layout.addWidget(self.status)
+        self.request = 0
+        self._signals = {}     # request number -> signal object, kept alive until it reports
+
+        self.model = TransitTableModel()
+        self.view = QTableView()
+        self.view.setModel(self.model)
+        self.view.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.view.verticalHeader().setVisible(False)
+        self.view.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        layout.addWidget(self.view)
+
+        self.refresh()
+
+    def refresh(self):
+        start, end = self.from_edit.date(), self.to_edit.date()
+        if end < start:
+            self.status.setText("⚠️ 'To' date is before 'From' date.")
+            return
+        # Midnight IST of each date, as UT Julian days
+        jd_start = swe.julday(start.year(), start.month(), start.day(), 0.0) - 5.5 / 24
+        jd_end = swe.julday(end.year(), end.month(), end.day(), 0.0) - 5.5 / 24
+        # ⚙️ Long or uncached ranges take seconds; compute off the GUI thread
+        self.request += 1
+        task = _TableTask(self.request, jd_start, jd_end, self.step_combo.currentData())
+        task.signals.done.connect(self.on_table_ready)
+        task.signals.failed.connect(self.on_table_failed)
+        self._signals[self.request] = task.signals
+        self.status.setText("⏳ Calculating transits...")
+        QThreadPool.globalInstance().start(task)
+
+    def on_table_ready(self, request, table, elapsed):
+        self._signals.pop(request, None)
+        if request != self.request:
+            return      # superseded by a newer "Show"
+        jds, lon, speed = table
+        self.model.set_table(jds, lon, speed)
+        self.status.setText(f"{len(jds)} rows in {elapsed:.0f} ms")
+
+    def on_table_failed(self, request, message):
+        self._signals.pop(request, None)
+        if request == self.request:
+            self.status.setText(f"⚠️ Transit calculation failed: {message}")
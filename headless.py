@@ -0,0 +1,54 @@
+# headless.py
+# Batch-process .rhd files without a display:
+#   python headless.py clients/ "archive/**/*.rhd" -o charts.ndjson --errors errors.ndjson
+#   python headless.py clients/ -o charts.csv --checkpoint charts.ckpt --resume
+# Never imports PyQt5.
+import argparse
+import os
+import sys
+import time
+
+from logic.rhd_batch import run_batch
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Compute charts and panchang for .rhd files without Qt")
+    parser.add_argument("inputs", nargs="+", help=".rhd files, directories (searched recursively) or glob patterns")
+    parser.add_argument("-o", "--output", required=True, help="output file (.ndjson/.jsonl or .csv)")
+    parser.add_argument("--format", choices=["ndjson", "csv"],
+                        help="output format (default: from the output file extension)")
+    parser.add_argument("--errors", help="write a per-file error report (NDJSON) here instead of stderr")
+    parser.add_argument("--checkpoint", help="file listing completed .rhd paths")
+    parser.add_argument("--resume", action="store_true",
+                        help="skip files already in --checkpoint and append to existing outputs")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument("--tz-offset", type=float, default=5.5, help="birth time zone offset in hours")
+    parser.add_argument("--cache", help="result cache file (default: ~/.rogahora/results.sqlite3)")
+    parser.add_argument("--no-cache", action="store_true", help="always recompute; do not read or write the cache")
+    args = parser.parse_args(argv)
+    if args.resume and not args.checkpoint:
+        parser.error("--resume needs --checkpoint")
+    args.format = args.format or ("csv" if args.output.lower().endswith(".csv") else "ndjson")
+    return args
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    # Worker processes inherit the cache setting through the environment
+    if args.no_cache:
+        os.environ["ROGAHORA_CACHE"] = "off"
+    elif args.cache:
+        os.environ["ROGAHORA_CACHE"] = args.cache
+    start = time.perf_counter()
+    ok, failed, skipped = run_batch(
+        args.inputs, args.output, fmt=args.format, errors_path=args.errors,
+        checkpoint_path=args.checkpoint, resume=args.resume, workers=args.workers,
+        tz_offset=args.tz_offset,
+    )
+    elapsed = time.perf_counter() - start
+    print(f"{ok} ok, {failed} failed, {skipped} skipped (checkpoint) in {elapsed:.1f}s", file=sys.stderr)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
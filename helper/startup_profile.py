@@ -0,0 +1,82 @@
+# 📁 helper/startup_profile.py
+# Opt-in import-time breakdown for `python main.py --profile-startup`.
+# Works in the frozen build too, since it wraps whatever finders are installed.
+import importlib.abc
+import sys
+import time
+
+
+class _TimedLoader(importlib.abc.Loader):
+    def __init__(self, loader, profiler):
+        self._loader = loader
+        self._profiler = profiler
+
+    def __getattr__(self, name):
+        return getattr(self._loader, name)
+
+    def create_module(self, spec):
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module):
+        self._profiler.enter(module.__name__)
+        try:
+            self._loader.exec_module(module)
+        finally:
+            self._profiler.leave(module.__name__)
+
+
+class StartupProfiler(importlib.abc.MetaPathFinder):
+    """Records cumulative and self time of every module executed while installed."""
+
+    def __init__(self):
+        self.start = time.perf_counter()
+        self.modules = {}    # name -> [cumulative, self]
+        self.phases = []     # (label, seconds since start)
+        self._stack = []     # [name, started, child time]
+
+    def install(self):
+        sys.meta_path.insert(0, self)
+        return self
+
+    def uninstall(self):
+        if self in sys.meta_path:
+            sys.meta_path.remove(self)
+
+    def find_spec(self, fullname, path, target=None):
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, "find_spec"):
+                continue
+            spec = finder.find_spec(fullname, path, target)
+            if spec is not None:
+                if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+                    spec.loader = _TimedLoader(spec.loader, self)
+                return spec
+        return None
+
+    def enter(self, name):
+        self._stack.append([name, time.perf_counter(), 0.0])
+
+    def leave(self, name):
+        _, started, child = self._stack.pop()
+        elapsed = time.perf_counter() - started
+        self.modules[name] = [elapsed, elapsed - child]
+        if self._stack:
+            self._stack[-1][2] += elapsed
+
+    def mark(self, label):
+        self.phases.append((label, time.perf_counter() - self.start))
+
+    def report(self, top=25, stream=None):
+        stream = stream or sys.stderr
+        print("⏱ Startup phases (ms since launch)", file=stream)
+        for label, at in self.phases:
+            print(f"  {at * 1000:9.1f}  {label}", file=stream)
+
+        print(f"⏱ Slowest imports (top {top} by cumulative time)", file=stream)
+        print(f"  {'cumul ms':>9} {'self ms':>9}  module", file=stream)
+        ranked = sorted(self.modules.items(), key=lambda item: item[1][0], reverse=True)
+        for name, (cumulative, self_time) in ranked[:top]:
+            print(f"  {cumulative * 1000:9.1f} {self_time * 1000:9.1f}  {name}", file=stream)
+
+        total = sum(self_time for _, self_time in self.modules.values())
+        print(f"  {len(self.modules)} modules, {total * 1000:.1f} ms executing imports", file=stream)
@@ -0,0 +1,227 @@
+# logic/almanac.py
+# Day-by-day panchang almanac for one place: every tithi, karana, nakshatra
+# and yoga of each Vedic day (sunrise to next sunrise) with exact start/end
+# times, plus sunrise/sunset, weekday lord and the 24 hora lords.
+#
+# Element changes are found on the Sun/Moon angles: each angle is monotone,
+# so the boundaries it passes between grid points of the transit
+# interpolants (logic.transits) are bracketed, bisected, then polished with
+# one Newton step on swe.calc_ut (error well under a second). Sunrise comes
+# from the shared solar-day cache, once per day.
+#
+#   python -m logic.almanac --state Delhi --city "New Delhi" --from 01-01-2026 --to 31-12-2026 -o 2026.csv
+import csv
+import datetime
+import json
+
+import numpy as np
+import swisseph as swe
+
+from logic.ephemeris import ensure_ephemeris
+from logic.panchang import KARANAS, LORDS, NAKSHATRAS, TITHIS, WEEKDAYS, YOGAS
+from logic.rootfind import bisect_many
+from logic.solar_events import get_solar_day
+from logic.transits import FLAGS, body_samples, hermite
+
+# Planetary hours follow the Chaldean order, starting from the weekday lord at sunrise
+CHALDEAN_ORDER = ["Sat", "Jup", "Mar", "Sun", "Ven", "Mer", "Mon"]
+
+GRID_DAYS = 0.25                # no element lasts less than ~0.4 day
+CHUNK_DAYS = 64                 # days computed per batch while streaming
+MARGIN_DAYS = 2.0               # every element lasts less than this
+
+CSV_FIELDS = ["date", "weekday", "weekday_lord", "sunrise", "sunset", "element", "number", "name", "start", "end"]
+
+
+def tithi_name(n):
+    if n == 14:
+        return "Purnima"
+    if n == 29:
+        return "Amavasya"
+    return f"{'Shukla' if n < 15 else 'Krishna'} {TITHIS[n % 15]}"
+
+
+def karana_name(n):
+    # 0: Kimstughna, 1-56: the seven movable karanas eight times, 57-59: fixed
+    if n == 0:
+        return KARANAS[0]
+    if n <= 56:
+        return KARANAS[1 + (n - 1) % 7]
+    return KARANAS[n - 49]
+
+
+# element: (span in degrees, angle from unwrapped (sun, moon), name of number)
+ELEMENTS = {
+    "tithi": (12.0, lambda sun, moon: moon - sun, tithi_name),
+    "karana": (6.0, lambda sun, moon: moon - sun, karana_name),
+    "nakshatra": (360 / 27, lambda sun, moon: moon, lambda n: NAKSHATRAS[n]),
+    "yoga": (360 / 27, lambda sun, moon: sun + moon, lambda n: YOGAS[n]),
+}
+
+
+def _exact_sun_moon(jd):
+    sun, _ = swe.calc_ut(jd, swe.SUN, FLAGS)
+    moon, _ = swe.calc_ut(jd, swe.MOON, FLAGS)
+    return (sun[0], moon[0]), (sun[3], moon[3])
+
+
+def element_transitions(jd_start, jd_end):
+    """
+    {element: (times, numbers)} for every element change in [jd_start, jd_end]:
+    from times[i] on the element is numbers[i] (0-based).
+    """
+    ensure_ephemeris()
+    sun_samples = body_samples('Sun', jd_start, jd_end)
+    moon_samples = body_samples('Mon', jd_start, jd_end)
+
+    def sun_moon(t):
+        return hermite(t, *sun_samples)[0], hermite(t, *moon_samples)[0]
+
+    grid = np.append(np.arange(jd_start, jd_end, GRID_DAYS), jd_end)
+    sun, moon = sun_moon(grid)
+    result = {}
+    for name, (span, angle, _) in ELEMENTS.items():
+        k_grid = np.floor(angle(sun, moon) / span).astype(np.int64)
+        counts = np.diff(k_grid)
+        interval = np.repeat(np.arange(len(counts)), counts)
+        k = k_grid[interval] + 1 + np.arange(len(interval)) - np.repeat(np.cumsum(counts) - counts, counts)
+        target = k * span
+        times = bisect_many(lambda t: angle(*sun_moon(t)) - target, grid[interval], grid[interval + 1], xtol=1e-6)
+        # Newton polish on the ephemeris itself
+        for i, t in enumerate(times):
+            (s, m), (ds, dm) = _exact_sun_moon(float(t))
+            error = (angle(s, m) - target[i] + 180.0) % 360.0 - 180.0
+            times[i] = t - error / angle(ds, dm)
+        result[name] = (times, np.mod(k, round(360 / span)))
+    return result
+
+
+def horas(sunrise, sunset, next_sunrise, weekday_lord):
+    """[(start, end, lord)] of the 12 day and 12 night horas."""
+    day, night = (sunset - sunrise) / 12, (next_sunrise - sunset) / 12
+    first = CHALDEAN_ORDER.index(weekday_lord)
+    bounds = [sunrise + day * i for i in range(12)] + [sunset + night * i for i in range(13)]
+    return [(bounds[i], bounds[i + 1], CHALDEAN_ORDER[(first + i) % 7]) for i in range(24)]
+
+
+def _local(jd, tz_offset):
+    if jd is None:
+        return None
+    y, m, d, hours = swe.revjul(jd + tz_offset / 24)
+    stamp = datetime.datetime(y, m, d) + datetime.timedelta(seconds=round(hours * 3600))
+    return stamp.strftime("%d-%m-%Y %H:%M:%S")
+
+
+def iter_almanac(date_from, date_to, lat, lon, tz_offset=5.5):
+    """
+    Yield one dict per civil date from date_from to date_to (dd-mm-yyyy,
+    inclusive), computed CHUNK_DAYS at a time. Times are local dd-mm-yyyy
+    HH:MM:SS strings; elements cover the Vedic day from sunrise to next
+    sunrise (local midnight to midnight where the Sun does not rise).
+    """
+    first = datetime.datetime.strptime(date_from, "%d-%m-%Y").date()
+    last = datetime.datetime.strptime(date_to, "%d-%m-%Y").date()
+    chunk_start = first
+    while chunk_start <= last:
+        dates = [chunk_start + datetime.timedelta(days=i)
+                 for i in range(min(CHUNK_DAYS, (last - chunk_start).days + 1))]
+        chunk_start = dates[-1] + datetime.timedelta(days=1)
+
+        days = []
+        for date in dates:
+            solar = get_solar_day(int(swe.julday(date.year, date.month, date.day, 12.0)), lat, lon)
+            midnight = swe.julday(date.year, date.month, date.day, 0.0) - tz_offset / 24
+            if solar["sunrise"] is not None and solar["next_sunrise"] is not None:
+                window = (solar["sunrise"], solar["next_sunrise"])
+            else:
+                window = (midnight, midnight + 1)
+            days.append((date, solar, window))
+        transitions = element_transitions(days[0][2][0] - MARGIN_DAYS, days[-1][2][1] + MARGIN_DAYS)
+
+        for date, solar, (start, end) in days:
+            weekday = (date.weekday() + 1) % 7
+            record = {
+                "date": date.strftime("%d-%m-%Y"),
+                "weekday": WEEKDAYS[weekday],
+                "weekday_lord": LORDS[weekday],
+                "sunrise": _local(solar["sunrise"], tz_offset),
+                "sunset": _local(solar["sunset"], tz_offset),
+            }
+            for name, (_, _, label) in ELEMENTS.items():
+                times, numbers = transitions[name]
+                i = int(np.searchsorted(times, start, side="right")) - 1
+                periods = []
+                while i + 1 < len(times) and times[i] < end:
+                    n = int(numbers[i])
+                    periods.append({"number": n + 1, "name": label(n),
+                                    "start": _local(float(times[i]), tz_offset),
+                                    "end": _local(float(times[i + 1]), tz_offset)})
+                    i += 1
+                record[name] = periods
+            if solar["sunset"] is not None and solar["next_sunrise"] is not None:
+                record["horas"] = [{"number": n, "name": lord, "start": _local(a, tz_offset),
+                                    "end": _local(b, tz_offset)}
+                                   for n, (a, b, lord) in enumerate(horas(solar["sunrise"], solar["sunset"],
+                                                                          solar["next_sunrise"], LORDS[weekday]),
+                                                                    start=1)]
+            else:
+                record["horas"] = []
+            yield record
+
+
+def write_ndjson(records, fp):
+    """One JSON object per day and line; returns the number of days written."""
+    count = 0
+    for record in records:
+        fp.write(json.dumps(record, ensure_ascii=False) + "\n")
+        count += 1
+    return count
+
+
+def write_csv(records, fp):
+    """One row per element period (and hora) per day; returns the number of days written."""
+    writer = csv.DictWriter(fp, fieldnames=CSV_FIELDS)
+    writer.writeheader()
+    count = 0
+    for record in records:
+        day = {field: record[field] for field in CSV_FIELDS[:5]}
+        for element in list(ELEMENTS) + ["horas"]:
+            for period in record[element]:
+                writer.writerow(dict(day, element=element.rstrip("s"), **period))
+        count += 1
+    return count
+
+
+if __name__ == "__main__":
+    import argparse
+    import sys
+    import time
+
+    parser = argparse.ArgumentParser(description="Panchang almanac with exact element times")
+    parser.add_argument("--from", dest="date_from", required=True, help="first date, dd-mm-yyyy")
+    parser.add_argument("--to", dest="date_to", required=True, help="last date, dd-mm-yyyy")
+    parser.add_argument("--state", help="state of --city in the city database")
+    parser.add_argument("--city")
+    parser.add_argument("--lat", type=float)
+    parser.add_argument("--lon", type=float)
+    parser.add_argument("--tz-offset", type=float, default=5.5, help="time zone offset of the output times")
+    parser.add_argument("-o", "--output", help="output file (.csv or .ndjson; default: NDJSON on stdout)")
+    args = parser.parse_args()
+
+    if args.city:
+        from logic.gazetteer import load_gazetteer
+        lat, lon = load_gazetteer().lookup(args.state, args.city)
+    elif args.lat is not None and args.lon is not None:
+        lat, lon = args.lat, args.lon
+    else:
+        parser.error("give --state/--city or --lat/--lon")
+
+    started = time.perf_counter()
+    records = iter_almanac(args.date_from, args.date_to, lat, lon, args.tz_offset)
+    if args.output is None:
+        count = write_ndjson(records, sys.stdout)
+    else:
+        with open(args.output, "w", newline="", encoding="utf-8") as f:
+            writer = write_csv if args.output.lower().endswith(".csv") else write_ndjson
+            count = writer(records, f)
+    print(f"{count} days in {time.perf_counter() - started:.2f}s", file=sys.stderr)
@@ -1,53 +1,36 @@
 import swisseph as swe
 import datetime
-from helper.gul_man import get_gulika_mandi  # 🔁 New import
-
-# ✅ Short Zodiac Names
-ZODIAC_SIGNS = [
-    'Ari', 'Tau', 'Gem', 'Can', 'Leo', 'Vir',
-    'Lib', 'Sco', 'Sag', 'Cap', 'Aqu', 'Pis'
-]
-
-# ✅ Short Nakshatra Names (27)
-NAKSHATRAS = [
-    "Ash", "Bha", "Kri", "Roh", "Mri", "Ard", "Pun",
-    "Pus", "Ashl", "Mag", "PPh", "UPh", "Has",
-    "Chi", "Swa", "Vis", "Anu", "Jye", "Mul", "PAs",
-    "UAs", "Shr", "Dha", "Sha", "PBh", "UBh", "Rev"
-]
-
-# ✅ Degree → Zodiac, Nakshatra, Pada
-def degree_to_details(deg):
-    zodiac_index = int(deg // 30)
-    nak_index = int((deg % 360) // (360 / 27))
-    pada = int(((deg % (360 / 27)) / (13.333333 / 4))) + 1
-
-    return {
-        'degree': round(deg % 30, 5),
-        'zodiac': ZODIAC_SIGNS[zodiac_index],
-        'nakshatra': NAKSHATRAS[nak_index],
-        'pada': pada
-    }
+import math
+from array import array
+from logic.ephemeris import DEFAULT_CONTEXT, ensure_ephemeris
+from logic.upagrahas import time_upagrahas
+
+# ✅ Sign / nakshatra labels and Degree → Zodiac, Nakshatra, Pada (see logic.chart)
+from logic.chart import (  # noqa: F401
+    ZODIAC_SIGNS, NAKSHATRAS, LONGITUDE_KEYS, SLOT, Chart, degree_to_details
+)
+
+# ✅ "dd-mm-yyyy" + "hh:mm AM" / "HH:MM" birth time in IST → naive UTC datetime
+def birth_datetime_utc(date_str, time_str, tz_offset=5.5):
+    full_str = f"{date_str} {time_str}".strip()
+    has_am_pm = "AM" in full_str.upper() or "PM" in full_str.upper()
+
+    if has_am_pm:
+        try:
+            dt = datetime.datetime.strptime(full_str, "%d-%m-%Y %I:%M %p")
+        except ValueError:
+            clean_time = time_str.replace("AM", "").replace("PM", "").strip()
+            dt = datetime.datetime.strptime(f"{date_str} {clean_time}", "%d-%m-%Y %H:%M")
+    else:
+        dt = datetime.datetime.strptime(full_str, "%d-%m-%Y %H:%M")
+
+    # 🔄 Convert from local time (IST by default) to UTC manually (no double localization)
+    return dt - datetime.timedelta(hours=tz_offset)
 
 # ✅ Used by external GUI to get chart data
-def get_astro_data(date_str, time_str, lat, lon):
+def get_astro_data(date_str, time_str, lat, lon, tz_offset=5.5):
     try:
-        full_str = f"{date_str} {time_str}".strip()
-        has_am_pm = "AM" in full_str.upper() or "PM" in full_str.upper()
-
-        if has_am_pm:
-            try:
-                dt = datetime.datetime.strptime(full_str, "%d-%m-%Y %I:%M %p")
-            except ValueError:
-                clean_time = time_str.replace("AM", "").replace("PM", "").strip()
-                dt = datetime.datetime.strptime(f"{date_str} {clean_time}", "%d-%m-%Y %H:%M")
-        else:
-            dt = datetime.datetime.strptime(full_str, "%d-%m-%Y %H:%M")
-
-        # 🔄 Convert from IST to UTC manually (no double localization)
-        dt_utc = dt - datetime.timedelta(hours=5, minutes=30)
-
-        return calculate_chart(dt_utc, lat, lon)
+        return calculate_chart(birth_datetime_utc(date_str, time_str, tz_offset), lat, lon)
 
     except Exception as e:
         print(f"[ERROR] get_astro_data failed: {e}")
@@ -61,67 +44,57 @@ def get_live_chart():
     dt_utc = now - datetime.timedelta(hours=5, minutes=30)
     return calculate_chart(dt_utc, latitude, longitude)
 
+# ⚙️ Swiss Ephemeris setup (path + ayanamsa) for the calling thread
+def configure_ephemeris(ctx=DEFAULT_CONTEXT):
+    ensure_ephemeris(ctx)
+
 # ✅ Internal Chart Generator
-def calculate_chart(dt_utc, lat, lon):
+def calculate_chart(dt_utc, lat, lon, ctx=DEFAULT_CONTEXT):
+    configure_ephemeris(ctx)
+    return compute_chart(dt_utc, lat, lon, ctx)
+
+# ✅ Chart body (batch workers call this directly); ctx picks ayanamsa and house system
+def compute_chart(dt_utc, lat, lon, ctx=DEFAULT_CONTEXT):
+    chart = compute_chart_record(dt_utc, lat, lon, ctx)
+    return chart.to_dict() if chart is not None else None
+
+# ✅ Short Planet Labels
+PLANETS = {
+    swe.SUN: 'Sun',
+    swe.MOON: 'Mon',
+    swe.MERCURY: 'Mer',
+    swe.VENUS: 'Ven',
+    swe.MARS: 'Mar',
+    swe.JUPITER: 'Jup',
+    swe.SATURN: 'Sat',
+    swe.MEAN_NODE: 'Rah'
+}
+
+# ✅ Compact chart (logic.chart.Chart) with exact absolute longitudes
+def compute_chart_record(dt_utc, lat, lon, ctx=DEFAULT_CONTEXT):
     try:
-        swe.set_ephe_path('./data')
-        swe.set_sid_mode(swe.SIDM_LAHIRI)
-
         jd = swe.julday(dt_utc.year, dt_utc.month, dt_utc.day,
                         dt_utc.hour + dt_utc.minute / 60 + dt_utc.second / 3600)
 
-        # 🧭 Ascendant
-        cusps, ascmc = swe.houses_ex(jd, lat, lon, b'P', swe.FLG_SIDEREAL)
-        asc_deg = ascmc[swe.ASC]
-        asc_data = degree_to_details(asc_deg)
-
-        # ✅ Short Planet Labels
-        planets = {
-            swe.SUN: 'Sun',
-            swe.MOON: 'Mon',
-            swe.MERCURY: 'Mer',
-            swe.VENUS: 'Ven',
-            swe.MARS: 'Mar',
-            swe.JUPITER: 'Jup',
-            swe.SATURN: 'Sat',
-            swe.MEAN_NODE: 'Rah'
-        }
-
-        planet_data = {}
-        planets_raw = {}
-        rahu_deg = 0
-
-        for code, shortname in planets.items():
-            pos, _ = swe.calc(jd, code, swe.FLG_SIDEREAL)
-            planet_data[shortname] = degree_to_details(pos[0])
-            planets_raw[shortname] = pos[0]
-            if shortname == 'Rah':
-                rahu_deg = pos[0]
-
-        # 🌓 Ketu = 180° opposite of Rahu
-        ketu_deg = (rahu_deg + 180) % 360
-        planet_data['Ket'] = degree_to_details(ketu_deg)
-        planets_raw['Ket'] = ketu_deg
+        longitudes = array('d', [math.nan]) * len(LONGITUDE_KEYS)
 
-        planets_raw['Ascendant'] = asc_deg
+        for code, shortname in PLANETS.items():
+            pos, _ = ctx.calc(jd, code)
+            longitudes[SLOT[shortname]] = pos[0]
 
-        # # ✅ Add Ascendant
-        # planet_data['Asc'] = asc_data
+        # 🌓 Ketu = 180° opposite of Rahu
+        longitudes[SLOT['Ket']] = (longitudes[SLOT['Rah']] + 180) % 360
 
-        # ✅ Gulika & Mandi
-        weekday_num = (dt_utc.weekday() + 1) % 7  # Sunday = 0
-        gulman = get_gulika_mandi(jd, lat, lon, weekday_num)
+        # 🧭 Ascendant
+        cusps, ascmc = ctx.houses(jd, lat, lon)
+        longitudes[SLOT['Ascendant']] = ascmc[swe.ASC]
 
-        for key in gulman:
-            planet_data[key] = gulman[key]
-            planets_raw[key] = gulman[key]['degree'] + ZODIAC_SIGNS.index(gulman[key]['zodiac']) * 30
+        # ✅ Gulika & Mandi (day or night portions of the Vedic weekday)
+        upagrahas = time_upagrahas(jd, lat, lon, ctx)
+        if upagrahas:
+            longitudes[SLOT['Gul']], longitudes[SLOT['Man']] = upagrahas['Gulika'], upagrahas['Mandi']
 
-        return {
-            'timestamp': dt_utc.strftime("%Y-%m-%d %I:%M %p UTC"),
-            'ascendant': asc_data,
-            'planets': planet_data,
-            'planets_raw': planets_raw
-        }
+        return Chart(dt_utc, lat, lon, longitudes)
 
     except Exception as e:
         print(f"[ERROR] Chart calculation failed: {e}")
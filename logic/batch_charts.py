@@ -0,0 +1,102 @@
+# logic/batch_charts.py
+import itertools
+import math
+import multiprocessing
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from logic.astroniharEng import configure_ephemeris, compute_chart, compute_chart_record
+
+DEFAULT_CHUNKSIZE = 64
+# For pools started from a GUI worker thread: a forked child would inherit
+# whatever locks the parent's other threads hold at that instant
+SPAWN_CONTEXT = multiprocessing.get_context("spawn")
+
+
+def _init_worker():
+    # Each worker sets the Swiss Ephemeris globals once, not once per chart
+    configure_ephemeris()
+
+
+def _chunked(iterable, size):
+    it = iter(iterable)
+    while True:
+        chunk = list(itertools.islice(it, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def imap_ordered(fn, items, workers=None, chunksize=DEFAULT_CHUNKSIZE, max_pending=None,
+                 initializer=None, mp_context=None):
+    """
+    Lazily map `fn` over `items` in a process pool, yielding results in input
+    order. At most `max_pending` chunks (default 2 per worker) are in flight,
+    so memory stays bounded for arbitrarily long inputs. With one worker
+    everything runs in this process. `mp_context` picks the start method
+    (SPAWN_CONTEXT when called off the main thread).
+    """
+    workers = workers or os.cpu_count() or 1
+    max_pending = max_pending or workers * 2
+
+    if workers == 1:
+        if initializer:
+            initializer()
+        for item in items:
+            yield fn(item)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=initializer, mp_context=mp_context) as pool:
+        pending = deque()
+        try:
+            for chunk in _chunked(items, chunksize):
+                pending.append(pool.submit(_map_chunk, fn, chunk))
+                if len(pending) >= max_pending:
+                    yield from pending.popleft().result()
+            while pending:
+                yield from pending.popleft().result()
+        finally:
+            # Generator closed early: drop work that has not started yet
+            for future in pending:
+                future.cancel()
+
+
+def _map_chunk(fn, chunk):
+    return [fn(item) for item in chunk]
+
+
+def _compute_birth(birth):
+    # (dt_utc, lat, lon) or (dt_utc, lat, lon, EphemerisContext)
+    return compute_chart(*birth)
+
+
+def _compute_record(birth):
+    return compute_chart_record(*birth)
+
+
+def iter_charts(births, workers=None, chunksize=DEFAULT_CHUNKSIZE, max_pending=None, compact=False,
+                mp_context=None):
+    """
+    Stream charts for an iterable of (dt_utc, lat, lon) tuples, in input order
+    (a fourth item, a logic.ephemeris.EphemerisContext, overrides the default).
+    Each result is exactly what `calculate_chart` returns for the same birth,
+    or a logic.chart.Chart when `compact` (a fraction of the memory and IPC size).
+    """
+    return imap_ordered(_compute_record if compact else _compute_birth, births, workers=workers,
+                        chunksize=chunksize, max_pending=max_pending, initializer=_init_worker,
+                        mp_context=mp_context)
+
+
+def calculate_charts(births, workers=None, chunksize=None, compact=False, mp_context=None):
+    """
+    Compute charts for a list of (dt_utc, lat, lon) tuples across a process pool.
+    Returns a list in input order; failed charts are None, as with calculate_chart.
+    With `compact`, results are Chart records (see logic.chart.stack_longitudes).
+    """
+    births = list(births)
+    workers = workers or os.cpu_count() or 1
+    if chunksize is None:
+        # ~4 chunks per worker keeps the pool balanced without tiny IPC messages
+        chunksize = max(1, min(DEFAULT_CHUNKSIZE, math.ceil(len(births) / (workers * 4))))
+    return list(iter_charts(births, workers=workers, chunksize=chunksize, compact=compact, mp_context=mp_context))
@@ -0,0 +1,117 @@
+# logic/chakras/varga_engine.py
+# Table-driven divisional charts: every varga is a (sign, part) -> sign lookup,
+# so placements for any array of longitudes come from one fancy-indexing pass.
+import numpy as np
+
+# Shodasavarga plus D6
+VARGA_DIVISIONS = (1, 2, 3, 4, 6, 7, 9, 10, 12, 16, 20, 24, 27, 30, 40, 45, 60)
+
+# D30 (Parashara): unequal portions, ruled by Mars, Saturn, Jupiter, Mercury, Venus
+# odd signs  0-5 Ari, 5-10 Aqu, 10-18 Sag, 18-25 Gem, 25-30 Lib
+# even signs 0-5 Tau, 5-12 Vir, 12-20 Pis, 20-25 Cap, 25-30 Sco
+_D30_ODD = [(5, 0), (10, 10), (18, 8), (25, 2), (30, 6)]
+_D30_EVEN = [(5, 1), (12, 5), (20, 11), (25, 9), (30, 7)]
+
+
+def _is_odd(sign):
+    # Sign indices are 0-based, so Aries (0) is the first, odd sign
+    return sign % 2 == 0
+
+
+def _start_sign(n, sign):
+    """First sign of the cycle used by an equal-part varga."""
+    if n in (1, 12, 60):
+        return sign
+    if n == 9:
+        return (sign, sign + 8, sign + 4)[sign % 3]   # movable, fixed, dual
+    if n in (16, 45):
+        return (0, 4, 8)[sign % 3]                      # Ari, Leo, Sag
+    if n == 20:
+        return (0, 8, 4)[sign % 3]                      # Ari, Sag, Leo
+    if n == 27:
+        return (0, 3, 6, 9)[sign % 4]                   # fire, earth, air, water
+    if n == 7:
+        return sign if _is_odd(sign) else sign + 6
+    if n == 10:
+        return sign if _is_odd(sign) else sign + 8
+    if n == 24:
+        return 4 if _is_odd(sign) else 3                # Leo / Can
+    if n in (6, 40):
+        return 0 if _is_odd(sign) else 6                # Ari / Lib
+    raise ValueError(f"No start rule for D{n}")
+
+
+def _varga_table(n):
+    table = np.empty((12, n), dtype=np.int8)
+    for sign in range(12):
+        if n == 2:
+            # Hora: odd signs Leo then Cancer, even signs Cancer then Leo
+            table[sign] = (4, 3) if _is_odd(sign) else (3, 4)
+        elif n == 3:
+            table[sign] = [(sign + 4 * k) % 12 for k in range(3)]
+        elif n == 4:
+            table[sign] = [(sign + 3 * k) % 12 for k in range(4)]
+        elif n == 30:
+            # One part per degree; D30 boundaries all fall on whole degrees
+            bounds = _D30_ODD if _is_odd(sign) else _D30_EVEN
+            table[sign] = [next(s for end, s in bounds if deg < end) for deg in range(30)]
+        else:
+            table[sign] = (_start_sign(n, sign) + np.arange(n)) % 12
+    return table
+
+
+VARGA_TABLES = {n: _varga_table(n) for n in VARGA_DIVISIONS}
+
+# All tables stacked into one (varga, sign, part) array, padded to the widest varga
+_DIVISIONS = np.array(VARGA_DIVISIONS, dtype=np.intp)
+_STACKED = np.zeros((len(VARGA_DIVISIONS), 12, _DIVISIONS.max()), dtype=np.int8)
+for _i, _n in enumerate(VARGA_DIVISIONS):
+    _STACKED[_i, :, :_n] = VARGA_TABLES[_n]
+_STACKED.setflags(write=False)
+
+
+def _varga_positions(vargas):
+    try:
+        return np.array([VARGA_DIVISIONS.index(int(n)) for n in vargas], dtype=np.intp)
+    except ValueError:
+        raise ValueError(f"Unsupported varga in {list(vargas)}; known: {VARGA_DIVISIONS}")
+
+
+def varga_signs(longitudes, vargas=VARGA_DIVISIONS):
+    """
+    Sign index (0 = Ari) of every longitude in every requested varga.
+
+    `longitudes` are absolute sidereal degrees of any shape, e.g. (bodies,) for
+    one chart or (charts, bodies) for a cohort. The result has shape
+    (len(vargas),) + longitudes.shape and dtype int8.
+    """
+    lon = np.mod(np.asarray(longitudes, dtype=np.float64), 360.0)
+    sign = np.minimum((lon // 30.0).astype(np.intp), 11)
+    deg = lon - sign * 30.0
+
+    shape = (-1,) + (1,) * lon.ndim
+    pos = _varga_positions(vargas).reshape(shape)
+    parts = _DIVISIONS[pos]
+    part = np.minimum((deg * parts / 30.0).astype(np.intp), parts - 1)
+    return _STACKED[pos, sign, part]
+
+
+def varga_houses(signs, asc_signs):
+    """1-based house of each sign counted from the ascendant's sign."""
+    return (np.asarray(signs, dtype=np.intp) - np.asarray(asc_signs, dtype=np.intp)) % 12 + 1
+
+
+def varga_boundaries(vargas=VARGA_DIVISIONS):
+    """
+    Longitudes in [0, 360) where the sign of at least one requested varga
+    changes, with the signs just below and just above each: (bounds,
+    below, above), the latter two of shape (len(vargas), len(bounds)).
+    Equal vargas can change at every part edge, D30 at whole degrees.
+    """
+    edges = np.unique(np.concatenate([
+        np.arange(360.0) if n == 30 else np.arange(12 * n) * (30.0 / n) for n in vargas]).round(9))
+    # Parts are at least 0.5° wide, so a nudge of 1e-6° stays inside the neighbouring part
+    below = varga_signs(edges - 1e-6, vargas)
+    above = varga_signs(edges + 1e-6, vargas)
+    changes = (below != above).any(axis=0)
+    return edges[changes], below[:, changes], above[:, changes]
@@ -1,5 +1,7 @@
 import math
 
+from logic.chakras.varga_engine import VARGA_DIVISIONS, varga_signs
+
 ZODIAC_SIGNS = [
     "Ari", "Tau", "Gem", "Can", "Leo", "Vir",
     "Lib", "Sco", "Sag", "Cap", "Aqu", "Pis"
@@ -9,9 +11,15 @@ PLANET_SHORT = {
     "Sun": "Su", "Moon": "Mo", "Mars": "Ma", "Mercury": "Me",
     "Jupiter": "Ju", "Venus": "Ve", "Saturn": "Sa",
     "Rahu": "Ra", "Ketu": "Ke", "Ascendant": "As",
-    "Gulika": "Gu", "Mandi": "Mn"
+    "Gulika": "Gu", "Mandi": "Mn",
+    # Keys used by astroniharEng
+    "Mon": "Mo", "Mar": "Ma", "Mer": "Me", "Jup": "Ju", "Ven": "Ve",
+    "Sat": "Sa", "Rah": "Ra", "Ket": "Ke", "Gul": "Gu", "Man": "Mn"
 }
 
+# Vargas shown on the "Many Vargas" tab
+DISPLAY_VARGAS = VARGA_DIVISIONS
+
 
 def to_float(value):
     try:
@@ -39,204 +47,113 @@ def rotate_chart(mapping, asc_house):
     return rotated
 
 
-def get_d1_chart(astro_data):
-    def zodiac_index(z): return ZODIAC_SIGNS.index(z[:3])
-    asc_index = zodiac_index(astro_data['ascendant']['zodiac'])
-
-    chart = {i: {"zodiac": "", "planets": []} for i in range(1, 13)}
-    for i in range(12):
-        chart[i + 1]["zodiac"] = ZODIAC_SIGNS[(asc_index + i) % 12] + f" ({(asc_index + i) % 12 + 1})"
-    for planet, pdata in astro_data["planets"].items():
-        house = ((zodiac_index(pdata["zodiac"]) - asc_index + 12) % 12) + 1
-        chart[house]["planets"].append(PLANET_SHORT.get(planet, planet[:2]))
-    chart[1]["planets"].insert(0, "As")
-    return chart
-
-
-def generic_chart(planets_raw, asc_deg, transform_fn):
-    chart = {}
-    for planet, abs_deg in planets_raw.items():
-        chart[planet] = transform_fn(to_float(abs_deg))
-    chart['Ascendant'] = transform_fn(to_float(asc_deg))
-    asc_sign_index = chart['Ascendant'] - 1
-    return rotate_chart(chart, asc_sign_index)
-
-
-# 🔢 Individual Divisional Charts
-
-def get_d3_chart(astro_data):
-    def zodiac_index(z): return ZODIAC_SIGNS.index(z[:3])
-
-    def drekkana_zodiac(sign, deg):
-        if deg < 10:
-            return sign
-        elif deg < 20:
-            return (sign + 4) % 12
-        else:
-            return (sign + 8) % 12
-
-    asc_sign = zodiac_index(astro_data['ascendant']['zodiac'])
-    asc_deg = to_float(astro_data['ascendant']['degree'])
-    asc_drekkana = drekkana_zodiac(asc_sign, asc_deg)
-
+def chart_from_signs(bodies, signs, asc_sign):
+    """12-house dict (house -> zodiac label, planet labels) from varga sign indices."""
+    asc_sign = int(asc_sign)
     chart = {i: {"zodiac": "", "planets": []} for i in range(1, 13)}
     for i in range(12):
-        sign_num = (asc_drekkana + i) % 12
+        sign_num = (asc_sign + i) % 12
         chart[i + 1]["zodiac"] = ZODIAC_SIGNS[sign_num] + f" ({sign_num + 1})"
-
-    for planet, pdata in astro_data["planets"].items():
-        if planet == "Ascendant":
-            continue
-        sign = zodiac_index(pdata["zodiac"])
-        deg = to_float(pdata["degree"])
-        drekkana_sign = drekkana_zodiac(sign, deg)
-        house = ((drekkana_sign - asc_drekkana + 12) % 12) + 1
-        chart[house]["planets"].append(PLANET_SHORT.get(planet, planet[:2]))
-
+    for body, sign in zip(bodies, signs):
+        house = (int(sign) - asc_sign) % 12 + 1
+        chart[house]["planets"].append(PLANET_SHORT.get(body, body[:2]))
     chart[1]["planets"].insert(0, "As")
     return chart
 
 
+def get_varga_charts(planets_raw, vargas=DISPLAY_VARGAS):
+    """
+    All requested divisional charts from absolute longitudes in one engine pass.
+    `planets_raw` is calculate_chart's body -> absolute degree map (with 'Ascendant').
+    Returns {"D9": chart, ...}.
+    """
+    bodies = [body for body in planets_raw if body != "Ascendant"]
+    lons = [to_float(planets_raw[body]) for body in bodies]
+    lons.append(to_float(planets_raw["Ascendant"]))
+    signs = varga_signs(lons, vargas)
+    return {
+        f"D{n}": chart_from_signs(bodies, row[:-1], row[-1])
+        for n, row in zip(vargas, signs)
+    }
 
 
-def get_d6_chart(astro_data):
-    def zodiac_index(z): return ZODIAC_SIGNS.index(z[:3])
-    asc_deg = to_float(astro_data["ascendant"]["degree"])
-    asc_sign, asc_d = get_sign_and_degree(asc_deg)
-
-    # Ascendant transformation
-    asc_shashtiamsa = int(asc_d * 2)
-    asc_d6_sign = (asc_sign + asc_shashtiamsa) if asc_sign % 2 == 0 else (asc_sign + (59 - asc_shashtiamsa))
-    asc_index = asc_d6_sign % 12
-
-    chart = {i: {"zodiac": "", "planets": []} for i in range(1, 13)}
-    for i in range(12):
-        chart[i + 1]["zodiac"] = ZODIAC_SIGNS[(asc_index + i) % 12] + f" ({(asc_index + i) % 12 + 1})"
+def _astro_longitudes(astro_data):
+    # Exact absolute longitudes when the chart carries them (calculate_chart, Chart)
+    if "planets_raw" in astro_data:
+        return astro_data["planets_raw"]
 
-    for planet, pdata in astro_data["planets"].items():
-        abs_deg = to_float(pdata["degree"])
-        sign, deg = get_sign_and_degree(abs_deg)
-        shashtiamsa = int(deg * 2)
-        d6_sign = (sign + shashtiamsa) if sign % 2 == 0 else (sign + (59 - shashtiamsa))
-        house = ((d6_sign % 12 - asc_index + 12) % 12) + 1
-        chart[house]["planets"].append(PLANET_SHORT.get(planet, planet[:2]))
+    # Otherwise rebuild them from the label/degree form
+    def absolute(pdata):
+        return ZODIAC_SIGNS.index(pdata["zodiac"][:3]) * 30 + to_float(pdata["degree"])
 
-    chart[1]["planets"].insert(0, "As")
-    return chart
+    raw = {planet: absolute(pdata) for planet, pdata in astro_data["planets"].items()}
+    raw["Ascendant"] = absolute(astro_data["ascendant"])
+    return raw
 
 
+def _single_varga(planets_raw, n):
+    return get_varga_charts(planets_raw, (n,))[f"D{n}"]
 
-def get_d9_chart(astro_data):
-    def zodiac_index(z): return ZODIAC_SIGNS.index(z[:3])
 
-    RASHI_TYPE = {
-        0: "Movable", 1: "Fixed", 2: "Dual",
-        3: "Movable", 4: "Fixed", 5: "Dual",
-        6: "Movable", 7: "Fixed", 8: "Dual",
-        9: "Movable", 10: "Fixed", 11: "Dual"
-    }
+def _raw_with_asc(planets_raw, asc_deg):
+    raw = dict(planets_raw)
+    raw["Ascendant"] = asc_deg
+    return raw
 
-    def get_navamsa_sign(sign, deg):
-        navamsa_part = int(deg // 3.3333)
-        rtype = RASHI_TYPE[sign]
-        if rtype == "Movable":
-            start = sign
-        elif rtype == "Fixed":
-            start = (sign + 8) % 12  # 9th from sign
-        elif rtype == "Dual":
-            start = (sign + 4) % 12  # 5th from sign
-        else:
-            start = sign
-        return (start + navamsa_part) % 12
-
-    asc_deg = to_float(astro_data["ascendant"]["degree"])
-    asc_sign, asc_degree = get_sign_and_degree(asc_deg)
-    d9_asc_sign = get_navamsa_sign(asc_sign, asc_degree)
-
-    # ✅ Build Chart like D1
-    chart = {i: {"zodiac": "", "planets": []} for i in range(1, 13)}
-    for i in range(12):
-        chart[i + 1]["zodiac"] = ZODIAC_SIGNS[(d9_asc_sign + i) % 12] + f" ({(d9_asc_sign + i) % 12 + 1})"
 
-    for planet, pdata in astro_data["planets"].items():
-        abs_deg = to_float(pdata["degree"])
-        sign, deg = get_sign_and_degree(abs_deg)
-        d9_sign = get_navamsa_sign(sign, deg)
-        house = ((d9_sign - d9_asc_sign + 12) % 12) + 1
-        chart[house]["planets"].append(PLANET_SHORT.get(planet, planet[:2]))
+# 🔢 Individual Divisional Charts (thin wrappers over the varga engine)
 
-    chart[1]["planets"].insert(0, "As")
-    return chart
+def get_d1_chart(astro_data):
+    return _single_varga(_astro_longitudes(astro_data), 1)
 
 
+def get_d3_chart(astro_data):
+    return _single_varga(_astro_longitudes(astro_data), 3)
 
 
+def get_d6_chart(astro_data):
+    return _single_varga(_astro_longitudes(astro_data), 6)
 
 
+def get_d9_chart(astro_data):
+    return _single_varga(_astro_longitudes(astro_data), 9)
 
 
 def get_d10_chart(planets_raw, asc_deg):
-    def transform(abs_deg):
-        sign, deg = get_sign_and_degree(abs_deg)
-        return (sign * 10 + int(deg // 3)) % 12
-    return generic_chart(planets_raw, asc_deg, transform)
+    return _single_varga(_raw_with_asc(planets_raw, asc_deg), 10)
 
 
 def get_d12_chart(planets_raw, asc_deg):
-    def transform(abs_deg):
-        sign, deg = get_sign_and_degree(abs_deg)
-        return (sign + int(deg * 12 / 30)) % 12
-    return generic_chart(planets_raw, asc_deg, transform)
+    return _single_varga(_raw_with_asc(planets_raw, asc_deg), 12)
 
 
 def get_d16_chart(planets_raw, asc_deg):
-    def transform(abs_deg):
-        sign, deg = get_sign_and_degree(abs_deg)
-        return (sign * 16 + int(deg * 16 / 30)) % 12
-    return generic_chart(planets_raw, asc_deg, transform)
+    return _single_varga(_raw_with_asc(planets_raw, asc_deg), 16)
 
 
 def get_d20_chart(planets_raw, asc_deg):
-    def transform(abs_deg):
-        sign, deg = get_sign_and_degree(abs_deg)
-        return (sign * 20 + int(deg * 20 / 30)) % 12
-    return generic_chart(planets_raw, asc_deg, transform)
+    return _single_varga(_raw_with_asc(planets_raw, asc_deg), 20)
+
+
+def get_d24_chart(planets_raw, asc_deg):
+    return _single_varga(_raw_with_asc(planets_raw, asc_deg), 24)
 
 
-# def get_d24_chart(planets_raw, asc_deg):
-#     def transform(abs_deg):
-#         sign, deg = get_sign_and_degree(abs_deg)
-#         return (sign * 24 + int(deg * 24 / 30)) % 12
-#     return generic_chart(planets_raw, asc_deg, transform)
+def get_d27_chart(planets_raw, asc_deg):
+    return _single_varga(_raw_with_asc(planets_raw, asc_deg), 27)
 
 
 def get_d30_chart(planets_raw, asc_deg):
-    def transform(abs_deg):
-        sign, deg = get_sign_and_degree(abs_deg)
-        if sign % 2 == 0:
-            return [0, 1, 2, 3, 4][[deg <= 5, deg <= 8, deg <= 16, deg <= 23, deg <= 30].index(True)]
-        else:
-            return [5, 6, 7, 8, 9][[deg <= 5, deg <= 7, deg <= 15, deg <= 22, deg <= 30].index(True)]
-    return generic_chart(planets_raw, asc_deg, transform)
+    return _single_varga(_raw_with_asc(planets_raw, asc_deg), 30)
 
 
 def get_d40_chart(planets_raw, asc_deg):
-    def transform(abs_deg):
-        sign, deg = get_sign_and_degree(abs_deg)
-        return (sign * 40 + int(deg * 40 / 30)) % 12
-    return generic_chart(planets_raw, asc_deg, transform)
+    return _single_varga(_raw_with_asc(planets_raw, asc_deg), 40)
 
 
 def get_d45_chart(planets_raw, asc_deg):
-    def transform(abs_deg):
-        sign, deg = get_sign_and_degree(abs_deg)
-        return (sign * 45 + int(deg * 45 / 30)) % 12
-    return generic_chart(planets_raw, asc_deg, transform)
+    return _single_varga(_raw_with_asc(planets_raw, asc_deg), 45)
 
 
 def get_d60_chart(planets_raw, asc_deg):
-    def transform(abs_deg):
-        sign, deg = get_sign_and_degree(abs_deg)
-        d60_index = int(deg * 2)
-        return (sign + ((d60_index % 12 + 1) % 12)) % 12
-    return generic_chart(planets_raw, asc_deg, transform)
+    return _single_varga(_raw_with_asc(planets_raw, asc_deg), 60)
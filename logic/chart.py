@@ -0,0 +1,152 @@
+# logic/chart.py
+# Compact chart record: absolute sidereal longitudes in one float64 array.
+# Sign / nakshatra / pada are integer indices derived on demand and the
+# string labels only when the dict view (calculate_chart's format) is built.
+import math
+from array import array
+from collections.abc import Mapping
+
+ZODIAC_SIGNS = [
+    'Ari', 'Tau', 'Gem', 'Can', 'Leo', 'Vir',
+    'Lib', 'Sco', 'Sag', 'Cap', 'Aqu', 'Pis'
+]
+
+NAKSHATRAS = [
+    "Ash", "Bha", "Kri", "Roh", "Mri", "Ard", "Pun",
+    "Pus", "Ashl", "Mag", "PPh", "UPh", "Has",
+    "Chi", "Swa", "Vis", "Anu", "Jye", "Mul", "PAs",
+    "UAs", "Shr", "Dha", "Sha", "PBh", "UBh", "Rev"
+]
+
+NAKSHATRA_SPAN = 360 / 27
+PADA_SPAN = NAKSHATRA_SPAN / 4
+
+# Slot order matches calculate_chart's planets_raw key order
+LONGITUDE_KEYS = ('Sun', 'Mon', 'Mer', 'Ven', 'Mar', 'Jup', 'Sat', 'Rah', 'Ket', 'Ascendant', 'Gul', 'Man')
+SLOT = {key: i for i, key in enumerate(LONGITUDE_KEYS)}
+ASC = SLOT['Ascendant']
+DICT_KEYS = ('timestamp', 'ascendant', 'planets', 'planets_raw')
+
+
+def sign_index(deg):
+    return int(deg // 30) % 12
+
+
+def nakshatra_index(deg):
+    return int((deg % 360) // NAKSHATRA_SPAN)
+
+
+def pada_number(deg):
+    """Pada 1-4 within the nakshatra."""
+    return int((deg % NAKSHATRA_SPAN) // PADA_SPAN) + 1
+
+
+def degree_to_details(deg):
+    return {
+        'degree': round(deg % 30, 5),
+        'zodiac': ZODIAC_SIGNS[sign_index(deg)],
+        'nakshatra': NAKSHATRAS[nakshatra_index(deg)],
+        'pada': pada_number(deg)
+    }
+
+
+class Chart(Mapping):
+    """
+    One computed chart. Acts as a read-only mapping with the same keys as the
+    dict returned by calculate_chart ('timestamp', 'ascendant', 'planets',
+    'planets_raw'); each lookup builds that part fresh, so use to_dict() when
+    the whole structure is needed repeatedly. Bodies that could not be
+    computed (Gulika/Mandi at polar latitudes) are NaN and left out.
+    """
+
+    __slots__ = ('dt_utc', 'lat', 'lon', 'longitudes')
+
+    def __init__(self, dt_utc, lat, lon, longitudes):
+        self.dt_utc = dt_utc
+        self.lat = lat
+        self.lon = lon
+        self.longitudes = longitudes if isinstance(longitudes, array) else array('d', longitudes)
+
+    def __getstate__(self):
+        return self.dt_utc, self.lat, self.lon, self.longitudes.tobytes()
+
+    def __setstate__(self, state):
+        self.dt_utc, self.lat, self.lon, raw = state
+        self.longitudes = array('d')
+        self.longitudes.frombytes(raw)
+
+    def __repr__(self):
+        return f"Chart({self.timestamp!r}, lat={self.lat}, lon={self.lon})"
+
+    def __eq__(self, other):
+        if isinstance(other, Chart):
+            return (self.dt_utc, self.lat, self.lon) == (other.dt_utc, other.lat, other.lon) and \
+                self.longitudes.tobytes() == other.longitudes.tobytes()
+        return Mapping.__eq__(self, other)
+
+    __hash__ = None
+
+    # 🔢 Raw access
+
+    def longitude(self, key):
+        return self.longitudes[SLOT[key]]
+
+    def has(self, key):
+        return not math.isnan(self.longitudes[SLOT[key]])
+
+    def bodies(self):
+        """Keys with a computed longitude, in planets_raw order."""
+        return [key for key, deg in zip(LONGITUDE_KEYS, self.longitudes) if not math.isnan(deg)]
+
+    @property
+    def timestamp(self):
+        return self.dt_utc.strftime("%Y-%m-%d %I:%M %p UTC")
+
+    def sign_indices(self):
+        return {key: sign_index(self.longitudes[SLOT[key]]) for key in self.bodies()}
+
+    def nakshatra_indices(self):
+        return {key: nakshatra_index(self.longitudes[SLOT[key]]) for key in self.bodies()}
+
+    def padas(self):
+        return {key: pada_number(self.longitudes[SLOT[key]]) for key in self.bodies()}
+
+    # 📖 Dict-compatible view
+
+    @property
+    def planets_raw(self):
+        return {key: self.longitudes[SLOT[key]] for key in self.bodies()}
+
+    @property
+    def planets(self):
+        return {key: degree_to_details(self.longitudes[SLOT[key]]) for key in self.bodies() if key != 'Ascendant'}
+
+    @property
+    def ascendant(self):
+        return degree_to_details(self.longitudes[ASC])
+
+    def __getitem__(self, key):
+        if key not in DICT_KEYS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __iter__(self):
+        return iter(DICT_KEYS)
+
+    def __len__(self):
+        return len(DICT_KEYS)
+
+    def to_dict(self):
+        """The nested dict format of calculate_chart."""
+        return {key: getattr(self, key) for key in DICT_KEYS}
+
+
+def stack_longitudes(charts):
+    """(N, 12) float64 matrix of absolute longitudes in LONGITUDE_KEYS order; NaN rows for None."""
+    import numpy as np
+
+    out = np.full((len(charts), len(LONGITUDE_KEYS)), np.nan)
+    for i, chart in enumerate(charts):
+        if chart is not None:
+            out[i] = np.frombuffer(chart.longitudes, dtype=np.float64)
+    return out
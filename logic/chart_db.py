@@ -0,0 +1,304 @@
+# logic/chart_db.py
+# Client birth data in one SQLite file instead of one .rhd per person.
+#
+# Names are searched by prefix: triggers keep a name_keys table with a
+# lowercase "first last" and "last first" key per client, so typing either
+# part of a name is one ordered index range scan (a client matching on both
+# keys is listed under both). Result pages use keyset pagination (pass the
+# last row of a page as `after`), so page N costs the same as page 1.
+#
+#   ROGAHORA_CHART_DB=/path/charts.sqlite3   location (default ~/.rogahora/charts.sqlite3)
+import datetime
+import os
+import sqlite3
+import threading
+import time
+
+from logic.rhd_file import RHD_FIELDS, iter_rhd_paths, load_rhd, save_rhd
+
+ENV_PATH = "ROGAHORA_CHART_DB"
+DEFAULT_PATH = os.path.join(os.path.expanduser("~"), ".rogahora", "charts.sqlite3")
+DEFAULT_PAGE_SIZE = 100
+BUSY_TIMEOUT_MS = 5000
+
+COLUMNS = ["id"] + RHD_FIELDS + ["lat", "lon", "birth_date"]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS clients (
+    id          INTEGER PRIMARY KEY,
+    first_name  TEXT NOT NULL,
+    last_name   TEXT NOT NULL,
+    date        TEXT NOT NULL,      -- dd-mm-yyyy, as in .rhd files
+    time        TEXT NOT NULL,      -- hh:mm (12 hour)
+    ampm        TEXT NOT NULL,
+    state       TEXT NOT NULL,
+    city        TEXT NOT NULL,
+    lat         REAL,
+    lon         REAL,
+    birth_date  TEXT NOT NULL,      -- yyyy-mm-dd, sortable
+    name_key    TEXT NOT NULL,      -- "first last", lowercase
+    last_key    TEXT NOT NULL,      -- "last first", lowercase
+    city_key    TEXT NOT NULL,      -- lowercase
+    updated     REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS clients_name ON clients(name_key, id);
+CREATE INDEX IF NOT EXISTS clients_birth_date ON clients(birth_date);
+CREATE INDEX IF NOT EXISTS clients_city ON clients(city_key, name_key, id);
+CREATE UNIQUE INDEX IF NOT EXISTS clients_identity
+    ON clients(name_key, birth_date, time, ampm, state, city);
+
+CREATE TABLE IF NOT EXISTS name_keys (
+    key       TEXT NOT NULL,
+    client_id INTEGER NOT NULL,
+    PRIMARY KEY (key, client_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS name_keys_client ON name_keys(client_id);
+
+CREATE TRIGGER IF NOT EXISTS clients_keys_insert AFTER INSERT ON clients BEGIN
+    INSERT OR IGNORE INTO name_keys VALUES (new.name_key, new.id), (new.last_key, new.id);
+END;
+CREATE TRIGGER IF NOT EXISTS clients_keys_update AFTER UPDATE OF name_key, last_key ON clients BEGIN
+    DELETE FROM name_keys WHERE client_id = old.id;
+    INSERT OR IGNORE INTO name_keys VALUES (new.name_key, new.id), (new.last_key, new.id);
+END;
+CREATE TRIGGER IF NOT EXISTS clients_keys_delete AFTER DELETE ON clients BEGIN
+    DELETE FROM name_keys WHERE client_id = old.id;
+END;
+"""
+
+
+def _key(*parts):
+    return " ".join(" ".join(str(part).split()) for part in parts if part).lower()
+
+
+def _prefix_bounds(prefix):
+    # Every string starting with `prefix` sorts in [prefix, prefix + U+10FFFF)
+    return prefix, prefix + "\U0010ffff"
+
+
+def iso_birth_date(date_str):
+    """dd-mm-yyyy -> yyyy-mm-dd (raises ValueError)."""
+    return datetime.datetime.strptime(date_str.strip(), "%d-%m-%Y").strftime("%Y-%m-%d")
+
+
+class ChartDB:
+    def __init__(self, path=DEFAULT_PATH):
+        self.path = path
+        self._local = threading.local()
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._connect()
+
+    def _connect(self):
+        db = getattr(self._local, "db", None)
+        if db is None:
+            db = sqlite3.connect(self.path, timeout=BUSY_TIMEOUT_MS / 1000)
+            db.row_factory = sqlite3.Row
+            db.execute(f"PRAGMA busy_timeout = {BUSY_TIMEOUT_MS}")
+            db.execute("PRAGMA journal_mode = WAL")
+            db.executescript(_SCHEMA)
+            self._local.db = db
+        return db
+
+    def close(self):
+        db = getattr(self._local, "db", None)
+        if db is not None:
+            db.close()
+            self._local.db = None
+
+    # ✏️ Writing
+
+    def _row_values(self, data):
+        values = {field: str(data[field]).strip() for field in RHD_FIELDS}
+        values["lat"] = data.get("lat")
+        values["lon"] = data.get("lon")
+        values["birth_date"] = iso_birth_date(values["date"])
+        values["name_key"] = _key(values["first_name"], values["last_name"])
+        values["last_key"] = _key(values["last_name"], values["first_name"])
+        values["city_key"] = _key(values["city"])
+        values["updated"] = time.time()
+        return values
+
+    def _insert(self, db, data):
+        values = self._row_values(data)
+        names = ", ".join(values)
+        cursor = db.execute(
+            f"INSERT OR IGNORE INTO clients ({names}) VALUES ({', '.join('?' * len(values))})",
+            list(values.values()))
+        if cursor.rowcount:
+            return cursor.lastrowid, True
+        row = db.execute(
+            "SELECT id FROM clients WHERE name_key = ? AND birth_date = ? AND time = ? AND ampm = ? "
+            "AND state = ? AND city = ?",
+            (values["name_key"], values["birth_date"], values["time"], values["ampm"],
+             values["state"], values["city"])).fetchone()
+        return row["id"], False
+
+    def add(self, data):
+        """Store one birth record (RHD_FIELDS, optional lat/lon). Returns its id; duplicates return the existing id."""
+        db = self._connect()
+        with db:
+            record_id, _ = self._insert(db, data)
+        return record_id
+
+    def update(self, record_id, data):
+        values = self._row_values(data)
+        db = self._connect()
+        with db:
+            db.execute(f"UPDATE clients SET {', '.join(f'{name} = ?' for name in values)} WHERE id = ?",
+                       list(values.values()) + [record_id])
+
+    def delete(self, record_id):
+        db = self._connect()
+        with db:
+            db.execute("DELETE FROM clients WHERE id = ?", (record_id,))
+
+    def import_rhd(self, inputs, resolve=None, progress=None):
+        """
+        Import .rhd files, directories (recursive) and globs in one transaction.
+        `resolve(state, city)` may supply (lat, lon). Returns (added, duplicates, errors)
+        where errors is a list of (path, message).
+        """
+        added = duplicates = 0
+        errors = []
+        db = self._connect()
+        with db:
+            for n, path in enumerate(iter_rhd_paths(inputs), start=1):
+                try:
+                    data = load_rhd(path)
+                    if resolve is not None:
+                        data["lat"], data["lon"] = resolve(data["state"], data["city"])
+                    _, is_new = self._insert(db, data)
+                except Exception as e:
+                    errors.append((path, f"{type(e).__name__}: {e}"))
+                    continue
+                if is_new:
+                    added += 1
+                else:
+                    duplicates += 1
+                if progress is not None and n % 500 == 0:
+                    progress(n)
+        return added, duplicates, errors
+
+    # 📤 .rhd export
+
+    def export_rhd(self, record_id, path):
+        save_rhd(path, self.get(record_id))
+
+    def export_all(self, folder):
+        os.makedirs(folder, exist_ok=True)
+        count = 0
+        for row in self._connect().execute(f"SELECT {', '.join(COLUMNS)} FROM clients ORDER BY id"):
+            name = _key(row["first_name"], row["last_name"]).replace(" ", "_") or "client"
+            save_rhd(os.path.join(folder, f"{name}_{row['id']}.rhd"), dict(row))
+            count += 1
+        return count
+
+    # 🔍 Queries
+
+    def get(self, record_id):
+        row = self._connect().execute(f"SELECT {', '.join(COLUMNS)} FROM clients WHERE id = ?",
+                                      (record_id,)).fetchone()
+        return dict(row) if row else None
+
+    def iter_records(self, batch=1000):
+        """Every record in id order, fetched `batch` rows at a time."""
+        db = self._connect()
+        last_id = -1
+        while True:
+            rows = db.execute(f"SELECT {', '.join(COLUMNS)} FROM clients WHERE id > ? ORDER BY id LIMIT ?",
+                              (last_id, batch)).fetchall()
+            if not rows:
+                return
+            for row in rows:
+                yield dict(row)
+            last_id = rows[-1]["id"]
+
+    def total(self):
+        return self._connect().execute("SELECT COUNT(*) FROM clients").fetchone()[0]
+
+    def _filters(self, city=None, date_from=None, date_to=None):
+        clauses, params = [], []
+        if city:
+            clauses.append("c.city_key = ?")
+            params.append(_key(city))
+        if date_from:
+            clauses.append("c.birth_date >= ?")
+            params.append(date_from)
+        if date_to:
+            clauses.append("c.birth_date <= ?")
+            params.append(date_to)
+        return clauses, params
+
+    def search(self, text="", city=None, date_from=None, date_to=None, after=None, limit=DEFAULT_PAGE_SIZE):
+        """
+        One page of records ordered by name. `text` is a name prefix (first or
+        last name first); dates are yyyy-mm-dd bounds. Pass the last record of
+        the previous page as `after` for the next page.
+        """
+        clauses, params = self._filters(city, date_from, date_to)
+        columns = ", ".join(f"c.{column}" for column in COLUMNS)
+        prefix = _key(text)
+        if prefix:
+            sort = ("k.key", "k.client_id")
+            source = "name_keys k JOIN clients c ON c.id = k.client_id"
+            clauses.insert(0, "k.key >= ? AND k.key < ?")
+            params[:0] = _prefix_bounds(prefix)
+        else:
+            sort = ("c.name_key", "c.id")
+            source = "clients c"
+        if after is not None:
+            clauses.append(f"({sort[0]}, {sort[1]}) > (?, ?)")
+            params += [after["sort_key"], after["id"]]
+        where = (" WHERE " + " AND ".join(clauses)) if clauses else ""
+        sql = (f"SELECT {columns}, {sort[0]} AS sort_key FROM {source}{where} "
+               f"ORDER BY {sort[0]}, {sort[1]} LIMIT ?")
+        return [dict(row) for row in self._connect().execute(sql, params + [limit])]
+
+    def count(self, text="", city=None, date_from=None, date_to=None):
+        clauses, params = self._filters(city, date_from, date_to)
+        prefix = _key(text)
+        if prefix:
+            # Name-only counts never touch the clients table
+            source = "name_keys k JOIN clients c ON c.id = k.client_id" if clauses else "name_keys k"
+            clauses.insert(0, "k.key >= ? AND k.key < ?")
+            params[:0] = _prefix_bounds(prefix)
+        else:
+            source = "clients c"
+        where = (" WHERE " + " AND ".join(clauses)) if clauses else ""
+        return self._connect().execute(f"SELECT COUNT(*) FROM {source}{where}", params).fetchone()[0]
+
+
+_db = None
+_db_lock = threading.Lock()
+
+
+def get_chart_db():
+    """Process-wide chart database at ROGAHORA_CHART_DB (or the default path)."""
+    global _db
+    path = os.environ.get(ENV_PATH, "").strip() or DEFAULT_PATH
+    with _db_lock:
+        if _db is None or _db.path != path:
+            _db = ChartDB(path)
+        return _db
+
+
+if __name__ == "__main__":
+    # python -m logic.chart_db import clients/ "archive/**/*.rhd"
+    # python -m logic.chart_db export out_folder/
+    import sys
+
+    command, args = sys.argv[1], sys.argv[2:]
+    chart_db = get_chart_db()
+    if command == "import":
+        from logic.gazetteer import load_gazetteer
+
+        started = time.perf_counter()
+        added, duplicates, errors = chart_db.import_rhd(args, resolve=load_gazetteer().lookup)
+        for path, message in errors:
+            print(f"[ERROR] {path}: {message}", file=sys.stderr)
+        print(f"{added} added, {duplicates} already present, {len(errors)} failed "
+              f"in {time.perf_counter() - started:.1f}s ({chart_db.path})")
+    elif command == "export":
+        print(f"{chart_db.export_all(args[0])} records exported to {args[0]}")
+    else:
+        sys.exit(f"unknown command {command!r} (use import or export)")
@@ -0,0 +1,192 @@
+# logic/chart_variants.py
+# One birth under several ayanamsas and house systems from a single ephemeris pass.
+#
+# With FLG_SIDEREAL, Swiss Ephemeris computes the tropical position and
+# subtracts the true ayanamsa (mean ayanamsa + nutation in longitude), and
+# houses_ex does the same to every cusp except the sign-based systems
+# (W whole sign, N equal from 0° Aries), whose cusps follow the sidereal
+# ascendant's sign. So the planets (with speeds), one houses_ex per house
+# system and the Kaladi portion ascendants are computed tropically once;
+# each ayanamsa then costs a few swe.get_ayanamsa calls and array
+# subtractions. Results equal calculate_chart / EphemerisContext.houses
+# with the matching context to floating-point rounding.
+#
+#   python -m logic.chart_variants 17-05-1990 08:50 28.61 77.2 -a LAHIRI RAMAN TROPICAL -H P W
+import math
+from array import array
+from collections.abc import Mapping
+from functools import lru_cache
+
+import numpy as np
+import swisseph as swe
+
+from logic.astroniharEng import PLANETS
+from logic.chart import ASC, LONGITUDE_KEYS, SLOT, Chart
+from logic.ephemeris import EPHE_PATH, EphemerisContext
+from logic.upagrahas import tropical_time_upagrahas
+
+TROPICAL = "TROPICAL"
+DEFAULT_AYANAMSAS = ("LAHIRI", "RAMAN", "KRISHNAMURTI", TROPICAL)
+DEFAULT_HOUSE_SYSTEMS = ("P", "W")
+RATE_STEP_DAYS = 0.01   # central difference for the ayanamsa rate
+SIGN_CUSPS = np.arange(12) * 30.0
+
+
+@lru_cache(maxsize=None)
+def _context(ayanamsa, ephe_path):
+    return EphemerisContext(ayanamsa, ephe_path=ephe_path)
+
+
+class ChartVariants(Mapping):
+    """
+    Charts of one birth keyed by (ayanamsa, house system). Row k of the
+    stacked (K, 12) float64 arrays belongs to keys[k]:
+      longitudes - absolute longitudes in LONGITUDE_KEYS order (NaN if not computed)
+      speeds     - degrees/day (NaN for the ascendant, Gulika and Mandi, or all
+                   without with_speeds)
+      cusps      - the twelve house cusps
+    Looking a key up gives a logic.chart.Chart, as calculate_chart with that
+    context would (to_dict() for the nested dict format).
+    """
+
+    __slots__ = ('dt_utc', 'lat', 'lon', 'keys_', 'index', 'longitudes', 'speeds', 'cusps')
+
+    def __init__(self, dt_utc, lat, lon, keys, longitudes, speeds, cusps):
+        self.dt_utc = dt_utc
+        self.lat = lat
+        self.lon = lon
+        self.keys_ = list(keys)
+        self.index = {key: k for k, key in enumerate(self.keys_)}
+        self.longitudes = longitudes
+        self.speeds = speeds
+        self.cusps = cusps
+
+    def __repr__(self):
+        return f"ChartVariants({self.dt_utc:%Y-%m-%d %H:%M} UTC, lat={self.lat}, lon={self.lon}, {self.keys_})"
+
+    def __getitem__(self, key):
+        return Chart(self.dt_utc, self.lat, self.lon, array('d', self.longitudes[self.index[key]].tolist()))
+
+    def __iter__(self):
+        return iter(self.keys_)
+
+    def __len__(self):
+        return len(self.keys_)
+
+    def house_cusps(self, key):
+        return self.cusps[self.index[key]]
+
+    def speed(self, key, body):
+        return float(self.speeds[self.index[key], SLOT[body]])
+
+
+def chart_variants(dt_utc, lat, lon, ayanamsas=DEFAULT_AYANAMSAS, house_systems=DEFAULT_HOUSE_SYSTEMS,
+                   ephe_path=EPHE_PATH, with_speeds=True):
+    """
+    ChartVariants of a birth for every (ayanamsa, house system) pair, at
+    about the cost of one calculate_chart. Ayanamsas are swe.SIDM_* names
+    or "TROPICAL"; house systems are houses_ex letters (not 'G'). Speeds
+    make the planet pass about twice as slow; without them they are NaN.
+    """
+    ayanamsas = [name.upper() for name in ayanamsas]
+    contexts = [None if name == TROPICAL else _context(name, ephe_path) for name in ayanamsas]
+    if not ayanamsas or not house_systems:
+        raise ValueError("need at least one ayanamsa and one house system")
+    if "G" in house_systems:
+        raise ValueError("Gauquelin sectors (36 cusps) are not supported")
+    (next((c for c in contexts if c), None) or _context("LAHIRI", ephe_path)).activate()
+
+    jd = swe.julday(dt_utc.year, dt_utc.month, dt_utc.day,
+                    dt_utc.hour + dt_utc.minute / 60 + dt_utc.second / 3600)
+
+    # 🔭 Tropical pass, shared by every variant
+    tropical = [math.nan] * len(LONGITUDE_KEYS)
+    tropical_speed = [math.nan] * len(LONGITUDE_KEYS)
+    flags = swe.FLG_SPEED if with_speeds else 0
+    for code, shortname in PLANETS.items():
+        pos, _ = swe.calc(jd, code, flags)
+        tropical[SLOT[shortname]] = pos[0]
+        if with_speeds:
+            tropical_speed[SLOT[shortname]] = pos[3]
+    tropical[SLOT['Ket']] = (tropical[SLOT['Rah']] + 180) % 360
+    tropical_speed[SLOT['Ket']] = tropical_speed[SLOT['Rah']]
+
+    house_cusps = {}
+    for house_system in house_systems:
+        cusps, ascmc = swe.houses_ex(jd, lat, lon, house_system.encode(), 0)
+        house_cusps[house_system] = cusps[:12]
+    tropical[ASC] = ascmc[swe.ASC]
+
+    upagrahas = tropical_time_upagrahas(jd, lat, lon)
+    if upagrahas:
+        tropical[SLOT['Gul']] = upagrahas[0]['Gulika']
+        tropical[SLOT['Man']] = upagrahas[0]['Mandi']
+
+    # 🧮 True ayanamsa = mean ayanamsa (per system) + nutation in longitude (shared): at the
+    # planets' instant (ET), the houses' instant (UT) and the portion starts' sunrise, plus its rate
+    nutation = swe.calc(jd, swe.ECL_NUT)[0][2]
+    nutation_ut = swe.calc_ut(jd, swe.ECL_NUT)[0][2]
+    if with_speeds:
+        nutation_rate = (swe.calc(jd + RATE_STEP_DAYS, swe.ECL_NUT)[0][2]
+                         - swe.calc(jd - RATE_STEP_DAYS, swe.ECL_NUT)[0][2]) / (2 * RATE_STEP_DAYS)
+    sunrise = upagrahas[1] if upagrahas else None
+    nutation_sunrise = swe.calc_ut(sunrise, swe.ECL_NUT)[0][2] if upagrahas else 0.0
+
+    offsets, house_offsets, rates = [], [], []
+    for ctx in contexts:
+        if ctx is None:
+            offsets.append([0.0] * len(LONGITUDE_KEYS))
+            house_offsets.append(0.0)
+            rates.append(0.0)
+            continue
+        ctx.activate()
+        row = [swe.get_ayanamsa(jd) + nutation] * len(LONGITUDE_KEYS)
+        row[ASC] = swe.get_ayanamsa_ut(jd) + nutation_ut
+        if upagrahas:
+            row[SLOT['Gul']] = row[SLOT['Man']] = swe.get_ayanamsa_ut(sunrise) + nutation_sunrise
+        offsets.append(row)
+        house_offsets.append(row[ASC])
+        if with_speeds:
+            rates.append((swe.get_ayanamsa(jd + RATE_STEP_DAYS) - swe.get_ayanamsa(jd - RATE_STEP_DAYS))
+                         / (2 * RATE_STEP_DAYS) + nutation_rate)
+        else:
+            rates.append(0.0)
+
+    # 🏠 Stack: ayanamsa-major, house system-minor
+    n = len(house_systems)
+    longitudes = np.repeat((np.array(tropical) - np.array(offsets)) % 360.0, n, axis=0)
+    speeds = np.repeat(np.array(tropical_speed) - np.array(rates)[:, None], n, axis=0)
+    cusps = np.array([house_cusps[house_system] for house_system in house_systems] * len(ayanamsas))
+    cusps = (cusps - np.repeat(house_offsets, n)[:, None]) % 360.0
+    for j, house_system in enumerate(house_systems):
+        # Sign-based systems follow the sidereal ascendant's sign instead of shifting
+        if house_system == "W":
+            cusps[j::n] = (longitudes[j::n, ASC] // 30.0 * 30.0)[:, None] + SIGN_CUSPS
+        elif house_system == "N":
+            cusps[j::n] = SIGN_CUSPS
+    keys = [(name, house_system) for name in ayanamsas for house_system in house_systems]
+    return ChartVariants(dt_utc, lat, lon, keys, longitudes, speeds, cusps)
+
+if __name__ == "__main__":
+    import argparse
+
+    from logic.astroniharEng import birth_datetime_utc
+    from logic.chart import degree_to_details
+
+    parser = argparse.ArgumentParser(description="One birth under several ayanamsas and house systems")
+    parser.add_argument("date", help="dd-mm-yyyy")
+    parser.add_argument("time", help="IST, HH:MM or hh:mm AM/PM")
+    parser.add_argument("lat", type=float)
+    parser.add_argument("lon", type=float)
+    parser.add_argument("-a", "--ayanamsa", nargs="+", default=list(DEFAULT_AYANAMSAS))
+    parser.add_argument("-H", "--houses", nargs="+", default=list(DEFAULT_HOUSE_SYSTEMS))
+    args = parser.parse_args()
+
+    variants = chart_variants(birth_datetime_utc(args.date, args.time), args.lat, args.lon,
+                              args.ayanamsa, args.houses)
+    for key in variants:
+        print(f"== {key[0]} / {key[1]}")
+        for body, deg in variants[key].planets_raw.items():
+            details = degree_to_details(deg)
+            print(f"  {body:<10}{details['zodiac']} {details['degree']:8.4f}  {details['nakshatra']}-{details['pada']}")
+        print("  cusps     " + " ".join(f"{c:7.2f}" for c in variants.house_cusps(key)))
@@ -0,0 +1,228 @@
+# logic/city_panchang.py
+# Panchang of one date for many places at once (every gazetteer city by default).
+#
+# Tithi, nakshatra, yoga, karana and weekday at the given instant do not
+# depend on the place, so they are computed once. Sunrise and sunset are
+# solved for all cities together with numpy: the Sun's apparent RA/Dec and
+# sidereal time are sampled once, then each city's hour angle at the
+# horizon altitude is iterated to convergence. Against swe.rise_trans this
+# agrees within 2 s over the gazetteer (ANALYTIC_TOLERANCE_S), 1950-2080;
+# exact=True uses swe.rise_trans for every city instead, spread over a
+# process pool.
+#
+#   python -m logic.city_panchang 18-10-2026 06:00 -o panchang.csv [--exact]
+import csv
+import datetime
+
+import numpy as np
+import swisseph as swe
+
+from logic.almanac import CHALDEAN_ORDER
+from logic.batch_charts import imap_ordered
+from logic.ephemeris import ensure_ephemeris
+from logic.panchang import LORDS, NAKSHATRAS, get_panchang
+from logic.solar_events import get_solar_day
+from logic.transits import body_samples, hermite
+
+# Sun's upper limb with the refraction swe.rise_trans applies by default
+# (1013.25 mbar, 0 °C), matched against it over Indian latitudes
+HORIZON_ALT = -0.8775           # degrees
+SIDEREAL_RATE = 360.98564736629  # degrees of sidereal time per UT day
+SUN_STEP_DAYS = 0.25            # sampling of the Sun's RA/Dec
+ITERATIONS = 4
+ANALYTIC_TOLERANCE_S = 2
+EXACT_CHUNK = 64                # cities per worker task in exact mode
+
+# Location-independent fields of get_panchang
+COMMON_FIELDS = ["tithi", "paksha", "nakshatra", "yoga", "karana", "weekday", "mahakala_hora", "ayanamsa"]
+CSV_FIELDS = ["state", "city", "lat", "lon", "sunrise", "sunset", "nakshatra_at_sunrise", "hora_lord"]
+
+
+class _SunTrack:
+    """Apparent RA/Dec and sidereal time over a few days, interpolated for any array of UT JDs."""
+
+    def __init__(self, jd_start, jd_end):
+        ensure_ephemeris()
+        self.times = np.arange(jd_start, jd_end + SUN_STEP_DAYS, SUN_STEP_DAYS)
+        eq = np.array([swe.calc_ut(float(t), swe.SUN, swe.FLG_EQUATORIAL)[0][:2] for t in self.times])
+        self.ra = np.unwrap(eq[:, 0], period=360.0)
+        self.dec = eq[:, 1]
+        # GAST drifts from the linear rate only by nutation (well under 0.1 s a day)
+        self.gast0 = swe.sidtime(float(jd_start)) * 15.0
+        self.jd0 = jd_start
+
+    def at(self, jds):
+        return (np.interp(jds, self.times, self.ra), np.interp(jds, self.times, self.dec),
+                self.gast0 + SIDEREAL_RATE * (jds - self.jd0))
+
+
+def analytic_rise_set(track, day, lat, lon, rising):
+    """
+    Sunrise (rising=True) or sunset UT JD of civil `day` (JD at local noon)
+    for arrays of lat/lon in degrees; NaN where the Sun does not rise/set.
+    """
+    lat, lon = np.radians(lat), np.asarray(lon, dtype=np.float64)
+    sign = -1.0 if rising else 1.0
+    # Start from 6 h / 18 h local mean time
+    t = day - lon / 360.0 + sign * 0.25
+    sin_h0 = np.sin(np.radians(HORIZON_ALT))
+    for _ in range(ITERATIONS):
+        ra, dec, gast = track.at(t)
+        dec = np.radians(dec)
+        cos_h = (sin_h0 - np.sin(lat) * np.sin(dec)) / (np.cos(lat) * np.cos(dec))
+        hour_angle = np.degrees(np.arccos(np.where(np.abs(cos_h) <= 1, cos_h, np.nan)))
+        error = (gast + lon - ra - sign * hour_angle + 180.0) % 360.0 - 180.0
+        t = t - error / SIDEREAL_RATE
+    return t
+
+
+def _exact_solar(task):
+    day, coords = task
+    rows = []
+    for lat, lon in coords:
+        today, yesterday = get_solar_day(day, lat, lon), get_solar_day(day - 1, lat, lon)
+        rows.append([yesterday["sunrise"], yesterday["sunset"], today["sunrise"], today["sunset"],
+                     today["next_sunrise"]])
+    return np.array(rows, dtype=np.float64)
+
+
+def _solar_columns(day, lat, lon, exact, workers):
+    """(N, 5) UT JDs: previous sunrise, previous sunset, sunrise, sunset, next sunrise."""
+    if exact:
+        coords = np.stack([lat, lon], axis=1).tolist()
+        tasks = [(day, coords[i:i + EXACT_CHUNK]) for i in range(0, len(coords), EXACT_CHUNK)]
+        return np.concatenate(list(imap_ordered(_exact_solar, tasks, workers=workers, chunksize=1)))
+    track = _SunTrack(day - 2.0, day + 2.0)
+    return np.stack([analytic_rise_set(track, day - 1, lat, lon, True),
+                     analytic_rise_set(track, day - 1, lat, lon, False),
+                     analytic_rise_set(track, day, lat, lon, True),
+                     analytic_rise_set(track, day, lat, lon, False),
+                     analytic_rise_set(track, day + 1, lat, lon, True)], axis=1).astype(np.float64)
+
+
+def hora_lords(jd, solar, weekday):
+    """Hora lord index (into CHALDEAN_ORDER) at UT `jd` for each row of solar columns."""
+    _, prev_set, rise, set_, next_rise = solar.T
+    before = jd < rise
+    after = jd >= set_
+    day_hora = np.floor((jd - rise) / ((set_ - rise) / 12))
+    night_hora = 12 + np.floor((jd - set_) / ((next_rise - set_) / 12))
+    prev_night_hora = 12 + np.floor((jd - prev_set) / ((rise - prev_set) / 12))
+    number = np.where(before, prev_night_hora, np.where(after, night_hora, day_hora))
+    first = np.where(before, CHALDEAN_ORDER.index(LORDS[(weekday - 1) % 7]), CHALDEAN_ORDER.index(LORDS[weekday]))
+    valid = ~np.isnan(number)
+    lords = np.full(len(number), -1, dtype=np.int64)
+    lords[valid] = (first[valid] + number[valid].astype(np.int64)) % 7
+    return lords
+
+
+def multi_city_panchang(date_str, time_str, lat, lon, tz_offset=5.5, exact=False, workers=None):
+    """
+    Panchang of one local date/time (dd-mm-yyyy, HH:MM 24 h) for arrays of
+    coordinates. Returns (common, columns): the location-independent values
+    of get_panchang, and per-city numpy columns (UT JDs, NaN where the Sun
+    does not rise/set):
+      prev_sunrise, prev_sunset, sunrise, sunset, next_sunrise (of the civil date),
+      day_sunrise, day_sunset (of the Vedic day containing the instant, as
+      get_panchang: the previous day's before sunrise),
+      nakshatra_at_sunrise (0-26 at day_sunrise, -1),
+      hora_lord (index into CHALDEAN_ORDER at the given time, -1)
+    """
+    lat = np.asarray(lat, dtype=np.float64)
+    lon = np.asarray(lon, dtype=np.float64)
+    panchang = get_panchang(date_str, time_str, float(lat[0]), float(lon[0]), tz_offset)
+    common = {field: panchang[field] for field in COMMON_FIELDS}
+
+    local_dt = datetime.datetime.strptime(f"{date_str} {time_str}", "%d-%m-%Y %H:%M")
+    day = int(swe.julday(local_dt.year, local_dt.month, local_dt.day, 12.0))
+    jd = swe.julday(local_dt.year, local_dt.month, local_dt.day,
+                    local_dt.hour + local_dt.minute / 60.0) - tz_offset / 24
+    solar = _solar_columns(day, lat, lon, exact, workers)
+
+    # 🌅 Before a city's sunrise the instant still belongs to the previous Vedic day
+    sunrise = solar[:, 2]
+    before = jd < sunrise
+    day_sunrise = np.where(before, solar[:, 0], sunrise)
+    day_sunset = np.where(before, solar[:, 1], solar[:, 3])
+
+    # 🌙 Moon at each city's sunrise, from one set of interpolation samples
+    risen = ~np.isnan(day_sunrise)
+    nakshatra = np.full(len(lat), -1, dtype=np.int64)
+    if risen.any():
+        samples = body_samples('Mon', float(day_sunrise[risen].min()), float(day_sunrise[risen].max()))
+        moon = np.mod(hermite(day_sunrise[risen], *samples)[0], 360.0)
+        nakshatra[risen] = (moon // (360 / 27)).astype(np.int64)
+
+    weekday = (local_dt.weekday() + 1) % 7
+    columns = {
+        "prev_sunrise": solar[:, 0],
+        "prev_sunset": solar[:, 1],
+        "sunrise": sunrise,
+        "sunset": solar[:, 3],
+        "next_sunrise": solar[:, 4],
+        "day_sunrise": day_sunrise,
+        "day_sunset": day_sunset,
+        "nakshatra_at_sunrise": nakshatra,
+        "hora_lord": hora_lords(jd, solar, weekday),
+    }
+    return common, columns
+
+
+def _local_time(jd, tz_offset):
+    if np.isnan(jd):
+        return "N/A"
+    y, m, d, hours = swe.revjul(float(jd) + tz_offset / 24)
+    seconds = round(hours * 3600)
+    return f"{seconds // 3600:02d}:{seconds // 60 % 60:02d}:{seconds % 60:02d}"
+
+
+def gazetteer_panchang(date_str, time_str, tz_offset=5.5, exact=False, workers=None, gazetteer=None):
+    """multi_city_panchang over every city; yields (common, row dict) per city in gazetteer order."""
+    from logic.gazetteer import load_gazetteer
+
+    gazetteer = gazetteer or load_gazetteer()
+    coords = np.asarray(gazetteer.coords)
+    common, columns = multi_city_panchang(date_str, time_str, coords[:, 0], coords[:, 1], tz_offset, exact, workers)
+    for i in range(len(coords)):
+        state, city, lat, lon = gazetteer.record(i)
+        nakshatra = columns["nakshatra_at_sunrise"][i]
+        lord = columns["hora_lord"][i]
+        yield common, {
+            "state": state,
+            "city": city.strip(),
+            "lat": lat,
+            "lon": lon,
+            "sunrise": _local_time(columns["day_sunrise"][i], tz_offset),
+            "sunset": _local_time(columns["day_sunset"][i], tz_offset),
+            "nakshatra_at_sunrise": NAKSHATRAS[nakshatra] if nakshatra >= 0 else "N/A",
+            "hora_lord": CHALDEAN_ORDER[lord] if lord >= 0 else "N/A",
+        }
+
+
+if __name__ == "__main__":
+    import argparse
+    import sys
+    import time
+
+    parser = argparse.ArgumentParser(description="One date's panchang for every city in the gazetteer")
+    parser.add_argument("date", help="dd-mm-yyyy")
+    parser.add_argument("time", nargs="?", default="06:00", help="local time HH:MM (24 h) for the instant values")
+    parser.add_argument("--tz-offset", type=float, default=5.5)
+    parser.add_argument("--exact", action="store_true", help="swe.rise_trans for every city (slower)")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes for --exact")
+    parser.add_argument("-o", "--output", help="CSV file (default: stdout)")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    out = open(args.output, "w", newline="", encoding="utf-8") if args.output else sys.stdout
+    count = 0
+    writer = None
+    for common, row in gazetteer_panchang(args.date, args.time, args.tz_offset, args.exact, args.workers):
+        if writer is None:
+            writer = csv.DictWriter(out, fieldnames=CSV_FIELDS + COMMON_FIELDS)
+            writer.writeheader()
+        writer.writerow(dict(row, **common))
+        count += 1
+    if args.output:
+        out.close()
+    print(f"{count} cities in {time.perf_counter() - started:.2f}s", file=sys.stderr)
@@ -0,0 +1,150 @@
+# logic/dasha.py
+# Vimshottari dasha from the Moon's sidereal longitude at birth.
+#
+# Every level divides its parent the same way: the nine lords in
+# Vimshottari order starting from the parent's lord, each taking
+# years/120 of the parent. So one 9x10 table of cumulative fractions per
+# starting lord (CHILD_OFFSETS) expands any period, and nothing below the
+# mahadashas is stored: children are computed when asked for, as float UT
+# Julian days in numpy arrays. Five levels would be 9^5 = 59049 periods per
+# 120-year cycle; a lookup at an instant only walks one path.
+import datetime
+from bisect import bisect_right
+
+import numpy as np
+import swisseph as swe
+
+from logic.chart import NAKSHATRA_SPAN
+
+DASHA_LORDS = ['Ket', 'Ven', 'Sun', 'Mon', 'Mar', 'Rah', 'Jup', 'Sat', 'Mer']
+DASHA_YEARS = np.array([7, 20, 6, 10, 7, 18, 16, 19, 17], dtype=np.float64)
+CYCLE_YEARS = 120.0
+YEAR_DAYS = 365.25
+LEVEL_NAMES = ['Maha', 'Antar', 'Pratyantar', 'Sookshma', 'Prana']
+
+# 📊 Row i: sub-period lords and cumulative start fractions inside a period of lord i
+CHILD_LORDS = np.array([[(i + k) % 9 for k in range(9)] for i in range(9)], dtype=np.int8)
+CHILD_OFFSETS = np.concatenate(
+    [np.zeros((9, 1)), np.cumsum(DASHA_YEARS[CHILD_LORDS] / CYCLE_YEARS, axis=1)], axis=1)
+CHILD_OFFSETS[:, -1] = 1.0
+
+
+def birth_state(moon_lon):
+    """(lord index of the birth nakshatra, fraction of its dasha already elapsed)."""
+    moon_lon = moon_lon % 360.0
+    nakshatra = int(moon_lon // NAKSHATRA_SPAN)
+    return nakshatra % 9, (moon_lon % NAKSHATRA_SPAN) / NAKSHATRA_SPAN
+
+
+def children(start, end, lord):
+    """(starts, ends, lords) of the nine sub-periods of a period."""
+    bounds = start + (end - start) * CHILD_OFFSETS[lord]
+    return bounds[:-1], bounds[1:], CHILD_LORDS[lord]
+
+
+class Vimshottari:
+    """
+    Dasha periods of one birth. Mahadashas run from the one current at
+    birth until `years` after birth; deeper levels are expanded on demand
+    with `periods(path)`.
+    """
+
+    def __init__(self, birth_jd, moon_lon, years=CYCLE_YEARS):
+        self.birth_jd = birth_jd
+        self.moon_lon = moon_lon % 360.0
+        lord, elapsed = birth_state(moon_lon)
+        cycle = CYCLE_YEARS * YEAR_DAYS
+        self.cycle_start = birth_jd - elapsed * DASHA_YEARS[lord] / CYCLE_YEARS * cycle
+        self.first_lord = lord
+        starts, ends, lords = [], [], []
+        n = 0
+        while not starts or ends[-1][-1] < birth_jd + years * YEAR_DAYS:
+            s, e, l = children(self.cycle_start + n * cycle, self.cycle_start + (n + 1) * cycle, lord)
+            starts.append(s)
+            ends.append(e)
+            lords.append(l)
+            n += 1
+        keep = np.concatenate(starts) < birth_jd + years * YEAR_DAYS
+        self.maha_starts = np.concatenate(starts)[keep]
+        self.maha_ends = np.concatenate(ends)[keep]
+        self.maha_lords = np.concatenate(lords)[keep]
+
+    def periods(self, path=()):
+        """
+        (starts, ends, lords) of the periods under `path`, a tuple of child
+        positions: () gives the mahadashas, (i,) the antardashas of the i-th
+        mahadasha, (i, j) the pratyantardashas of its j-th antardasha, ...
+        """
+        starts, ends, lords = self.maha_starts, self.maha_ends, self.maha_lords
+        for position in path:
+            starts, ends, lords = children(starts[position], ends[position], lords[position])
+        return starts, ends, lords
+
+    def active(self, jd, levels=5):
+        """[(level name, lord, start, end)] of the periods running at `jd`, outermost first."""
+        return [entry for _, entry in self._walk(jd, levels)]
+
+    def path_at(self, jd, levels=5):
+        """`periods` path of the periods running at `jd`, outermost first."""
+        return tuple(i for i, _ in self._walk(jd, levels))
+
+    def _walk(self, jd, levels):
+        starts, ends, lords = self.maha_starts, self.maha_ends, self.maha_lords
+        result = []
+        for level in range(levels):
+            i = bisect_right(starts.tolist(), jd) - 1
+            if i < 0 or jd >= ends[i]:
+                break
+            result.append((i, (LEVEL_NAMES[level], DASHA_LORDS[lords[i]], float(starts[i]), float(ends[i]))))
+            starts, ends, lords = children(starts[i], ends[i], lords[i])
+        return result
+
+
+def active_lords_batch(birth_jds, moon_lons, jds, levels=3):
+    """
+    Vectorized active periods for many charts: lord indices (N, levels) and
+    start/end UT JDs (N, levels) of the periods running at jds[i] for chart i.
+    Instants are taken modulo the 120-year cycle.
+    """
+    birth_jds = np.asarray(birth_jds, dtype=np.float64)
+    moon_lons = np.mod(np.asarray(moon_lons, dtype=np.float64), 360.0)
+    jds = np.broadcast_to(np.asarray(jds, dtype=np.float64), birth_jds.shape)
+    cycle = CYCLE_YEARS * YEAR_DAYS
+
+    lord = (moon_lons // NAKSHATRA_SPAN).astype(np.int64) % 9
+    elapsed = (moon_lons % NAKSHATRA_SPAN) / NAKSHATRA_SPAN
+    start = birth_jds - elapsed * DASHA_YEARS[lord] / CYCLE_YEARS * cycle
+    start = start + np.floor((jds - start) / cycle) * cycle
+    length = np.full(birth_jds.shape, cycle)
+
+    out_lords = np.empty(birth_jds.shape + (levels,), dtype=np.int8)
+    out_starts = np.empty(birth_jds.shape + (levels,))
+    out_ends = np.empty(birth_jds.shape + (levels,))
+    for level in range(levels):
+        offsets = CHILD_OFFSETS[lord]
+        fraction = (jds - start) / length
+        i = (offsets[..., 1:-1] <= fraction[..., None]).sum(axis=-1)
+        lower = np.take_along_axis(offsets, i[..., None], axis=-1)[..., 0]
+        upper = np.take_along_axis(offsets, i[..., None] + 1, axis=-1)[..., 0]
+        lord = CHILD_LORDS[lord, i].astype(np.int64)
+        start, length = start + lower * length, (upper - lower) * length
+        out_lords[..., level] = lord
+        out_starts[..., level] = start
+        out_ends[..., level] = start + length
+    return out_lords, out_starts, out_ends
+
+
+def jd_from_timestamp(timestamp):
+    """UT Julian day of a chart timestamp ('%Y-%m-%d %I:%M %p UTC')."""
+    dt = datetime.datetime.strptime(timestamp, "%Y-%m-%d %I:%M %p UTC")
+    return swe.julday(dt.year, dt.month, dt.day, dt.hour + dt.minute / 60.0)
+
+
+def dasha_from_astro_data(astro_data, years=CYCLE_YEARS):
+    """Vimshottari of a calculate_chart result."""
+    return Vimshottari(jd_from_timestamp(astro_data["timestamp"]), astro_data["planets_raw"]["Mon"], years)
+
+
+def format_jd(jd, tz_offset=5.5):
+    y, m, d, _ = swe.revjul(jd + tz_offset / 24)
+    return f"{d:02d}-{m:02d}-{y:04d}"
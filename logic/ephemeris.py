@@ -0,0 +1,116 @@
+# logic/ephemeris.py
+# Swiss Ephemeris settings as an explicit EphemerisContext.
+#
+# Thread safety: pyswisseph keeps its settings (ephemeris path, sidereal
+# mode) in thread-local storage, so a new thread starts with the library
+# defaults (Fagan/Bradley ayanamsa, no path) and threads never see each
+# other's settings. Each context therefore configures the *calling thread*
+# in activate(), and only when that thread was last configured for a
+# different context; calculations call it before touching swe. Threads (or
+# worker processes) running charts with different contexts never share
+# state and need no lock; one thread alternating between contexts pays
+# one reconfiguration per switch.
+import threading
+
+import swisseph as swe
+
+EPHE_PATH = './data'  # Ensure ephemeris files (e.g., sepl_18.se1) are in ./data
+
+# Bump whenever chart or panchang output changes, so cached results are recomputed
+ENGINE_VERSION = f"3-swe{swe.version}"
+
+# The settings the calling thread was last configured with (see module comment)
+_state = threading.local()
+
+
+class EphemerisContext:
+    """
+    Ayanamsa (a swe.SIDM_* name such as "LAHIRI" or "RAMAN"), house system
+    (one-letter code), ephemeris path and extra swe flags for a calculation.
+    Treat it as immutable; one instance can be shared between threads.
+    """
+
+    __slots__ = ("ayanamsa", "sid_mode", "house_system", "hsys", "ephe_path", "flags", "key")
+
+    def __init__(self, ayanamsa="LAHIRI", house_system="P", ephe_path=EPHE_PATH, flags=0):
+        sid_mode = getattr(swe, f"SIDM_{ayanamsa.upper()}", None)
+        if sid_mode is None:
+            raise ValueError(f"unknown ayanamsa {ayanamsa!r}")
+        if len(house_system) != 1:
+            raise ValueError(f"house system must be a one-letter code, not {house_system!r}")
+        self.ayanamsa = ayanamsa.upper()
+        self.sid_mode = sid_mode
+        self.house_system = house_system
+        self.hsys = house_system.encode()
+        self.ephe_path = ephe_path
+        self.flags = flags
+        self.key = (self.ayanamsa, house_system, ephe_path, flags)
+
+    def __eq__(self, other):
+        return isinstance(other, EphemerisContext) and self.key == other.key
+
+    def __hash__(self):
+        return hash(self.key)
+
+    def __repr__(self):
+        return (f"EphemerisContext(ayanamsa={self.ayanamsa!r}, house_system={self.house_system!r}, "
+                f"ephe_path={self.ephe_path!r}, flags={self.flags})")
+
+    @property
+    def sidereal_flags(self):
+        return swe.FLG_SIDEREAL | self.flags
+
+    def activate(self):
+        """Configure the calling thread for this context (no-op if it already is)."""
+        current = getattr(_state, "key", None)
+        if current == self.key:
+            return
+        if current is None or current[2] != self.ephe_path:
+            swe.set_ephe_path(self.ephe_path)
+        swe.set_sid_mode(self.sid_mode)
+        _state.key = self.key
+
+    # 🔭 Calls with this context's settings
+
+    def calc(self, jd_et, body, flags=0):
+        """Sidereal position (swe.calc) of `body` at ephemeris time."""
+        self.activate()
+        return swe.calc(jd_et, body, self.sidereal_flags | flags)
+
+    def calc_ut(self, jd_ut, body, flags=0):
+        """Sidereal position (swe.calc_ut) of `body` at universal time."""
+        self.activate()
+        return swe.calc_ut(jd_ut, body, self.sidereal_flags | flags)
+
+    def houses(self, jd_ut, lat, lon, house_system=None):
+        """Sidereal (cusps, ascmc) for this context's house system (or `house_system`)."""
+        self.activate()
+        hsys = house_system.encode() if house_system else self.hsys
+        return swe.houses_ex(jd_ut, lat, lon, hsys, self.sidereal_flags)
+
+    def ayanamsa_ut(self, jd_ut):
+        self.activate()
+        return swe.get_ayanamsa_ut(jd_ut)
+
+    def true_ayanamsa(self, jd_et):
+        """Ayanamsa plus nutation in longitude: what FLG_SIDEREAL subtracts from tropical positions."""
+        self.activate()
+        return swe.get_ayanamsa_ex(jd_et, self.sidereal_flags)[1]
+
+    def true_ayanamsa_ut(self, jd_ut):
+        self.activate()
+        return swe.get_ayanamsa_ex_ut(jd_ut, self.sidereal_flags)[1]
+
+
+DEFAULT_CONTEXT = EphemerisContext()
+AYANAMSA = DEFAULT_CONTEXT.ayanamsa
+HOUSE_SYSTEM = DEFAULT_CONTEXT.house_system
+
+
+def ensure_ephemeris(ctx=DEFAULT_CONTEXT):
+    """
+    Configure Swiss Ephemeris (path + ayanamsa, Lahiri by default) for the
+    calling thread the first time it needs it, instead of as an import side
+    effect.
+    """
+    ctx.activate()
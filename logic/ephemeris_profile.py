@@ -0,0 +1,171 @@
+# logic/ephemeris_profile.py
+# Opt-in accounting of Swiss Ephemeris calls per computed chart.
+#
+# Enable with ROGAHORA_EPHEMERIS_PROFILE=1 (or `python main.py --profile-ephemeris`).
+# install() replaces the instrumented swisseph functions with timing wrappers;
+# callers use `swe.calc(...)` through the module, so nothing else changes.
+# A wrapper only records while the current thread has an active profile
+# (see `profiling`), so uninstrumented code paths pay one attribute lookup.
+import json
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+
+import swisseph as swe
+
+ENV_VAR = "ROGAHORA_EPHEMERIS_PROFILE"
+INSTRUMENTED = ("calc", "calc_ut", "houses_ex", "rise_trans", "get_ayanamsa", "get_ayanamsa_ut",
+                "get_ayanamsa_ex", "get_ayanamsa_ex_ut", "sidtime")
+# Thin wrappers (EphemerisContext); the call site reported is their caller
+PASS_THROUGH = ("logic.ephemeris",)
+
+_originals = {}
+_active = threading.local()
+_install_lock = threading.Lock()
+
+
+class EphemerisProfile:
+    """Call counts and cumulative time per (function, call site). Thread-safe."""
+
+    def __init__(self, label=""):
+        self.label = label
+        self.calls = {}   # (function, site) -> [count, seconds]
+        self._lock = threading.Lock()
+
+    def record(self, function, site, seconds):
+        with self._lock:
+            entry = self.calls.setdefault((function, site), [0, 0.0])
+            entry[0] += 1
+            entry[1] += seconds
+
+    def by_function(self):
+        totals = {}
+        with self._lock:
+            for (function, _), (count, seconds) in self.calls.items():
+                entry = totals.setdefault(function, [0, 0.0])
+                entry[0] += count
+                entry[1] += seconds
+        return totals
+
+    def total_calls(self):
+        return sum(count for count, _ in self.by_function().values())
+
+    def total_seconds(self):
+        return sum(seconds for _, seconds in self.by_function().values())
+
+    def rows(self):
+        """(function, site, count, seconds), most expensive first."""
+        with self._lock:
+            rows = [(function, site, count, seconds)
+                    for (function, site), (count, seconds) in self.calls.items()]
+        return sorted(rows, key=lambda row: row[3], reverse=True)
+
+    def to_dict(self):
+        return {
+            "label": self.label,
+            "total_calls": self.total_calls(),
+            "total_ms": self.total_seconds() * 1000,
+            "functions": {function: {"calls": count, "total_ms": seconds * 1000}
+                          for function, (count, seconds) in sorted(self.by_function().items())},
+            "sites": [{"function": function, "site": site, "calls": count, "total_ms": seconds * 1000}
+                      for function, site, count, seconds in self.rows()],
+        }
+
+    def to_json(self, indent=2):
+        return json.dumps(self.to_dict(), indent=indent)
+
+    def save(self, path):
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(self.to_json())
+
+
+def is_enabled():
+    return os.environ.get(ENV_VAR, "").strip().lower() in ("1", "true", "yes", "on")
+
+
+def is_installed():
+    return bool(_originals)
+
+
+def _call_site(frame):
+    while frame.f_back is not None and frame.f_globals.get('__name__') in PASS_THROUGH:
+        frame = frame.f_back
+    return f"{frame.f_globals.get('__name__', '?')}:{frame.f_lineno} ({frame.f_code.co_name})"
+
+
+def _wrap(name, original):
+    def timed(*args, **kwargs):
+        profile = getattr(_active, "profile", None)
+        if profile is None:
+            return original(*args, **kwargs)
+        started = time.perf_counter()
+        try:
+            return original(*args, **kwargs)
+        finally:
+            profile.record(name, _call_site(sys._getframe(1)), time.perf_counter() - started)
+
+    timed.__name__ = name
+    timed.__doc__ = original.__doc__
+    timed.__wrapped__ = original
+    return timed
+
+
+def install():
+    """Wrap the instrumented swisseph functions. Idempotent."""
+    with _install_lock:
+        if _originals:
+            return
+        for name in INSTRUMENTED:
+            original = getattr(swe, name)
+            _originals[name] = original
+            setattr(swe, name, _wrap(name, original))
+
+
+def uninstall():
+    with _install_lock:
+        for name, original in _originals.items():
+            setattr(swe, name, original)
+        _originals.clear()
+
+
+def install_if_enabled():
+    if is_enabled():
+        install()
+    return is_installed()
+
+
+@contextmanager
+def profiling(profile):
+    """Record the current thread's ephemeris calls into `profile` (None: no-op)."""
+    previous = getattr(_active, "profile", None)
+    _active.profile = profile
+    try:
+        yield profile
+    finally:
+        _active.profile = previous
+
+
+def profile_call(profile, fn, *args, **kwargs):
+    with profiling(profile):
+        return fn(*args, **kwargs)
+
+
+def profile_birth(date_str, time_str, ampm, lat, lon, tz_offset=5.5):
+    """Profile of one full chart (astro + panchang) as computed by the GUI."""
+    from logic.astroniharEng import get_astro_data
+    from logic.panchangWrapper import prepare_panchang_payload
+
+    install()
+    profile = EphemerisProfile(f"{date_str} {time_str} {ampm} ({lat}, {lon})")
+    with profiling(profile):
+        get_astro_data(date_str, f"{time_str} {ampm}", lat, lon)
+        prepare_panchang_payload(date_str, time_str, ampm, lat, lon, tz_offset)
+    return profile
+
+
+if __name__ == "__main__":
+    # python -m logic.ephemeris_profile 15-08-1990 10:30 AM 28.61 77.21
+    date_arg, time_arg, ampm_arg, lat_arg, lon_arg = sys.argv[1:6]
+    print(profile_birth(date_arg, time_arg, ampm_arg, float(lat_arg), float(lon_arg)).to_json())
@@ -0,0 +1,330 @@
+# logic/events.py
+# Precomputed index of pada / nakshatra / sign changes and retrograde stations.
+#
+# Events are found per body from the transit samples (logic.transits):
+#   1. stations: sign changes of the sampled speed, refined with Brent on the
+#      exact swe.calc_ut speed; they split the timeline into monotone pieces
+#   2. boundary crossings: every multiple of a pada (3°20') passed between two
+#      knots of a monotone piece is bracketed there, located on the Hermite
+#      interpolant by simultaneous bisection, then polished with one Newton
+#      step on swe.calc_ut
+# Sign and nakshatra boundaries are pada boundaries, so one pass finds all
+# three; each event is flagged with every level that changes. Ketu is Rahu's
+# events shifted by 180° (54 padas).
+#
+# The index is one .npy of EVENT_DTYPE records sorted by (body, jd), memory-
+# mapped on load. Every record carries the full state after the event (pada,
+# motion), and each body is framed by START / END records at the epoch, so "where
+# is Saturn at t" and "when does Jupiter next change nakshatra" are binary
+# searches.
+import math
+import os
+
+import numpy as np
+import swisseph as swe
+
+from logic.batch_charts import imap_ordered
+from logic.chart import NAKSHATRAS, ZODIAC_SIGNS
+from logic.ephemeris import ensure_ephemeris
+from logic.rootfind import bisect_many, brent
+from logic.transits import BLOCK_DAYS, BODY_CODES, FLAGS, GRID_EPOCH, TRANSIT_BODIES, body_samples, hermite
+
+DEFAULT_PATH = os.path.join(os.path.expanduser("~"), ".rogahora", "events.npy")
+DEFAULT_EPOCH = (1900, 2100)
+CHUNK_DAYS = 16 * BLOCK_DAYS        # ~11 years per worker task
+
+PADA_COUNT = 108
+PADA_DEG = 360 / PADA_COUNT
+PADAS_PER_NAKSHATRA = 4
+PADAS_PER_SIGN = 9
+
+# Event flags (a record may carry several)
+PADA = 1
+NAKSHATRA = 2
+SIGN = 4
+STATION = 8
+START = 16
+END = 32
+LEVELS = {"pada": PADA, "nakshatra": NAKSHATRA, "sign": SIGN, "station": STATION}
+
+EVENT_DTYPE = np.dtype([
+    ("jd", "<f8"),       # UT Julian day
+    ("body", "u1"),      # index into TRANSIT_BODIES
+    ("flags", "u1"),     # PADA | NAKSHATRA | SIGN | STATION, or START / END
+    ("pada", "u1"),      # absolute pada 0-107 from the event on
+    ("motion", "i1"),    # +1 direct, -1 retrograde from the event on
+])
+
+NEWTON_MIN_SPEED = 1e-4             # deg/day; slower crossings keep the interpolated time
+STATION_XTOL = 1e-6                 # days (~0.1 s)
+
+
+def _boundary_flags(k):
+    """Flags of the pada boundaries with absolute indices `k` (k * PADA_DEG)."""
+    k = np.mod(k, PADA_COUNT)
+    flags = np.full(k.shape, PADA, dtype=np.uint8)
+    flags[k % PADAS_PER_NAKSHATRA == 0] |= NAKSHATRA
+    flags[k % PADAS_PER_SIGN == 0] |= SIGN
+    return flags
+
+
+def _exact(code, jd):
+    pos, _ = swe.calc_ut(jd, code, FLAGS)
+    return pos[0], pos[3]
+
+
+def _records(jd, body, flags, pada, motion):
+    out = np.empty(len(jd), dtype=EVENT_DTYPE)
+    out["jd"] = jd
+    out["body"] = body
+    out["flags"] = flags
+    out["pada"] = np.mod(pada, PADA_COUNT)
+    out["motion"] = motion
+    return out
+
+
+def body_events(body, jd_start, jd_end):
+    """
+    Events of a base body (not Ket) with jd_start <= jd < jd_end, in time
+    order. Returns (records, start_state) where start_state is (pada, motion)
+    at jd_start.
+    """
+    ensure_ephemeris()
+    code = BODY_CODES[body]
+    b = TRANSIT_BODIES.index(body)
+    times, lon, speed = body_samples(body, jd_start, jd_end)
+    times, lon, speed = np.array(times), np.array(lon), np.array(speed)
+
+    # 🔄 Stations: refine each sampled speed sign change on the exact speed
+    flips = np.nonzero(np.sign(speed[:-1]) * np.sign(speed[1:]) < 0)[0]
+    station_t = np.array([brent(lambda t: _exact(code, t)[1], times[i], times[i + 1], STATION_XTOL,
+                                fa=speed[i], fb=speed[i + 1]) for i in flips])
+    station_lon = np.array([_exact(code, t)[0] for t in station_t])
+    # Continue the unwrapped longitude through each station
+    station_lon = lon[flips] + (station_lon - lon[flips] + 180.0) % 360.0 - 180.0
+    station_motion = -np.sign(speed[flips]).astype(np.int8)
+
+    # Knots of the monotone pieces: samples plus stations (speed 0 there)
+    knots_t = np.insert(times, flips + 1, station_t)
+    knots_lon = np.insert(lon, flips + 1, station_lon)
+    knots_speed = np.insert(speed, flips + 1, 0.0)
+
+    # 🎯 Every pada boundary passed in each knot interval
+    lo_k = np.floor(np.minimum(knots_lon[:-1], knots_lon[1:]) / PADA_DEG).astype(np.int64)
+    hi_k = np.floor(np.maximum(knots_lon[:-1], knots_lon[1:]) / PADA_DEG).astype(np.int64)
+    counts = hi_k - lo_k
+    interval = np.repeat(np.arange(len(counts)), counts)
+    offsets = np.arange(len(interval)) - np.repeat(np.cumsum(counts) - counts, counts)
+    k = lo_k[interval] + 1 + offsets
+    rising = knots_lon[interval + 1] > knots_lon[interval]
+    target = k * PADA_DEG
+
+    def residual(t):
+        return hermite(t, knots_t, knots_lon, knots_speed)[0] - target
+
+    cross_t = bisect_many(residual, knots_t[interval], knots_t[interval + 1], xtol=1e-7)
+    # Newton polish on the ephemeris itself
+    for i, t in enumerate(cross_t):
+        exact_lon, exact_speed = _exact(code, float(t))
+        if abs(exact_speed) > NEWTON_MIN_SPEED:
+            error = (exact_lon - target[i] + 180.0) % 360.0 - 180.0
+            step = error / exact_speed
+            if abs(step) < 0.5:
+                cross_t[i] = t - step
+    motion = np.where(rising, 1, -1).astype(np.int8)
+    pada_after = np.where(rising, k, k - 1)
+
+    # Motion of each crossing is that of its piece; stations keep the pada they sit in
+    station_pada = np.floor(station_lon / PADA_DEG).astype(np.int64)
+    events = np.concatenate([
+        _records(cross_t, b, _boundary_flags(k), pada_after, motion),
+        _records(station_t, b, STATION, station_pada, station_motion),
+    ])
+    events = events[np.argsort(events["jd"], kind="stable")]
+    events = events[(events["jd"] >= jd_start) & (events["jd"] < jd_end)]
+
+    start_lon, start_speed = hermite(jd_start, knots_t, knots_lon, knots_speed)
+    start_state = (int(math.floor(float(start_lon) / PADA_DEG)) % PADA_COUNT, 1 if start_speed >= 0 else -1)
+    return events, start_state
+
+
+def _chunk_events(task):
+    body, jd_start, jd_end = task
+    events, _ = body_events(body, jd_start, jd_end)
+    return events
+
+
+def _epoch_jd(year):
+    return swe.julday(year, 1, 1, 0.0)
+
+
+def build_events(start_year=DEFAULT_EPOCH[0], end_year=DEFAULT_EPOCH[1], workers=None, progress=None):
+    """All events from 1 Jan start_year to 1 Jan end_year (UT), sorted by (body, jd)."""
+    jd_start, jd_end = _epoch_jd(start_year), _epoch_jd(end_year)
+    # Chunk edges sit on the sample grid so neighbouring chunks share their edge knot
+    first = math.floor((jd_start - GRID_EPOCH) / CHUNK_DAYS)
+    last = math.ceil((jd_end - GRID_EPOCH) / CHUNK_DAYS)
+    edges = [GRID_EPOCH + n * CHUNK_DAYS for n in range(first, last + 1)]
+    bases = [body for body in TRANSIT_BODIES if body != 'Ket']
+    tasks = [(body, max(a, jd_start), min(b, jd_end)) for body in bases for a, b in zip(edges, edges[1:])]
+
+    per_body = {body: [] for body in bases}
+    for n, ((body, _, _), events) in enumerate(zip(tasks, imap_ordered(_chunk_events, tasks, workers=workers,
+                                                                       chunksize=1)), start=1):
+        per_body[body].append(events)
+        if progress is not None:
+            progress(n, len(tasks))
+
+    parts = []
+    for body in bases:
+        b = TRANSIT_BODIES.index(body)
+        _, (pada, motion) = body_events(body, jd_start, jd_start + 1)
+        _, (end_pada, end_motion) = body_events(body, jd_end, jd_end + 1)
+        parts.append(np.concatenate([_records([jd_start], b, START, [pada], [motion])] + per_body[body]
+                                    + [_records([jd_end], b, END, [end_pada], [end_motion])]))
+        if body == 'Rah':
+            # 🌓 Ketu = Rahu + 180°: same instants, pada + 54, flags of the opposite boundary
+            ketu = parts[-1].copy()
+            ketu["body"] = TRANSIT_BODIES.index('Ket')
+            ketu["pada"] = (ketu["pada"].astype(np.int64) + PADA_COUNT // 2) % PADA_COUNT
+            crossing = (ketu["flags"] & PADA).astype(bool)
+            boundary = np.where(ketu["motion"] > 0, ketu["pada"], ketu["pada"].astype(np.int64) + 1)
+            ketu["flags"][crossing] = _boundary_flags(boundary[crossing])
+            parts.append(ketu)
+    events = np.concatenate(parts)
+    return events[np.lexsort((events["jd"], events["body"]))]
+
+
+def save_events(events, path=DEFAULT_PATH):
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    tmp = path + ".tmp.npy"
+    np.save(tmp, events)
+    os.replace(tmp, path)
+
+
+class EventIndex:
+    """Binary-search queries over a sorted event array (see build_events)."""
+
+    def __init__(self, events):
+        if events.dtype != EVENT_DTYPE:
+            raise ValueError(f"not an event index (dtype {events.dtype})")
+        self.events = events
+        bounds = np.searchsorted(events["body"], np.arange(len(TRANSIT_BODIES) + 1))
+        self._slices = {body: slice(bounds[i], bounds[i + 1]) for i, body in enumerate(TRANSIT_BODIES)}
+        self._times = {}
+
+    def __len__(self):
+        return len(self.events)
+
+    @property
+    def epoch(self):
+        """(start, end) UT Julian days covered by the index."""
+        jds = self.events["jd"]
+        return float(jds[self.events["flags"] == START].min()), float(jds[self.events["flags"] == END].max())
+
+    def body_events(self, body):
+        return self.events[self._slices[body]]
+
+    def _level(self, body, level):
+        level = LEVELS.get(level, level)
+        key = (body, level)
+        if key not in self._times:
+            events = self.body_events(body)
+            chosen = events[(events["flags"] & level).astype(bool)]
+            self._times[key] = (np.ascontiguousarray(chosen["jd"]), chosen)
+        return self._times[key]
+
+    def state_at(self, body, jds):
+        """(pada 0-107, motion ±1) of `body` at each UT Julian day inside the epoch."""
+        events = self.body_events(body)
+        jds = np.asarray(jds, dtype=np.float64)
+        start, end = self.epoch
+        if np.any((jds < start) | (jds > end)):
+            raise ValueError("date outside the event index epoch")
+        i = np.searchsorted(events["jd"], jds, side="right") - 1
+        return events["pada"][i], events["motion"][i]
+
+    def sign_at(self, body, jds):
+        return self.state_at(body, jds)[0] // PADAS_PER_SIGN
+
+    def nakshatra_at(self, body, jds):
+        return self.state_at(body, jds)[0] // PADAS_PER_NAKSHATRA
+
+    def next_event(self, body, level, jd):
+        """First `level` event of `body` strictly after `jd` (a record), or None."""
+        times, chosen = self._level(body, level)
+        i = np.searchsorted(times, jd, side="right")
+        return chosen[i] if i < len(times) else None
+
+    def previous_event(self, body, level, jd):
+        """Last `level` event of `body` at or before `jd`, or None."""
+        times, chosen = self._level(body, level)
+        i = np.searchsorted(times, jd, side="right") - 1
+        return chosen[i] if i >= 0 else None
+
+    def windows(self, body, level, value, jd_start=None, jd_end=None):
+        """
+        (n, 2) array of [start, end) UT Julian days in which the `level`
+        ('pada', 'nakshatra' or 'sign', or the PADA/NAKSHATRA/SIGN flag) of
+        `body` equals `value`.
+        """
+        level = LEVELS.get(level, level)
+        per = {PADA: 1, NAKSHATRA: PADAS_PER_NAKSHATRA, SIGN: PADAS_PER_SIGN}[level]
+        events = self.body_events(body)
+        starts, chosen = self._level(body, level)
+        times = np.concatenate([[events["jd"][0]], starts, [events["jd"][-1]]])
+        values = np.concatenate([[events["pada"][0] // per], chosen["pada"] // per])
+        inside = values == value
+        result = np.stack([times[:-1][inside], times[1:][inside]], axis=1)
+        if jd_start is not None:
+            result = result[result[:, 1] > jd_start]
+            result[:, 0] = np.maximum(result[:, 0], jd_start)
+        if jd_end is not None:
+            result = result[result[:, 0] < jd_end]
+            result[:, 1] = np.minimum(result[:, 1], jd_end)
+        return result
+
+
+def load_events(path=DEFAULT_PATH):
+    """Memory-mapped EventIndex, or None if it has not been built."""
+    if not os.path.exists(path):
+        return None
+    return EventIndex(np.load(path, mmap_mode="r"))
+
+
+def describe(record):
+    """One-line summary of an event record."""
+    y, m, d, hours = swe.revjul(float(record["jd"]))
+    when = f"{d:02d}-{m:02d}-{y:04d} {int(hours):02d}:{int(hours % 1 * 60):02d} UT"
+    body = TRANSIT_BODIES[record["body"]]
+    pada = int(record["pada"])
+    if record["flags"] & STATION:
+        return f"{when}  {body} turns {'direct' if record['motion'] > 0 else 'retrograde'}"
+    return (f"{when}  {body} enters {ZODIAC_SIGNS[pada // PADAS_PER_SIGN]} "
+            f"{NAKSHATRAS[pada // PADAS_PER_NAKSHATRA]} pada {pada % PADAS_PER_NAKSHATRA + 1}")
+
+
+if __name__ == "__main__":
+    # python -m logic.events build [1900 2100]
+    # python -m logic.events next Jup nakshatra [dd-mm-yyyy]
+    import datetime
+    import sys
+    import time
+
+    if sys.argv[1] == "build":
+        years = [int(y) for y in sys.argv[2:4]] or list(DEFAULT_EPOCH)
+        started = time.perf_counter()
+        events = build_events(*years)
+        save_events(events)
+        print(f"{len(events)} events for {years[0]}-{years[1]} in {time.perf_counter() - started:.1f}s "
+              f"({DEFAULT_PATH})")
+    elif sys.argv[1] == "next":
+        index = load_events()
+        if index is None:
+            sys.exit("No event index; run: python -m logic.events build")
+        body, level = sys.argv[2], LEVELS[sys.argv[3]]
+        day = datetime.datetime.strptime(sys.argv[4], "%d-%m-%Y") if len(sys.argv) > 4 else datetime.datetime.utcnow()
+        record = index.next_event(body, level, swe.julday(day.year, day.month, day.day, day.hour + day.minute / 60))
+        print(describe(record) if record is not None else "No such event inside the index epoch")
+    else:
+        sys.exit(f"unknown command {sys.argv[1]!r} (use build or next)")
@@ -0,0 +1,293 @@
+# logic/gazetteer.py
+# Precompiled city gazetteer: the CSV is compiled once into memory-mapped .npy
+# arrays (coordinates, string tables, spatial grid) and rebuilt whenever the
+# CSV's size or mtime changes.
+import bisect
+import csv
+import json
+import math
+import os
+import shutil
+import tempfile
+from collections import namedtuple
+from functools import lru_cache
+
+import numpy as np
+
+DEFAULT_CSV = "./data/Indian_Cities_Geo_Data.csv"
+FORMAT_VERSION = 1
+GRID_CELL_DEG = 1.0
+EARTH_RADIUS_KM = 6371.0088
+_KM_PER_DEG = math.pi * EARTH_RADIUS_KM / 180.0
+_HALF_CIRCUMFERENCE_KM = math.pi * EARTH_RADIUS_KM
+
+GeoMatch = namedtuple("GeoMatch", "state city lat lon distance_km")
+
+_ARRAYS = ("coords", "state_start", "state_offsets", "state_blob",
+           "city_offsets", "city_blob", "grid_keys", "grid_order")
+
+
+class _Names:
+    """Read-only sequence of strings decoded lazily from an offsets + UTF-8 blob pair."""
+
+    def __init__(self, offsets, blob):
+        self._offsets = offsets
+        self._blob = blob
+
+    def __len__(self):
+        return len(self._offsets) - 1
+
+    def __getitem__(self, i):
+        start, end = self._offsets[i], self._offsets[i + 1]
+        return bytes(self._blob[start:end]).decode("utf-8")
+
+
+def _string_table(names):
+    encoded = [name.encode("utf-8") for name in names]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    offsets[1:] = np.cumsum([len(b) for b in encoded])
+    return offsets, np.frombuffer(b"".join(encoded), dtype=np.uint8)
+
+
+def _grid_shape(cell_deg):
+    return int(math.ceil(180.0 / cell_deg)), int(math.ceil(360.0 / cell_deg))
+
+
+def _grid_rows_cols(lat, lon, cell_deg):
+    n_rows, n_cols = _grid_shape(cell_deg)
+    rows = np.clip(np.floor((np.asarray(lat) + 90.0) / cell_deg), 0, n_rows - 1).astype(np.int64)
+    cols = (np.floor((np.asarray(lon) + 180.0) / cell_deg).astype(np.int64)) % n_cols
+    return rows, cols
+
+
+def _read_csv(csv_path):
+    rows = {}
+    with open(csv_path, newline="", encoding="utf-8") as f:
+        reader = csv.reader(f)
+        header = [name.strip() for name in next(reader, [])]
+        i_state, i_city = header.index("state"), header.index("city")
+        i_lat, i_lon = header.index("lat"), header.index("lon")
+        for row in reader:
+            if not row:
+                continue
+            # Later duplicates win, as with the old dict-of-dicts loader
+            rows[(row[i_state].strip(), row[i_city].strip())] = (float(row[i_lat]), float(row[i_lon]))
+    return rows
+
+
+def _compile(csv_path, out_dir, cell_deg):
+    rows = _read_csv(csv_path)
+    keys = sorted(rows)
+
+    states = sorted({state for state, _ in keys})
+    state_pos = {state: i for i, state in enumerate(states)}
+    state_of_row = np.fromiter((state_pos[state] for state, _ in keys), dtype=np.int64, count=len(keys))
+    state_start = np.searchsorted(state_of_row, np.arange(len(states) + 1)).astype(np.int64)
+
+    coords = np.array([rows[key] for key in keys], dtype=np.float64).reshape(-1, 2)
+    grid_rows, grid_cols = _grid_rows_cols(coords[:, 0], coords[:, 1], cell_deg)
+    cell_ids = grid_rows * _grid_shape(cell_deg)[1] + grid_cols
+    grid_order = np.argsort(cell_ids, kind="stable")
+
+    state_offsets, state_blob = _string_table(states)
+    city_offsets, city_blob = _string_table(city for _, city in keys)
+
+    arrays = {
+        "coords": coords,
+        "state_start": state_start,
+        "state_offsets": state_offsets,
+        "state_blob": state_blob,
+        "city_offsets": city_offsets,
+        "city_blob": city_blob,
+        "grid_keys": cell_ids[grid_order],
+        "grid_order": grid_order.astype(np.int64),
+    }
+    for name, array in arrays.items():
+        np.save(os.path.join(out_dir, f"{name}.npy"), array)
+    # meta.json is written last and marks the build as complete
+    with open(os.path.join(out_dir, "meta.json"), "w", encoding="utf-8") as f:
+        json.dump({"version": FORMAT_VERSION, "rows": len(keys), "cell_deg": cell_deg}, f)
+
+
+def _source_signature(csv_path):
+    st = os.stat(csv_path)
+    return f"v{FORMAT_VERSION}-{st.st_size}-{st.st_mtime_ns}"
+
+
+def _cache_roots(csv_path):
+    yield os.path.join(os.path.dirname(os.path.abspath(csv_path)), ".gazetteer")
+    # Read-only install (e.g. frozen build): fall back to the temp directory
+    yield os.path.join(tempfile.gettempdir(), "rogahora-gazetteer")
+
+
+def _ensure_compiled(csv_path, signature, cell_deg):
+    stem = os.path.splitext(os.path.basename(csv_path))[0]
+    last_error = None
+    for root in _cache_roots(csv_path):
+        final_dir = os.path.join(root, f"{stem}-{signature}")
+        if os.path.exists(os.path.join(final_dir, "meta.json")):
+            return final_dir
+        try:
+            os.makedirs(root, exist_ok=True)
+            tmp_dir = tempfile.mkdtemp(prefix=f"{stem}.tmp-", dir=root)
+            _compile(csv_path, tmp_dir, cell_deg)
+            try:
+                os.rename(tmp_dir, final_dir)
+            except OSError:
+                # Another process finished the same build first
+                shutil.rmtree(tmp_dir, ignore_errors=True)
+            _remove_stale(root, stem, final_dir)
+            return final_dir
+        except OSError as e:
+            last_error = e
+    raise last_error
+
+
+def _remove_stale(root, stem, keep_dir):
+    for name in os.listdir(root):
+        path = os.path.join(root, name)
+        if name.startswith(f"{stem}-") and path != keep_dir:
+            shutil.rmtree(path, ignore_errors=True)
+
+
+class Gazetteer:
+    """
+    City gazetteer backed by memory-mapped arrays. Rows are sorted by
+    (state, city); coordinates are indexed by a regular lat/lon grid so
+    radius and nearest-city queries only touch nearby cells.
+    """
+
+    def __init__(self, cache_dir):
+        with open(os.path.join(cache_dir, "meta.json"), encoding="utf-8") as f:
+            meta = json.load(f)
+        self.cell_deg = meta["cell_deg"]
+        arrays = {name: np.load(os.path.join(cache_dir, f"{name}.npy"), mmap_mode="r")
+                  for name in _ARRAYS}
+        self.coords = arrays["coords"]
+        self._state_start = arrays["state_start"]
+        self._grid_keys = arrays["grid_keys"]
+        self._grid_order = arrays["grid_order"]
+        self._state_names = list(_Names(arrays["state_offsets"], arrays["state_blob"]))
+        self._city_names = _Names(arrays["city_offsets"], arrays["city_blob"])
+        self._nested = None
+
+    def __len__(self):
+        return len(self.coords)
+
+    # 🏙 Name lookups
+
+    def states(self):
+        return list(self._state_names)
+
+    def _state_range(self, state):
+        i = bisect.bisect_left(self._state_names, state)
+        if i == len(self._state_names) or self._state_names[i] != state:
+            raise KeyError(state)
+        return int(self._state_start[i]), int(self._state_start[i + 1])
+
+    def cities(self, state):
+        start, end = self._state_range(state)
+        return [self._city_names[i] for i in range(start, end)]
+
+    def find(self, state, city):
+        """Row index of (state, city), or KeyError."""
+        start, end = self._state_range(state)
+        i = bisect.bisect_left(self._city_names, city, start, end)
+        if i == end or self._city_names[i] != city:
+            raise KeyError((state, city))
+        return i
+
+    def lookup(self, state, city):
+        lat, lon = self.coords[self.find(state, city)]
+        return float(lat), float(lon)
+
+    def record(self, i):
+        state_i = bisect.bisect_right(self._state_start, i) - 1
+        lat, lon = self.coords[i]
+        return self._state_names[state_i], self._city_names[i], float(lat), float(lon)
+
+    def to_nested_dict(self):
+        """
+        state -> city -> (lat, lon), the shape load_city_data has always returned.
+        Built once per gazetteer and shared, so treat it as read-only.
+        """
+        if self._nested is not None:
+            return self._nested
+        data = {}
+        for state_i, state in enumerate(self._state_names):
+            start, end = int(self._state_start[state_i]), int(self._state_start[state_i + 1])
+            coords = self.coords[start:end].tolist()
+            data[state] = {self._city_names[i]: tuple(coords[i - start]) for i in range(start, end)}
+        self._nested = data
+        return data
+
+    # 🧭 Spatial queries
+
+    def _candidates(self, lat, lon, radius_km):
+        n_rows, n_cols = _grid_shape(self.cell_deg)
+        dlat = radius_km / _KM_PER_DEG
+        lat_lo, lat_hi = max(lat - dlat, -90.0), min(lat + dlat, 90.0)
+        cos_lat = math.cos(math.radians(max(abs(lat_lo), abs(lat_hi))))
+        if cos_lat < 1e-3 or dlat / cos_lat >= 180.0:
+            col_ranges = [(0, n_cols - 1)]
+        else:
+            dlon = dlat / cos_lat
+            _, (c0, c1) = _grid_rows_cols([lat, lat], [lon - dlon, lon + dlon], self.cell_deg)
+            col_ranges = [(c0, c1)] if c0 <= c1 else [(c0, n_cols - 1), (0, c1)]
+
+        (r0, r1), _ = _grid_rows_cols([lat_lo, lat_hi], [0.0, 0.0], self.cell_deg)
+        slices = []
+        for row in range(int(r0), int(r1) + 1):
+            for c0, c1 in col_ranges:
+                lo = np.searchsorted(self._grid_keys, row * n_cols + c0, side="left")
+                hi = np.searchsorted(self._grid_keys, row * n_cols + c1, side="right")
+                if hi > lo:
+                    slices.append(self._grid_order[lo:hi])
+        return np.concatenate(slices) if slices else np.empty(0, dtype=np.int64)
+
+    def _distances_km(self, rows, lat, lon):
+        pts = np.radians(self.coords[rows])
+        lat1, lon1 = math.radians(lat), math.radians(lon)
+        a = (np.sin((pts[:, 0] - lat1) / 2) ** 2
+             + math.cos(lat1) * np.cos(pts[:, 0]) * np.sin((pts[:, 1] - lon1) / 2) ** 2)
+        return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.minimum(a, 1.0)))
+
+    def _matches(self, rows, dist):
+        order = np.argsort(dist, kind="stable")
+        matches = []
+        for row, d in zip(rows[order], dist[order]):
+            state, city, lat, lon = self.record(int(row))
+            matches.append(GeoMatch(state, city, lat, lon, float(d)))
+        return matches
+
+    def within(self, lat, lon, radius_km):
+        """All cities within radius_km of (lat, lon), nearest first."""
+        rows = self._candidates(lat, lon, radius_km)
+        dist = self._distances_km(rows, lat, lon)
+        keep = dist <= radius_km
+        return self._matches(rows[keep], dist[keep])
+
+    def nearest(self, lat, lon, k=1):
+        """The k cities closest to (lat, lon), nearest first."""
+        k = min(k, len(self))
+        radius = self.cell_deg * _KM_PER_DEG
+        while True:
+            rows = self._candidates(lat, lon, radius)
+            dist = self._distances_km(rows, lat, lon)
+            inside = dist <= radius
+            # Everything within `radius` was scanned, so k hits inside it are exact
+            if inside.sum() >= k or radius >= _HALF_CIRCUMFERENCE_KM:
+                top = np.argsort(dist, kind="stable")[:k]
+                return self._matches(rows[top], dist[top])
+            radius *= 2
+
+
+@lru_cache(maxsize=8)
+def _open(csv_path, signature, cell_deg):
+    return Gazetteer(_ensure_compiled(csv_path, signature, cell_deg))
+
+
+def load_gazetteer(filepath=DEFAULT_CSV, cell_deg=GRID_CELL_DEG):
+    """Open the compiled gazetteer for a CSV, (re)building it if the CSV changed."""
+    csv_path = os.path.abspath(filepath)
+    return _open(csv_path, _source_signature(csv_path), cell_deg)
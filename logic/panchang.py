@@ -1,9 +1,7 @@
 import swisseph as swe
 import datetime
-
-# 📁 Setup
-swe.set_ephe_path('./data')  # Ensure ephemeris files (e.g., sepl_18.se1) are in ./data
-swe.set_sid_mode(swe.SIDM_LAHIRI)
+from logic.ephemeris import DEFAULT_CONTEXT
+from logic.solar_events import get_solar_events
 
 # ♈ Constants
 ZODIACS = ["Ari", "Tau", "Gem", "Can", "Leo", "Vir", "Lib", "Sco", "Sag", "Cap", "Aqu", "Pis"]
@@ -43,7 +41,7 @@ def jd_to_time(jd):
     s = int((((ut % 1) * 60) % 1) * 60)
     return f"{h:02d}:{m:02d}:{s:02d}"
 
-def get_panchang(date_str, time_str, lat, lon, tz_offset):
+def get_panchang(date_str, time_str, lat, lon, tz_offset, ctx=DEFAULT_CONTEXT):
     local_dt = datetime.datetime.strptime(f"{date_str} {time_str}", "%d-%m-%Y %H:%M")
     jd_local = swe.julday(local_dt.year, local_dt.month, local_dt.day,
                           local_dt.hour + local_dt.minute / 60.0)
@@ -51,12 +49,10 @@ def get_panchang(date_str, time_str, lat, lon, tz_offset):
     jd_utc = swe.julday(dt_utc.year, dt_utc.month, dt_utc.day,
                         dt_utc.hour + dt_utc.minute / 60.0)
 
-    # ☀️ Sun & 🌙 Moon Sidereal Longitudes
-    sun_long = swe.calc_ut(jd_local, swe.SUN)[0][0]
-    moon_long = swe.calc_ut(jd_local, swe.MOON)[0][0]
-    ayanamsa = swe.get_ayanamsa(jd_local)
-    sun_sidereal = mod360(sun_long - ayanamsa)
-    moon_sidereal = mod360(moon_long - ayanamsa)
+    # ☀️ Sun & 🌙 Moon Sidereal Longitudes at the UT instant
+    sun_sidereal = ctx.calc_ut(jd_utc, swe.SUN)[0][0]
+    moon_sidereal = ctx.calc_ut(jd_utc, swe.MOON)[0][0]
+    ayanamsa = ctx.ayanamsa_ut(jd_utc)
 
     # 🌓 Tithi
     diff = mod360(moon_sidereal - sun_sidereal)
@@ -72,53 +68,26 @@ def get_panchang(date_str, time_str, lat, lon, tz_offset):
     nak_name = NAKSHATRAS[nak_num]
     nak_pct_left = round((1 - nak_frac) * 100, 2)
 
-        # 🌅 Sunrise & Nakshatra at Sunrise
+    # 🌅 Sunrise, Sunset & Nakshatra at Sunrise (shared per-day solar cache)
+    # These belong to the Vedic day containing the instant: before sunrise that is the
+    # previous day's sunrise and sunset, not the next sunrise after the instant.
     try:
-        rs_flag = swe.CALC_RISE | swe.FLG_SWIEPH
-        sunrise_result = swe.rise_trans(jd_utc, swe.SUN, lon, lat, 0.0, rs_flag)
-        if sunrise_result[0] == 0:
-            sunrise_jd = sunrise_result[1]
-            sunrise_time = jd_to_time(sunrise_jd)
-            moon_at_sunrise = swe.calc_ut(sunrise_jd, swe.MOON)[0][0]
-            moon_sunrise_sidereal = mod360(moon_at_sunrise - swe.get_ayanamsa(sunrise_jd))
-            nak_sunrise_num = int(moon_sunrise_sidereal // (360 / 27))
-            nakshatra_at_sunrise = NAKSHATRAS[nak_sunrise_num]
-        else:
-            print("☀️ Sunrise error code:", sunrise_result[0])
-            sunrise_time = "N/A"
-            nakshatra_at_sunrise = "N/A"
+        solar = get_solar_events(jd_utc, lat, lon)
     except Exception as e:
-        print("☀️ Sunrise exception:", e)
+        print("☀️ Sunrise/Sunset exception:", e)
+        solar = {"sunrise": None, "sunset": None}
+
+    sunrise_jd = solar["sunrise"]
+    sunset_time = jd_to_time(solar["sunset"])
+    if sunrise_jd:
+        sunrise_time = jd_to_time(sunrise_jd)
+        moon_sunrise_sidereal = ctx.calc_ut(sunrise_jd, swe.MOON)[0][0]
+        nak_sunrise_num = int(moon_sunrise_sidereal // (360 / 27))
+        nakshatra_at_sunrise = NAKSHATRAS[nak_sunrise_num]
+    else:
         sunrise_time = "N/A"
         nakshatra_at_sunrise = "N/A"
 
-    # 🌇 Sunset
-    try:
-        ss_flag = swe.CALC_SET | swe.FLG_SWIEPH
-        sunset_result = swe.rise_trans(jd_utc, swe.SUN, lon, lat, 0.0, ss_flag)
-        if sunset_result[0] == 0:
-            sunset_jd = sunset_result[1]
-            sunset_time = jd_to_time(sunset_jd)
-        else:
-            print("🌇 Sunset error code:", sunset_result[0])
-            sunset_time = "N/A"
-    except Exception as e:
-        print("🌇 Sunset exception:", e)
-        sunset_time = "N/A"
-
-
-    # 🌇 Sunset
-    try:
-        set_result = swe.rise_trans(jd_utc, swe.SUN, lon, lat, rsmi=swe.CALC_SET | swe.FLG_SWIEPH)
-        if set_result[0] == 0:
-            sunset_jd = set_result[1]
-            sunset_time = jd_to_time(sunset_jd)
-        else:
-            sunset_time = "N/A"
-    except Exception as e:
-        print("🌇 Sunset error:", e)
-        sunset_time = "N/A"
-
     # 🧘 Yoga
     total = mod360(sun_sidereal + moon_sidereal)
     yoga_num = int(total // (360 / 27))
@@ -0,0 +1,255 @@
+# logic/rectification.py
+# Birth-time sensitivity map: every instant within birth +- N hours at which
+# a varga sign of the ascendant or of a planet changes.
+#
+# A varga sign only changes when the longitude crosses one of a fixed set of
+# boundaries (varga_engine.varga_boundaries), so each body is sampled
+# coarsely and the boundaries passed between samples are bracketed there
+# and root-found:
+#   - the ascendant every ASC_STEP_DAYS with logic.ascendant, refined for
+#     all brackets at once by vectorized bisection on the same evaluator
+#   - planets every PLANET_STEP_DAYS with the chart's own sidereal swe.calc,
+#     split at stations (Brent on the speed), then Brent on the longitude
+# Crossings are located to XTOL_DAYS. Gulika and Mandi are left out: they
+# stay fixed within a day or night portion and jump at its edges.
+#
+# The result is a SensitivityMap of change records (CHANGE_DTYPE) with the
+# signs at the window start; intervals() / rows() turn them into the
+# (body, varga, sign, start, end) table a UI shows, margins() says how far
+# the birth time can move either way before each placement changes.
+#
+#   python -m logic.rectification 17-05-1990 08:50 28.61 77.2 --hours 2 --vargas 9 10 30 60
+import math
+
+import numpy as np
+import swisseph as swe
+
+from logic.ascendant import ascendants
+from logic.astroniharEng import PLANETS
+from logic.chakras.varga_engine import varga_boundaries, varga_signs
+from logic.chart import ZODIAC_SIGNS
+from logic.ephemeris import DEFAULT_CONTEXT
+from logic.rootfind import bisect_many, brent
+
+RECTIFICATION_BODIES = ('Ascendant', 'Sun', 'Mon', 'Mer', 'Ven', 'Mar', 'Jup', 'Sat', 'Rah', 'Ket')
+DEFAULT_VARGAS = (1, 9, 10, 30, 60)
+BODY_CODES = {name: code for code, name in PLANETS.items()}
+
+ASC_STEP_DAYS = 2 / 1440            # the ascendant moves under 2° in 2 minutes
+PLANET_STEP_DAYS = 1 / 24
+XTOL_DAYS = 1e-7                    # ~0.01 s
+STATION_XTOL_DAYS = 1e-6
+
+CHANGE_DTYPE = np.dtype([
+    ("jd", "<f8"),          # UT Julian day
+    ("body", "u1"),         # index into RECTIFICATION_BODIES
+    ("varga", "u1"),        # division number (9 for D9)
+    ("before", "u1"),       # sign index before the change
+    ("after", "u1"),        # sign index from the change on
+])
+
+
+def _wrap(deg):
+    return (deg + 180.0) % 360.0 - 180.0
+
+
+def _grid(jd_start, jd_end, step):
+    return np.linspace(jd_start, jd_end, max(2, math.ceil((jd_end - jd_start) / step) + 1))
+
+
+def _crossings(lon, bounds):
+    """(sample interval, boundary number m) of every boundary passed between consecutive unwrapped samples."""
+    n = len(bounds)
+    passed = np.floor_divide(lon, 360.0).astype(np.int64) * n + np.searchsorted(bounds, np.mod(lon, 360.0), 'right')
+    lo = np.minimum(passed[:-1], passed[1:])
+    counts = np.abs(np.diff(passed))
+    interval = np.repeat(np.arange(len(counts)), counts)
+    m = np.repeat(lo, counts) + np.arange(len(interval)) - np.repeat(np.cumsum(counts) - counts, counts)
+    return interval, m
+
+
+def _targets(m, bounds):
+    return np.floor_divide(m, len(bounds)) * 360.0 + bounds[np.mod(m, len(bounds))]
+
+
+def _ascendant_crossings(jd_start, jd_end, lat, lon, bounds, ctx):
+    """(crossing jds, boundary numbers, rising) and the ascendant at jd_start."""
+    times = _grid(jd_start, jd_end, ASC_STEP_DAYS)
+    asc = np.unwrap(ascendants(times, lat, lon, ctx), period=360.0)
+    interval, m = _crossings(asc, bounds)
+    target = np.mod(_targets(m, bounds), 360.0)
+    jds = bisect_many(lambda t: _wrap(ascendants(t, lat, lon, ctx) - target),
+                      times[interval], times[interval + 1], xtol=XTOL_DAYS)
+    return jds, m, asc[interval + 1] > asc[interval], asc[0]
+
+
+def _planet_crossings(code, offset, jd_start, jd_end, bounds, ctx):
+    """As _ascendant_crossings for a planet on the chart's swe.calc convention (Ketu: Rahu + 180°)."""
+    def exact(t):
+        pos = ctx.calc(t, code, swe.FLG_SPEED)[0]
+        return pos[0] + offset, pos[3]
+
+    times = _grid(jd_start, jd_end, PLANET_STEP_DAYS)
+    samples = np.array([exact(t) for t in times.tolist()])
+    lon, speed = np.unwrap(samples[:, 0], period=360.0), samples[:, 1]
+
+    # 🔄 Split at stations so every piece is monotone
+    flips = np.nonzero(np.sign(speed[:-1]) * np.sign(speed[1:]) < 0)[0]
+    if len(flips):
+        station_t = [brent(lambda t: exact(t)[1], times[i], times[i + 1], STATION_XTOL_DAYS,
+                           fa=speed[i], fb=speed[i + 1]) for i in flips]
+        station_lon = lon[flips] + _wrap(np.array([exact(t)[0] for t in station_t]) - lon[flips])
+        times = np.insert(times, flips + 1, station_t)
+        lon = np.insert(lon, flips + 1, station_lon)
+
+    interval, m = _crossings(lon, bounds)
+    target = _targets(m, bounds)
+    jds = np.array([brent(lambda t, b=b: _wrap(exact(t)[0] - b), times[i], times[i + 1], XTOL_DAYS)
+                    for i, b in zip(interval.tolist(), target.tolist())])
+    return jds, m, lon[interval + 1] > lon[interval], lon[0]
+
+
+class SensitivityMap:
+    """
+    Varga sign changes of `bodies` between start_jd and end_jd around a
+    birth. `changes` are CHANGE_DTYPE records sorted by jd;
+    `start_signs[b, v]` is the sign of RECTIFICATION_BODIES[b] in
+    vargas[v] at start_jd.
+    """
+
+    def __init__(self, birth_jd, start_jd, end_jd, bodies, vargas, start_signs, changes):
+        self.birth_jd = birth_jd
+        self.start_jd = start_jd
+        self.end_jd = end_jd
+        self.bodies = tuple(bodies)
+        self.vargas = tuple(vargas)
+        self.start_signs = start_signs
+        self.changes = changes
+
+    def __len__(self):
+        return len(self.changes)
+
+    def changes_for(self, body, varga):
+        records = self.changes
+        return records[(records["body"] == RECTIFICATION_BODIES.index(body)) & (records["varga"] == varga)]
+
+    def intervals(self, body, varga):
+        """[(start jd, end jd, sign index)] covering the window for one body in one varga."""
+        records = self.changes_for(body, varga)
+        edges = [self.start_jd] + records["jd"].tolist() + [self.end_jd]
+        signs = [int(self.start_signs[RECTIFICATION_BODIES.index(body), self.vargas.index(varga)])]
+        signs += records["after"].tolist()
+        return list(zip(edges[:-1], edges[1:], signs))
+
+    def sign_at(self, body, varga, jd):
+        for start, end, sign in self.intervals(body, varga):
+            if start <= jd < end:
+                return sign
+        return None
+
+    def margins(self):
+        """
+        {(body, varga): (minutes before, minutes after)} the birth time can
+        move before the placement changes; None where no change falls
+        inside the window on that side.
+        """
+        out = {}
+        for body in self.bodies:
+            for varga in self.vargas:
+                jds = self.changes_for(body, varga)["jd"]
+                earlier = jds[jds <= self.birth_jd]
+                later = jds[jds > self.birth_jd]
+                out[(body, varga)] = (
+                    (self.birth_jd - earlier[-1]) * 1440 if len(earlier) else None,
+                    (later[0] - self.birth_jd) * 1440 if len(later) else None,
+                )
+        return out
+
+    def rows(self):
+        """Interval table: one dict per (body, varga, sign) stretch, offsets in minutes from birth."""
+        table = []
+        for body in self.bodies:
+            for varga in self.vargas:
+                for start, end, sign in self.intervals(body, varga):
+                    table.append({
+                        "body": body,
+                        "varga": f"D{varga}",
+                        "sign": ZODIAC_SIGNS[sign],
+                        "start": start,
+                        "end": end,
+                        "start_min": (start - self.birth_jd) * 1440,
+                        "end_min": (end - self.birth_jd) * 1440,
+                        "birth": start <= self.birth_jd < end,
+                    })
+        return table
+
+
+def sensitivity_map(dt_utc, lat, lon, hours=2.0, vargas=DEFAULT_VARGAS, bodies=RECTIFICATION_BODIES,
+                    ctx=DEFAULT_CONTEXT):
+    """SensitivityMap of a birth (dt_utc as for calculate_chart) over +- `hours`."""
+    vargas = tuple(int(n) for n in vargas)
+    birth_jd = swe.julday(dt_utc.year, dt_utc.month, dt_utc.day,
+                          dt_utc.hour + dt_utc.minute / 60 + dt_utc.second / 3600)
+    start_jd, end_jd = birth_jd - hours / 24, birth_jd + hours / 24
+    bounds, below, above = varga_boundaries(vargas)
+
+    start_signs = np.zeros((len(RECTIFICATION_BODIES), len(vargas)), dtype=np.uint8)
+    parts = []
+    for body in bodies:
+        if body == 'Ascendant':
+            jds, m, rising, start_lon = _ascendant_crossings(start_jd, end_jd, lat, lon, bounds, ctx)
+        else:
+            code = BODY_CODES['Rah' if body == 'Ket' else body]
+            jds, m, rising, start_lon = _planet_crossings(code, 180.0 if body == 'Ket' else 0.0,
+                                                          start_jd, end_jd, bounds, ctx)
+        b = RECTIFICATION_BODIES.index(body)
+        start_signs[b] = varga_signs(start_lon, vargas)
+
+        # 🎯 One record per varga whose sign differs across the crossed boundary
+        column = np.mod(m, len(bounds))
+        v, k = np.nonzero(below[:, column] != above[:, column])
+        records = np.empty(len(k), dtype=CHANGE_DTYPE)
+        records["jd"] = jds[k]
+        records["body"] = b
+        records["varga"] = np.array(vargas)[v]
+        records["before"] = np.where(rising[k], below[v, column[k]], above[v, column[k]])
+        records["after"] = np.where(rising[k], above[v, column[k]], below[v, column[k]])
+        parts.append(records)
+
+    changes = np.concatenate(parts) if parts else np.empty(0, dtype=CHANGE_DTYPE)
+    changes = changes[(changes["jd"] >= start_jd) & (changes["jd"] < end_jd)]
+    changes = changes[np.argsort(changes["jd"], kind="stable")]
+    return SensitivityMap(birth_jd, start_jd, end_jd, bodies, vargas, start_signs, changes)
+
+
+if __name__ == "__main__":
+    import argparse
+    import csv
+    import sys
+
+    from logic.astroniharEng import birth_datetime_utc
+
+    parser = argparse.ArgumentParser(description="How far the birth time can move before varga signs change")
+    parser.add_argument("date", help="dd-mm-yyyy")
+    parser.add_argument("time", help="IST, HH:MM or hh:mm AM/PM")
+    parser.add_argument("lat", type=float)
+    parser.add_argument("lon", type=float)
+    parser.add_argument("--hours", type=float, default=2.0, help="window either side of the birth")
+    parser.add_argument("--vargas", type=int, nargs="+", default=list(DEFAULT_VARGAS))
+    parser.add_argument("-o", "--output", help="write the interval table as CSV")
+    args = parser.parse_args()
+
+    smap = sensitivity_map(birth_datetime_utc(args.date, args.time), args.lat, args.lon, args.hours, args.vargas)
+    print(f"{len(smap)} sign changes within +-{args.hours} h")
+    print(f"{'body':<10}{'varga':>6}{'sign':>6}{'earlier (min)':>15}{'later (min)':>13}")
+    for (body, varga), (before, after) in sorted(smap.margins().items(),
+                                                 key=lambda item: min(x for x in item[1] + (math.inf,) if x is not None)):
+        sign = ZODIAC_SIGNS[smap.sign_at(body, varga, smap.birth_jd)]
+        before, after = ("-" if x is None else f"{x:.2f}" for x in (before, after))
+        print(f"{body:<10}{'D' + str(varga):>6}{sign:>6}{before:>15}{after:>13}")
+    if args.output:
+        with open(args.output, "w", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=list(smap.rows()[0]))
+            writer.writeheader()
+            writer.writerows(smap.rows())
+        print(f"intervals written to {args.output}", file=sys.stderr)
@@ -0,0 +1,398 @@
+# logic/research.py
+# Columnar research index over a chart collection, queried with vectorized masks.
+#
+# The index is a directory of .npy files, memory-mapped on load:
+#   ids.npy        (N,)     int64  chart ids (chart database ids)
+#   valid.npy      (N,)     bool   chart could be computed
+#   signs.npy      (V, B, N) int8  sign 0-11 of body B in varga V (-1: missing)
+#   nakshatra.npy  (B, N)   int8   nakshatra 0-26 (-1: missing)
+#   pada.npy       (B, N)   int8   pada 1-4 (0: missing)
+#   karaka.npy     (7, N)   int8   body slot holding AK, AmK, ... DK
+#   meta.json               bodies, vargas, count (written last)
+# Bodies use logic.chart.LONGITUDE_KEYS order; each (varga, body) column is
+# contiguous, so a predicate reads only the pages it needs.
+#
+# Query language (case-insensitive), e.g.
+#   Sat in Sco in D9 and Mon in Ashl
+#   (AK is Sat or AK is Jup) and not Mars in house 7
+#   Moon in Rohini pada 2 and Asc in Leo
+# Predicates:
+#   BODY in SIGN [in Dn]            sign placement (default D1)
+#   BODY in house N [in Dn]         house counted from that varga's ascendant
+#   BODY in NAKSHATRA [pada N]      birth-chart nakshatra / pada
+#   KARAKA is BODY  (or BODY is KARAKA)   Jaimini chara karakas
+# combined with and / or / not and parentheses.
+import json
+import os
+import re
+import shutil
+
+import numpy as np
+
+from logic.batch_charts import calculate_charts
+from logic.chakras.varga_engine import VARGA_DIVISIONS, varga_signs
+from logic.chart import LONGITUDE_KEYS, NAKSHATRA_SPAN, NAKSHATRAS, PADA_SPAN, SLOT, ZODIAC_SIGNS, stack_longitudes
+
+DEFAULT_DIR = os.path.join(os.path.expanduser("~"), ".rogahora", "research")
+FORMAT_VERSION = 1
+BUILD_CHUNK = 50_000
+
+KARAKAS = ['AK', 'AmK', 'BK', 'MK', 'PuK', 'GnK', 'DK']
+# Candidate order of logic.karakas.assign_karakas (ties keep this order)
+KARAKA_BODIES = ['Sun', 'Mon', 'Mer', 'Ven', 'Mar', 'Jup', 'Sat']
+_KARAKA_SLOTS = np.array([SLOT[body] for body in KARAKA_BODIES], dtype=np.intp)
+
+_BODY_ALIASES = {
+    "sun": "Sun", "su": "Sun",
+    "moon": "Mon", "mo": "Mon",
+    "mercury": "Mer", "me": "Mer",
+    "venus": "Ven", "ve": "Ven",
+    "mars": "Mar", "ma": "Mar",
+    "jupiter": "Jup", "ju": "Jup",
+    "saturn": "Sat", "sa": "Sat",
+    "rahu": "Rah", "ra": "Rah",
+    "ketu": "Ket", "ke": "Ket",
+    "asc": "Ascendant", "as": "Ascendant", "lagna": "Ascendant",
+    "gulika": "Gul", "gu": "Gul",
+    "mandi": "Man", "mn": "Man",
+}
+BODY_NAMES = {key.lower(): key for key in LONGITUDE_KEYS}
+BODY_NAMES.update(_BODY_ALIASES)
+
+SIGN_NAMES = {name.lower(): i for i, name in enumerate(ZODIAC_SIGNS)}
+SIGN_NAMES.update({name: i for i, name in enumerate([
+    "aries", "taurus", "gemini", "cancer", "leo", "virgo",
+    "libra", "scorpio", "sagittarius", "capricorn", "aquarius", "pisces"])})
+
+NAKSHATRA_NAMES = {name.lower(): i for i, name in enumerate(NAKSHATRAS)}
+NAKSHATRA_NAMES.update({name: i for i, name in enumerate([
+    "ashwini", "bharani", "krittika", "rohini", "mrigashira", "ardra", "punarvasu",
+    "pushya", "ashlesha", "magha", "purvaphalguni", "uttaraphalguni", "hasta",
+    "chitra", "swati", "vishakha", "anuradha", "jyeshtha", "mula", "purvashadha",
+    "uttarashadha", "shravana", "dhanishta", "shatabhisha", "purvabhadrapada",
+    "uttarabhadrapada", "revati"])})
+
+KARAKA_NAMES = {name.lower(): i for i, name in enumerate(KARAKAS)}
+
+
+class QueryError(ValueError):
+    pass
+
+
+# 🧮 Derived columns
+
+
+def derive_columns(longitudes, vargas=VARGA_DIVISIONS):
+    """
+    Research columns for an (N, B) longitude matrix (NaN = missing body).
+    Returns dict of signs (V, B, N), nakshatra (B, N), pada (B, N), karaka (7, N), valid (N,).
+    """
+    lon = np.asarray(longitudes, dtype=np.float64)
+    missing = np.isnan(lon)
+    filled = np.where(missing, 0.0, lon)
+
+    signs = varga_signs(filled.T, vargas)                  # (V, B, N)
+    signs[:, missing.T] = -1
+
+    nakshatra = ((filled % 360) // NAKSHATRA_SPAN).astype(np.int8).T
+    pada = ((filled % NAKSHATRA_SPAN) // PADA_SPAN + 1).astype(np.int8).T
+    nakshatra[missing.T] = -1
+    pada[missing.T] = 0
+
+    # Chara karakas: highest degree within the sign first (assign_karakas uses the 5-place degree)
+    degrees = np.round(filled[:, _KARAKA_SLOTS] % 30, 5)
+    order = np.argsort(-degrees, axis=1, kind="stable")
+    karaka = _KARAKA_SLOTS[order].T.astype(np.int8)     # (7, N)
+
+    valid = ~missing[:, SLOT["Ascendant"]]
+    return {"signs": signs, "nakshatra": nakshatra, "pada": pada, "karaka": karaka, "valid": valid}
+
+
+# 🏗️ Building
+
+
+def build_index(births, ids, out_dir=DEFAULT_DIR, workers=None, vargas=VARGA_DIVISIONS, progress=None,
+                mp_context=None):
+    """
+    Compute every birth ((dt_utc, lat, lon), or None when unusable) and write
+    the index to `out_dir`, replacing any previous one only when complete.
+    """
+    births = list(births)
+    n, b, v = len(births), len(LONGITUDE_KEYS), len(vargas)
+    tmp_dir = f"{out_dir}.tmp-{os.getpid()}"
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+    os.makedirs(tmp_dir)
+
+    def column(name, shape, dtype):
+        return np.lib.format.open_memmap(os.path.join(tmp_dir, f"{name}.npy"), mode="w+",
+                                         dtype=dtype, shape=shape)
+
+    np.save(os.path.join(tmp_dir, "ids.npy"), np.asarray(ids, dtype=np.int64))
+    out = {
+        "signs": column("signs", (v, b, n), np.int8),
+        "nakshatra": column("nakshatra", (b, n), np.int8),
+        "pada": column("pada", (b, n), np.int8),
+        "karaka": column("karaka", (len(KARAKAS), n), np.int8),
+        "valid": column("valid", (n,), np.bool_),
+    }
+
+    for start in range(0, n, BUILD_CHUNK):
+        chunk = births[start:start + BUILD_CHUNK]
+        usable = [i for i, birth in enumerate(chunk) if birth is not None]
+        charts = [None] * len(chunk)
+        computed = calculate_charts([chunk[i] for i in usable], workers=workers, compact=True, mp_context=mp_context)
+        for i, chart in zip(usable, computed):
+            charts[i] = chart
+        columns = derive_columns(stack_longitudes(charts), vargas)
+        stop = start + len(chunk)
+        for name, array in out.items():
+            array[..., start:stop] = columns[name]
+        if progress is not None:
+            progress(stop, n)
+
+    for array in out.values():
+        array.flush()
+    del out
+
+    # meta.json is written last and marks the build as complete
+    with open(os.path.join(tmp_dir, "meta.json"), "w", encoding="utf-8") as f:
+        json.dump({"version": FORMAT_VERSION, "count": n, "bodies": list(LONGITUDE_KEYS),
+                   "vargas": list(vargas)}, f)
+
+    old_dir = f"{out_dir}.old-{os.getpid()}"
+    if os.path.exists(out_dir):
+        os.replace(out_dir, old_dir)
+    os.replace(tmp_dir, out_dir)
+    shutil.rmtree(old_dir, ignore_errors=True)
+    return n
+
+
+def build_from_chart_db(db, out_dir=DEFAULT_DIR, workers=None, progress=None, mp_context=None):
+    """Index every record of a logic.chart_db.ChartDB."""
+    from logic.astroniharEng import birth_datetime_utc
+    from logic.gazetteer import load_gazetteer
+
+    gazetteer = load_gazetteer()
+    ids, births = [], []
+    for record in db.iter_records():
+        ids.append(record["id"])
+        try:
+            lat, lon = record["lat"], record["lon"]
+            if lat is None or lon is None:
+                lat, lon = gazetteer.lookup(record["state"], record["city"])
+            births.append((birth_datetime_utc(record["date"], f"{record['time']} {record['ampm']}"), lat, lon))
+        except (KeyError, ValueError) as e:
+            print(f"[ERROR] Research index: skipping chart {record['id']}: {e}")
+            births.append(None)
+    return build_index(births, ids, out_dir, workers=workers, progress=progress, mp_context=mp_context)
+
+
+# 🔍 Query language
+
+_TOKEN = re.compile(r"\s*(\(|\)|[A-Za-z0-9]+)")
+
+
+def tokenize(text):
+    tokens, pos = [], 0
+    text = text.strip()
+    while pos < len(text):
+        match = _TOKEN.match(text, pos)
+        if not match:
+            raise QueryError(f"Unexpected character {text[pos]!r} at position {pos}")
+        tokens.append(match.group(1))
+        pos = match.end()
+    return tokens
+
+
+class _Parser:
+    def __init__(self, tokens, vargas):
+        self.tokens = tokens
+        self.pos = 0
+        self.vargas = vargas
+
+    def peek(self):
+        return self.tokens[self.pos].lower() if self.pos < len(self.tokens) else None
+
+    def take(self, what="more"):
+        token = self.peek()
+        if token is None:
+            raise QueryError(f"Query ends early; expected {what}")
+        self.pos += 1
+        return token
+
+    def expect(self, word):
+        if self.take(f"'{word}'") != word:
+            raise QueryError(f"Expected '{word}' but found '{self.tokens[self.pos - 1]}'")
+
+    def parse(self):
+        if not self.tokens:
+            raise QueryError("Empty query")
+        node = self.or_expr()
+        if self.peek() is not None:
+            raise QueryError(f"Unexpected '{self.tokens[self.pos]}'")
+        return node
+
+    def or_expr(self):
+        node = self.and_expr()
+        while self.peek() == "or":
+            self.take()
+            node = ("or", node, self.and_expr())
+        return node
+
+    def and_expr(self):
+        node = self.not_expr()
+        while self.peek() == "and":
+            self.take()
+            node = ("and", node, self.not_expr())
+        return node
+
+    def not_expr(self):
+        if self.peek() == "not":
+            self.take()
+            return ("not", self.not_expr())
+        if self.peek() == "(":
+            self.take()
+            node = self.or_expr()
+            self.expect(")")
+            return node
+        return self.predicate()
+
+    def body(self, token):
+        if token not in BODY_NAMES:
+            raise QueryError(f"Unknown planet '{token}'")
+        return SLOT[BODY_NAMES[token]]
+
+    def number(self, what, low, high):
+        token = self.take(what)
+        if not token.isdigit() or not low <= int(token) <= high:
+            raise QueryError(f"{what.capitalize()} must be {low}-{high}, not '{token}'")
+        return int(token)
+
+    def varga(self):
+        if self.peek() != "in":
+            return 0 if 1 not in self.vargas else self.vargas.index(1)
+        self.take()
+        token = self.take("a varga such as D9")
+        if not re.fullmatch(r"d\d+", token) or int(token[1:]) not in self.vargas:
+            raise QueryError(f"Unknown varga '{token}'; known: {', '.join(f'D{n}' for n in self.vargas)}")
+        return self.vargas.index(int(token[1:]))
+
+    def predicate(self):
+        token = self.take("a planet or karaka")
+        if token in KARAKA_NAMES:
+            self.expect("is")
+            return ("karaka", KARAKA_NAMES[token], self.body(self.take("a planet")))
+
+        slot = self.body(token)
+        if self.peek() == "is":
+            self.take()
+            karaka = self.take("a karaka")
+            if karaka not in KARAKA_NAMES:
+                raise QueryError(f"Unknown karaka '{karaka}'")
+            return ("karaka", KARAKA_NAMES[karaka], slot)
+
+        self.expect("in")
+        target = self.take("a sign, nakshatra or 'house'")
+        if target == "house":
+            house = self.number("house", 1, 12)
+            return ("house", self.varga(), slot, house)
+        if target in SIGN_NAMES:
+            return ("sign", self.varga(), slot, SIGN_NAMES[target])
+        if target in NAKSHATRA_NAMES:
+            pada = None
+            if self.peek() == "pada":
+                self.take()
+                pada = self.number("pada", 1, 4)
+            return ("nakshatra", slot, NAKSHATRA_NAMES[target], pada)
+        raise QueryError(f"Unknown sign or nakshatra '{target}'")
+
+
+def parse_query(text, vargas=VARGA_DIVISIONS):
+    return _Parser(tokenize(text), list(vargas)).parse()
+
+
+class ResearchIndex:
+    def __init__(self, directory=DEFAULT_DIR):
+        with open(os.path.join(directory, "meta.json"), encoding="utf-8") as f:
+            self.meta = json.load(f)
+        if self.meta.get("version") != FORMAT_VERSION or self.meta["bodies"] != list(LONGITUDE_KEYS):
+            raise ValueError(f"Research index in {directory} has an old format; rebuild it")
+        self.directory = directory
+        self.vargas = self.meta["vargas"]
+        load = lambda name: np.load(os.path.join(directory, f"{name}.npy"), mmap_mode="r")
+        self.ids = load("ids")
+        self.valid = load("valid")
+        self.signs = load("signs")
+        self.nakshatra = load("nakshatra")
+        self.pada = load("pada")
+        self.karaka = load("karaka")
+
+    def __len__(self):
+        return len(self.ids)
+
+    def _mask(self, node):
+        kind = node[0]
+        if kind == "and":
+            return self._mask(node[1]) & self._mask(node[2])
+        if kind == "or":
+            return self._mask(node[1]) | self._mask(node[2])
+        if kind == "not":
+            return ~self._mask(node[1])
+        if kind == "sign":
+            _, v, slot, sign = node
+            return self.signs[v, slot] == sign
+        if kind == "house":
+            _, v, slot, house = node
+            signs = self.signs[v]
+            houses = (signs[slot].astype(np.int16) - signs[SLOT["Ascendant"]]) % 12 + 1
+            return (houses == house) & (signs[slot] >= 0)
+        if kind == "nakshatra":
+            _, slot, nakshatra, pada = node
+            mask = self.nakshatra[slot] == nakshatra
+            if pada is not None:
+                mask &= self.pada[slot] == pada
+            return mask
+        if kind == "karaka":
+            _, karaka, slot = node
+            return self.karaka[karaka] == slot
+        raise QueryError(f"Unknown node {kind}")
+
+    def mask(self, query):
+        node = parse_query(query, self.vargas) if isinstance(query, str) else query
+        return self._mask(node) & self.valid
+
+    def query(self, query):
+        """Chart ids matching the query, in index order."""
+        return np.asarray(self.ids[self.mask(query)])
+
+    def count(self, query):
+        return int(np.count_nonzero(self.mask(query)))
+
+
+def load_index(directory=DEFAULT_DIR):
+    """The research index in `directory`, or None when it has not been built."""
+    if not os.path.exists(os.path.join(directory, "meta.json")):
+        return None
+    return ResearchIndex(directory)
+
+
+if __name__ == "__main__":
+    # python -m logic.research build            index the chart database
+    # python -m logic.research "AK is Sat"      query the index
+    import sys
+    import time
+
+    if sys.argv[1] == "build":
+        from logic.chart_db import get_chart_db
+
+        started = time.perf_counter()
+        count = build_from_chart_db(get_chart_db())
+        print(f"Indexed {count} charts in {time.perf_counter() - started:.1f}s ({DEFAULT_DIR})")
+    else:
+        index = load_index()
+        if index is None:
+            sys.exit("No research index; run: python -m logic.research build")
+        started = time.perf_counter()
+        ids = index.query(" ".join(sys.argv[1:]))
+        print(f"{len(ids)} of {len(index)} charts match ({(time.perf_counter() - started) * 1000:.1f} ms)")
+        print(" ".join(str(i) for i in ids[:100]))
@@ -0,0 +1,205 @@
+# logic/result_cache.py
+# On-disk cache of computed chart and panchang payloads.
+#
+# Entries are keyed by a SHA-256 of the birth inputs plus the ayanamsa, house
+# system and ENGINE_VERSION, so any engine change misses the old entries
+# (which are purged when the cache is opened). SQLite in WAL mode lets the GUI,
+# headless workers and several app instances share one file; each thread gets
+# its own connection. When the stored payloads exceed the size limit the least
+# recently read entries are evicted.
+#
+# The hot path stays read-mostly: triggers keep the payload total in a
+# one-row table (no SUM over the cache per write), and a hit only refreshes
+# the entry's access time if it is older than TOUCH_INTERVAL_S, queued and
+# written TOUCH_BATCH at a time or with the next put.
+#
+#   ROGAHORA_CACHE=/path/cache.sqlite3   location (default ~/.rogahora/results.sqlite3)
+#   ROGAHORA_CACHE=off                   disable
+#   ROGAHORA_CACHE_MAX_MB=256            size limit
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+
+from logic.astroniharEng import get_astro_data
+from logic.ephemeris import AYANAMSA, ENGINE_VERSION, HOUSE_SYSTEM
+from logic.panchangWrapper import prepare_panchang_payload
+
+ENV_PATH = "ROGAHORA_CACHE"
+ENV_MAX_MB = "ROGAHORA_CACHE_MAX_MB"
+DEFAULT_PATH = os.path.join(os.path.expanduser("~"), ".rogahora", "results.sqlite3")
+DEFAULT_MAX_MB = 256
+BUSY_TIMEOUT_MS = 5000
+TOUCH_INTERVAL_S = 3600         # access times are LRU-accurate to this
+TOUCH_BATCH = 64
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    key      TEXT PRIMARY KEY,
+    kind     TEXT NOT NULL,
+    engine   TEXT NOT NULL,
+    value    TEXT NOT NULL,
+    size     INTEGER NOT NULL,
+    accessed REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS results_accessed ON results(accessed);
+CREATE INDEX IF NOT EXISTS results_engine ON results(engine);
+CREATE TABLE IF NOT EXISTS totals (
+    id    INTEGER PRIMARY KEY CHECK (id = 0),
+    bytes INTEGER NOT NULL
+);
+CREATE TRIGGER IF NOT EXISTS results_added AFTER INSERT ON results
+BEGIN UPDATE totals SET bytes = bytes + NEW.size WHERE id = 0; END;
+CREATE TRIGGER IF NOT EXISTS results_removed AFTER DELETE ON results
+BEGIN UPDATE totals SET bytes = bytes - OLD.size WHERE id = 0; END;
+INSERT OR IGNORE INTO totals (id, bytes) SELECT 0, COALESCE(SUM(size), 0) FROM results;
+"""
+
+
+def cache_key(kind, *fields):
+    payload = json.dumps([kind, AYANAMSA, HOUSE_SYSTEM, ENGINE_VERSION, *fields], separators=(",", ":"))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class ResultCache:
+    def __init__(self, path=DEFAULT_PATH, max_bytes=DEFAULT_MAX_MB * 1024 * 1024):
+        self.path = path
+        self.max_bytes = max_bytes
+        self._local = threading.local()
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with self._connect() as db:
+            # Results of other engine versions can never be hit again
+            db.execute("DELETE FROM results WHERE engine != ?", (ENGINE_VERSION,))
+
+    def _connect(self):
+        # One connection per thread and process (connections must not cross a fork)
+        db = getattr(self._local, "db", None)
+        if db is None or self._local.pid != os.getpid():
+            db = sqlite3.connect(self.path, timeout=BUSY_TIMEOUT_MS / 1000)
+            db.execute(f"PRAGMA busy_timeout = {BUSY_TIMEOUT_MS}")
+            db.execute("PRAGMA journal_mode = WAL")
+            db.execute("PRAGMA synchronous = NORMAL")
+            # REPLACE deletes the old row; the size trigger must see that
+            db.execute("PRAGMA recursive_triggers = ON")
+            # Schema and the seeded total in one transaction, so no insert slips between them
+            db.executescript("BEGIN IMMEDIATE;" + _SCHEMA + "COMMIT;")
+            self._local.db = db
+            self._local.pid = os.getpid()
+            self._local.touched = {}
+        return db
+
+    def get(self, key):
+        db = self._connect()
+        row = db.execute("SELECT value, accessed FROM results WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        now = time.time()
+        if now - row[1] > TOUCH_INTERVAL_S:
+            touched = self._local.touched
+            touched[key] = now
+            if len(touched) >= TOUCH_BATCH:
+                with db:
+                    self._flush_touched(db)
+        return json.loads(row[0])
+
+    def _flush_touched(self, db):
+        touched = self._local.touched
+        if touched:
+            db.executemany("UPDATE results SET accessed = ? WHERE key = ?",
+                           [(accessed, key) for key, accessed in touched.items()])
+            touched.clear()
+
+    def put(self, key, kind, value):
+        text = json.dumps(value, ensure_ascii=False)
+        db = self._connect()
+        with db:
+            self._flush_touched(db)
+            db.execute("INSERT OR REPLACE INTO results (key, kind, engine, value, size, accessed) "
+                       "VALUES (?, ?, ?, ?, ?, ?)",
+                       (key, kind, ENGINE_VERSION, text, len(text), time.time()))
+            self._evict(db)
+
+    def _evict(self, db):
+        total = db.execute("SELECT bytes FROM totals WHERE id = 0").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        # Drop least recently used entries until ~10% below the limit
+        excess = total - int(self.max_bytes * 0.9)
+        db.execute("""
+            DELETE FROM results WHERE key IN (
+                SELECT key FROM (
+                    SELECT key, size, SUM(size) OVER (ORDER BY accessed, key) AS running FROM results
+                ) WHERE running - size < ?
+            )""", (excess,))
+
+    def get_or_compute(self, kind, fields, compute):
+        """Cached result of compute() for these inputs; None results are not stored."""
+        key = cache_key(kind, *fields)
+        try:
+            value = self.get(key)
+        except sqlite3.Error as e:
+            print(f"[ERROR] Result cache read failed: {e}")
+            return compute()
+        if value is not None:
+            return value
+        value = compute()
+        if value is not None:
+            try:
+                self.put(key, kind, value)
+            except sqlite3.Error as e:
+                print(f"[ERROR] Result cache write failed: {e}")
+        return value
+
+    def stats(self):
+        db = self._connect()
+        count = db.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+        total = db.execute("SELECT bytes FROM totals WHERE id = 0").fetchone()[0]
+        return {"path": self.path, "entries": count, "bytes": total, "max_bytes": self.max_bytes}
+
+    def clear(self):
+        with self._connect() as db:
+            db.execute("DELETE FROM results")
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_result_cache():
+    """Process-wide cache from the environment settings, or None when disabled or unusable."""
+    global _cache
+    setting = os.environ.get(ENV_PATH, "").strip()
+    if setting.lower() in ("off", "0", "false", "no"):
+        return None
+    path = setting or DEFAULT_PATH
+    with _cache_lock:
+        if _cache is None or _cache.path != path:
+            max_mb = float(os.environ.get(ENV_MAX_MB, DEFAULT_MAX_MB))
+            try:
+                _cache = ResultCache(path, int(max_mb * 1024 * 1024))
+            except (sqlite3.Error, OSError) as e:
+                print(f"[ERROR] Result cache unavailable ({path}): {e}")
+                return None
+        return _cache
+
+
+# ✅ Cached versions of the GUI entry points
+
+
+def cached_astro_data(date_str, time_str, lat, lon, tz_offset=5.5):
+    cache = get_result_cache()
+    if cache is None:
+        return get_astro_data(date_str, time_str, lat, lon, tz_offset)
+    fields = (date_str, time_str.strip().upper(), float(lat), float(lon), float(tz_offset))
+    return cache.get_or_compute("astro", fields, lambda: get_astro_data(date_str, time_str, lat, lon, tz_offset))
+
+
+def cached_panchang_payload(date_str, time_str, ampm, lat, lon, tz_offset=5.5):
+    cache = get_result_cache()
+    if cache is None:
+        return prepare_panchang_payload(date_str, time_str, ampm, lat, lon, tz_offset)
+    fields = (date_str, time_str.strip(), ampm, float(lat), float(lon), float(tz_offset))
+    return cache.get_or_compute("panchang", fields,
+                                lambda: prepare_panchang_payload(date_str, time_str, ampm, lat, lon, tz_offset))
@@ -0,0 +1,166 @@
+# logic/rhd_batch.py
+# Headless .rhd -> NDJSON/CSV pipeline. Nothing here (or below it) imports PyQt5.
+import csv
+import json
+import multiprocessing
+import os
+import sys
+from functools import partial
+
+from logic.astroniharEng import configure_ephemeris
+from logic.batch_charts import imap_ordered
+from logic.geo_lookup import load_city_data
+from logic.result_cache import cached_astro_data, cached_panchang_payload
+from logic.rhd_file import RHD_FIELDS, iter_rhd_paths, load_rhd
+
+CHART_BODIES = ["Asc", "Sun", "Mon", "Mer", "Ven", "Mar", "Jup", "Sat", "Rah", "Ket", "Gul", "Man"]
+BODY_FIELDS = ["zodiac", "degree", "nakshatra", "pada"]
+PANCHANG_FIELDS = [
+    "tithi", "paksha", "nakshatra", "nakshatra_at_sunrise", "yoga", "karana",
+    "weekday", "hora_lord", "mahakala_hora", "kaala_lord", "sunrise", "sunset",
+    "ayanamsa", "sidereal_time"
+]
+CSV_COLUMNS = (["file"] + RHD_FIELDS + ["lat", "lon"]
+               + [f"{body}_{field}" for body in CHART_BODIES for field in BODY_FIELDS]
+               + [f"panchang_{field}" for field in PANCHANG_FIELDS])
+
+
+def _init_worker():
+    configure_ephemeris()
+    if multiprocessing.parent_process() is not None:
+        # Engine diagnostics are printed; keep them off the parent's stdout
+        sys.stdout = sys.stderr
+
+
+def process_rhd(path, tz_offset=5.5):
+    """
+    Compute one .rhd file. Returns {"file", "ok", ...}: the birth data plus
+    "astro"/"panchang" on success, or "stage"/"error" describing the failure.
+    """
+    record = {"file": path}
+    stage = "read"
+    try:
+        user_data = load_rhd(path)
+        record.update({field: user_data[field] for field in RHD_FIELDS})
+
+        stage = "city"
+        try:
+            lat, lon = load_city_data()[user_data["state"]][user_data["city"]]
+        except KeyError:
+            raise ValueError(f"unknown city {user_data['state']} / {user_data['city']}")
+        record.update({"lat": lat, "lon": lon})
+
+        stage = "astro"
+        full_time = f"{user_data['time']} {user_data['ampm']}"
+        astro = cached_astro_data(user_data["date"], full_time, lat, lon, tz_offset)
+        if astro is None:
+            raise ValueError("chart calculation failed")
+
+        stage = "panchang"
+        panchang = cached_panchang_payload(user_data["date"], user_data["time"], user_data["ampm"],
+                                           lat, lon, tz_offset)
+        record.update({"ok": True, "astro": astro, "panchang": panchang})
+    except Exception as e:
+        record.update({"ok": False, "stage": stage, "error": f"{type(e).__name__}: {e}"})
+    return record
+
+
+def iter_results(paths, workers=None, chunksize=16, tz_offset=5.5):
+    """Process .rhd paths across worker processes, yielding records in input order."""
+    return imap_ordered(partial(process_rhd, tz_offset=tz_offset), paths, workers=workers,
+                        chunksize=chunksize, initializer=_init_worker)
+
+
+def flatten_record(record):
+    row = {field: record.get(field, "") for field in ["file"] + RHD_FIELDS + ["lat", "lon"]}
+    astro = record.get("astro") or {}
+    bodies = dict(astro.get("planets", {}))
+    bodies["Asc"] = astro.get("ascendant", {})
+    for body in CHART_BODIES:
+        for field in BODY_FIELDS:
+            row[f"{body}_{field}"] = bodies.get(body, {}).get(field, "")
+    panchang = record.get("panchang") or {}
+    for field in PANCHANG_FIELDS:
+        row[f"panchang_{field}"] = panchang.get(field, "")
+    return row
+
+
+class ResultWriter:
+    """Appends records to an NDJSON or CSV file, flushing after each one."""
+
+    def __init__(self, path, fmt):
+        self.fmt = fmt
+        new_file = not os.path.exists(path) or os.path.getsize(path) == 0
+        self.f = open(path, "a", newline="", encoding="utf-8")
+        if fmt == "csv":
+            self.csv = csv.DictWriter(self.f, fieldnames=CSV_COLUMNS)
+            if new_file:
+                self.csv.writeheader()
+
+    def write(self, record):
+        if self.fmt == "csv":
+            self.csv.writerow(flatten_record(record))
+        else:
+            self.f.write(json.dumps(record, ensure_ascii=False) + "\n")
+        self.f.flush()
+
+    def close(self):
+        self.f.close()
+
+
+def load_checkpoint(path):
+    if not path or not os.path.exists(path):
+        return set()
+    with open(path, encoding="utf-8") as f:
+        return {line.rstrip("\n") for line in f if line.strip()}
+
+
+def run_batch(inputs, output, fmt="ndjson", errors_path=None, checkpoint_path=None,
+              resume=False, workers=None, tz_offset=5.5):
+    """
+    Stream every .rhd under `inputs` into `output`. Successful files are
+    appended to the checkpoint after their row is written, so `resume=True`
+    skips them on the next run (failed files are retried). Returns (ok, failed, skipped).
+    """
+    done = load_checkpoint(checkpoint_path) if resume else set()
+    skipped = 0
+
+    def pending_paths():
+        nonlocal skipped
+        for path in iter_rhd_paths(inputs):
+            if path in done:
+                skipped += 1
+            else:
+                yield path
+
+    if not resume:
+        for path in (output, errors_path, checkpoint_path):
+            if path and os.path.exists(path):
+                os.remove(path)
+
+    writer = ResultWriter(output, fmt)
+    errors = open(errors_path, "a", encoding="utf-8") if errors_path else None
+    checkpoint = open(checkpoint_path, "a", encoding="utf-8") if checkpoint_path else None
+    ok = failed = 0
+    try:
+        for record in iter_results(pending_paths(), workers=workers, tz_offset=tz_offset):
+            if record["ok"]:
+                writer.write(record)
+                ok += 1
+                if checkpoint:
+                    checkpoint.write(record["file"] + "\n")
+                    checkpoint.flush()
+            else:
+                failed += 1
+                report = {key: record[key] for key in ("file", "stage", "error")}
+                if errors:
+                    errors.write(json.dumps(report, ensure_ascii=False) + "\n")
+                    errors.flush()
+                else:
+                    print(f"[ERROR] {report['file']}: {report['stage']}: {report['error']}", file=sys.stderr)
+    finally:
+        writer.close()
+        for f in (errors, checkpoint):
+            if f:
+                f.close()
+    return ok, failed, skipped
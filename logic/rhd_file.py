@@ -0,0 +1,36 @@
+# logic/rhd_file.py
+import fnmatch
+import glob
+import json
+import os
+
+# Fields of a RogaHora Data (.rhd) file, as written by StartForm.save_user_data
+RHD_FIELDS = ["first_name", "last_name", "date", "time", "ampm", "state", "city"]
+
+
+def load_rhd(path):
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    missing = [field for field in RHD_FIELDS if field not in data]
+    if missing:
+        raise ValueError(f"missing field(s): {', '.join(missing)}")
+    return data
+
+
+def save_rhd(path, data):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({field: data[field] for field in RHD_FIELDS}, f)
+
+
+def iter_rhd_paths(inputs):
+    """Expand directories (recursively) and glob patterns into .rhd paths, in a stable order."""
+    for entry in inputs:
+        if os.path.isdir(entry):
+            for root, dirs, files in os.walk(entry):
+                dirs.sort()
+                for name in sorted(fnmatch.filter(files, "*.rhd")):
+                    yield os.path.join(root, name)
+        elif glob.has_magic(entry):
+            yield from sorted(glob.glob(entry, recursive=True))
+        else:
+            yield entry
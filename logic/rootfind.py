@@ -0,0 +1,82 @@
+# logic/rootfind.py
+# Bracketed root finding shared by the event and almanac searches.
+#
+# brent() refines a single bracket (callers pass functions backed by direct
+# ephemeris calls); bisect_many() refines many brackets at once with numpy,
+# for vectorized functions such as the transit interpolants.
+import numpy as np
+
+
+def brent(f, a, b, xtol=1e-9, maxiter=100, fa=None, fb=None):
+    """
+    Root of f in [a, b] by Brent's method; f(a) and f(b) must differ in sign
+    (or one be zero). Returns x with |error| <= xtol. Raises ValueError if
+    the interval does not bracket a root.
+    """
+    fa = f(a) if fa is None else fa
+    fb = f(b) if fb is None else fb
+    if fa == 0:
+        return a
+    if fb == 0:
+        return b
+    if (fa > 0) == (fb > 0):
+        raise ValueError(f"root not bracketed: f({a})={fa}, f({b})={fb}")
+    if abs(fa) < abs(fb):
+        a, b, fa, fb = b, a, fb, fa
+    c, fc = a, fa
+    d = e = b - a
+    for _ in range(maxiter):
+        if fb == 0:
+            return b
+        if (fb > 0) == (fc > 0):
+            c, fc = a, fa
+            d = e = b - a
+        if abs(fc) < abs(fb):
+            a, b, c = b, c, b
+            fa, fb, fc = fb, fc, fb
+        tol = 2e-16 * abs(b) + 0.5 * xtol
+        m = 0.5 * (c - b)
+        if abs(m) <= tol:
+            return b
+        if abs(e) >= tol and abs(fa) > abs(fb):
+            # Inverse quadratic interpolation (secant when only two points differ)
+            s = fb / fa
+            if a == c:
+                p, q = 2 * m * s, 1 - s
+            else:
+                q, r = fa / fc, fb / fc
+                p = s * (2 * m * q * (q - r) - (b - a) * (r - 1))
+                q = (q - 1) * (r - 1) * (s - 1)
+            if p > 0:
+                q = -q
+            p = abs(p)
+            if 2 * p < min(3 * m * q - abs(tol * q), abs(e * q)):
+                e, d = d, p / q
+            else:
+                d = e = m
+        else:
+            d = e = m
+        a, fa = b, fb
+        b += d if abs(d) > tol else (tol if m > 0 else -tol)
+        fb = f(b)
+    return b
+
+
+def bisect_many(f, lo, hi, xtol=1e-9):
+    """
+    Roots of a vectorized f in each bracket [lo[i], hi[i]] by simultaneous
+    bisection. `f(x)` gets an array the shape of `lo`; each bracket must
+    contain a sign change. Returns the array of midpoints after convergence.
+    """
+    lo = np.array(lo, dtype=np.float64)
+    hi = np.array(hi, dtype=np.float64)
+    if lo.size == 0:
+        return lo
+    lo_positive = f(lo) > 0
+    iterations = int(np.ceil(np.log2(max(float(np.max(hi - lo)), xtol) / xtol))) + 1
+    for _ in range(iterations):
+        mid = 0.5 * (lo + hi)
+        same = (f(mid) > 0) == lo_positive
+        lo = np.where(same, mid, lo)
+        hi = np.where(same, hi, mid)
+    return 0.5 * (lo + hi)
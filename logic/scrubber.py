@@ -0,0 +1,108 @@
+# logic/scrubber.py
+# Birth-time scrubbing: chart positions for any instant in birth +- N hours
+# from trajectories computed once for the window.
+#
+# Planets (and Rahu) are sampled with the chart's own sidereal swe.calc
+# every PLANET_STEP_DAYS with speeds and evaluated by cubic Hermite
+# interpolation (logic.transits.hermite) and the ascendant is evaluated at
+# each step from one logic.ascendant.AscendantTrack for the window; both
+# stay within 0.01" of calculate_chart. Gulika and Mandi only change
+# between day/night portions, so they are recomputed once per portion. A
+# step is then a few numpy lookups plus the varga engine, and
+# changed_houses() lists the chart houses whose contents differ from the
+# previous step, so a view only redraws those.
+import datetime
+import math
+from array import array
+
+import numpy as np
+import swisseph as swe
+
+from logic.ascendant import AscendantTrack
+from logic.astroniharEng import PLANETS
+from logic.chakras import vargas
+from logic.chart import ASC, LONGITUDE_KEYS, SLOT, Chart
+from logic.ephemeris import DEFAULT_CONTEXT
+from logic.solar_events import get_solar_events
+from logic.transits import hermite
+from logic.upagrahas import time_upagrahas
+
+PLANET_STEP_DAYS = 1 / 24
+DEFAULT_HOURS = 3.0
+
+
+class BirthTimeScrubber:
+    """
+    Positions of one birth (dt_utc, lat, lon as for calculate_chart) at
+    `minutes` from the birth time, for |minutes| <= hours * 60.
+    """
+
+    def __init__(self, dt_utc, lat, lon, hours=DEFAULT_HOURS, ctx=DEFAULT_CONTEXT):
+        self.dt_utc = dt_utc
+        self.lat = lat
+        self.lon = lon
+        self.hours = hours
+        self.ctx = ctx
+        self.birth_jd = swe.julday(dt_utc.year, dt_utc.month, dt_utc.day,
+                                   dt_utc.hour + dt_utc.minute / 60 + dt_utc.second / 3600)
+        start, end = self.birth_jd - hours / 24, self.birth_jd + hours / 24
+
+        # 🔭 Planet samples: (T,) times, (T, bodies) unwrapped longitudes and speeds
+        self.codes = list(PLANETS.items())
+        self.times = np.linspace(start, end, max(2, math.ceil((end - start) / PLANET_STEP_DAYS) + 1))
+        samples = np.array([[ctx.calc(t, code, swe.FLG_SPEED)[0] for code, _ in self.codes]
+                            for t in self.times.tolist()])
+        self.planet_lon = np.unwrap(samples[:, :, 0], period=360.0, axis=0)
+        self.planet_speed = samples[:, :, 3]
+        self.slots = np.array([SLOT[name] for _, name in self.codes])
+
+        self.ascendant = AscendantTrack(start, end, lat, lon, ctx)
+
+        self._portion = None        # (start jd, end jd, Gulika, Mandi) of the last portion used
+
+    def jd_at(self, minutes):
+        return self.birth_jd + minutes / 1440
+
+    def _gulika_mandi(self, jd):
+        portion = self._portion
+        if portion is None or not portion[0] <= jd < portion[1]:
+            solar = get_solar_events(jd, self.lat, self.lon)
+            upagrahas = time_upagrahas(jd, self.lat, self.lon, self.ctx)
+            if upagrahas is None:
+                portion = (-math.inf, math.inf, math.nan, math.nan)
+            else:
+                night = jd >= solar["sunset"]
+                start = solar["sunset"] if night else solar["sunrise"]
+                end = solar["next_sunrise"] if night else solar["sunset"]
+                portion = (start, end, upagrahas["Gulika"], upagrahas["Mandi"])
+            self._portion = portion
+        return portion[2], portion[3]
+
+    def longitudes(self, minutes):
+        """array('d') of absolute longitudes in LONGITUDE_KEYS order at `minutes` from birth."""
+        jd = self.jd_at(minutes)
+        out = np.full(len(LONGITUDE_KEYS), np.nan)
+        out[self.slots] = np.mod(hermite(jd, self.times, self.planet_lon, self.planet_speed)[0], 360.0)
+        out[SLOT['Ket']] = (out[SLOT['Rah']] + 180.0) % 360.0
+        out[ASC] = self.ascendant(jd)
+        out[SLOT['Gul']], out[SLOT['Man']] = self._gulika_mandi(jd)
+        return array('d', out.tolist())
+
+    def chart(self, minutes):
+        """logic.chart.Chart at `minutes` from birth."""
+        return Chart(self.dt_utc + datetime.timedelta(minutes=minutes), self.lat, self.lon, self.longitudes(minutes))
+
+    def varga_charts(self, minutes, divisions=vargas.DISPLAY_VARGAS):
+        """{"D9": house dict, ...} as vargas.get_varga_charts at `minutes` from birth."""
+        return vargas.get_varga_charts(self.chart(minutes).planets_raw, divisions)
+
+
+def changed_houses(previous, current):
+    """[(varga key, house, house dict)] of houses whose zodiac or planets differ between two varga_charts results."""
+    changes = []
+    for key, chart in current.items():
+        before = previous.get(key) if previous else None
+        for house, content in chart.items():
+            if before is None or before[house] != content:
+                changes.append((key, house, content))
+    return changes
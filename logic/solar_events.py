@@ -0,0 +1,68 @@
+# logic/solar_events.py
+import math
+from functools import lru_cache
+
+import swisseph as swe
+
+from logic.ephemeris import ensure_ephemeris
+
+SOLAR_CACHE_SIZE = 4096
+
+
+def _next_event(jd_start, lat, lon, rsmi):
+    res, tret = swe.rise_trans(jd_start, swe.SUN, rsmi, (lon, lat, 0.0), flags=swe.FLG_SWIEPH)
+    return tret[0] if res == 0 else None
+
+
+def local_day_number(jd_utc, lon):
+    """Civil day (JD at local mean noon) that contains jd_utc at longitude lon."""
+    return math.floor(jd_utc + 0.5 + lon / 360.0)
+
+
+@lru_cache(maxsize=SOLAR_CACHE_SIZE)
+def _solar_day(day, lat, lon):
+    ensure_ephemeris()
+    # Search from local mean midnight so the first sunrise found is the one of this day
+    sunrise = _next_event(day - 0.5 - lon / 360.0, lat, lon, swe.CALC_RISE)
+    if sunrise is None:
+        return {"sunrise": None, "sunset": None, "next_sunrise": None,
+                "day_length": None, "night_length": None}
+
+    sunset = _next_event(sunrise, lat, lon, swe.CALC_SET)
+    next_sunrise = _next_event(sunset, lat, lon, swe.CALC_RISE) if sunset else None
+    return {
+        "sunrise": sunrise,
+        "sunset": sunset,
+        "next_sunrise": next_sunrise,
+        "day_length": sunset - sunrise if sunset else None,
+        "night_length": next_sunrise - sunset if next_sunrise else None,
+    }
+
+
+def get_solar_day(day, lat, lon):
+    """
+    Sunrise, sunset, next sunrise (UT Julian days) and day/night lengths (days)
+    for civil `day` (see local_day_number). Values are None when the Sun does
+    not rise or set there (polar day/night).
+    """
+    return dict(_solar_day(int(day), float(lat), float(lon)))
+
+
+def get_solar_events(jd_utc, lat, lon):
+    """
+    Solar events of the Vedic day (sunrise to next sunrise) containing jd_utc.
+    An instant before the day's sunrise belongs to the previous day.
+    """
+    day = local_day_number(jd_utc, lon)
+    events = get_solar_day(day, lat, lon)
+    if events["sunrise"] is not None and jd_utc < events["sunrise"]:
+        events = get_solar_day(day - 1, lat, lon)
+    return events
+
+
+def solar_cache_info():
+    return _solar_day.cache_info()
+
+
+def clear_solar_cache():
+    _solar_day.cache_clear()
@@ -0,0 +1,127 @@
+# logic/upagrahas.py
+# Upagrahas (shadow planets) of a birth.
+#
+# Sun-derived (Parashara): Dhuma = Sun + 133°20', Vyatipata = 360° - Dhuma,
+# Parivesha = Vyatipata + 180°, Indrachapa = 360° - Parivesha,
+# Upaketu = Indrachapa + 16°40'.
+#
+# Time-based (Kaladi): daytime (sunrise to sunset) and night (sunset to next
+# sunrise) are each split into eight equal portions. Day portions are ruled
+# from the weekday lord in weekday order, night portions from the fifth lord
+# after it; the eighth portion has no lord. Kala (Sun), Mrityu (Mars),
+# Ardhaprahara (Mercury), Yamaghantaka (Jupiter) and Gulika (Saturn) are the
+# ascendant at the start of their lord's portion; Mandi is the ascendant at
+# the start of the portion before Gulika's. A birth between sunrise and
+# sunset uses the day portions, otherwise the night portions.
+#
+# One solar-day record (shared cache) gives all 16 portion start times, and
+# their ascendants come from one pass: sidereal time is linear in UT over
+# the day, so a single swe.sidtime, one obliquity and one ayanamsa call cover
+# every portion (within 1.5" of swe.houses_ex). The pass is tropical; the
+# ayanamsa is subtracted last, so several ayanamsas can share it.
+import math
+
+import swisseph as swe
+
+from logic.ephemeris import DEFAULT_CONTEXT
+from logic.solar_events import get_solar_events, local_day_number
+
+WEEKDAY_LORDS = ['Sun', 'Mon', 'Mar', 'Mer', 'Jup', 'Ven', 'Sat']   # Sunday = 0
+KALADI = {'Kala': 'Sun', 'Mrityu': 'Mar', 'Ardhaprahara': 'Mer', 'Yamaghantaka': 'Jup', 'Gulika': 'Sat'}
+TIME_UPAGRAHAS = list(KALADI) + ['Mandi']
+SUN_UPAGRAHAS = ['Dhuma', 'Vyatipata', 'Parivesha', 'Indrachapa', 'Upaketu']
+SIDEREAL_RATE = 360.98564736629     # degrees of sidereal time per UT day
+_RATE = math.radians(SIDEREAL_RATE)
+
+
+def sun_upagrahas(sun_lon):
+    """{name: sidereal longitude} of the five Sun-derived upagrahas."""
+    dhuma = (sun_lon + 133 + 1 / 3) % 360
+    vyatipata = (360 - dhuma) % 360
+    parivesha = (vyatipata + 180) % 360
+    indrachapa = (360 - parivesha) % 360
+    upaketu = (indrachapa + 16 + 2 / 3) % 360
+    return {'Dhuma': dhuma, 'Vyatipata': vyatipata, 'Parivesha': parivesha,
+            'Indrachapa': indrachapa, 'Upaketu': upaketu}
+
+
+def portion_lords(weekday, night):
+    """Lords of the eight portions (None for the eighth) of the day or night."""
+    first = (weekday + 4) % 7 if night else weekday
+    return [WEEKDAY_LORDS[(first + i) % 7] for i in range(7)] + [None]
+
+
+def tropical_portion_ascendants(solar, lat, lon):
+    """
+    Tropical (true equinox of date) ascendants at the starts of the 8 day
+    then 8 night portions of a solar-day record. Sidereal time is advanced
+    linearly from one swe.sidtime at sunrise, with one obliquity call;
+    plain floats beat numpy at 16 points.
+    """
+    sunrise, sunset, next_sunrise = solar["sunrise"], solar["sunset"], solar["next_sunrise"]
+    obliquity = math.radians(swe.calc_ut(sunrise, swe.ECL_NUT)[0][0])
+    cos_e = math.cos(obliquity)
+    tan_lat_sin_e = math.tan(math.radians(lat)) * math.sin(obliquity)
+
+    ramc0 = math.radians(swe.sidtime(sunrise) * 15.0 + lon)
+    day_step = (sunset - sunrise) / 8 * _RATE
+    night_step = (next_sunrise - sunset) / 8 * _RATE
+    night_ramc0 = ramc0 + (sunset - sunrise) * _RATE
+    ramcs = [ramc0 + day_step * i for i in range(8)] + [night_ramc0 + night_step * i for i in range(8)]
+    return [math.degrees(math.atan2(math.cos(ramc), -math.sin(ramc) * cos_e - tan_lat_sin_e)) % 360.0
+            for ramc in ramcs]
+
+
+def portion_ascendants(solar, lat, lon, ctx=DEFAULT_CONTEXT):
+    """Sidereal ascendants at the 16 portion starts (see tropical_portion_ascendants)."""
+    # houses_ex subtracts the true ayanamsa (mean ayanamsa + nutation in longitude)
+    ayanamsa = ctx.true_ayanamsa_ut(solar["sunrise"])
+    return [(asc - ayanamsa) % 360.0 for asc in tropical_portion_ascendants(solar, lat, lon)]
+
+
+def tropical_time_upagrahas(jd_utc, lat, lon, night=None, weekday=None):
+    """
+    ({name: tropical longitude}, sunrise UT JD) of the time-based upagrahas;
+    subtracting a context's true ayanamsa at that sunrise gives
+    time_upagrahas. None at polar latitudes.
+    """
+    solar = get_solar_events(jd_utc, lat, lon)
+    if solar["sunrise"] is None or solar["sunset"] is None or solar["next_sunrise"] is None:
+        return None
+    if night is None:
+        night = jd_utc >= solar["sunset"]
+    if weekday is None:
+        # Vedic weekday: the civil weekday of the sunrise (JD day numbers are Monday-based)
+        weekday = (local_day_number(solar["sunrise"], lon) + 1) % 7
+
+    ascendants = tropical_portion_ascendants(solar, lat, lon)
+    offset = 8 if night else 0
+    lords = portion_lords(weekday, night)
+    result = {name: ascendants[offset + lords.index(lord)] for name, lord in KALADI.items()}
+    result['Mandi'] = ascendants[offset + (lords.index('Sat') - 1) % 7]
+    return result, solar["sunrise"]
+
+
+def time_upagrahas(jd_utc, lat, lon, ctx=DEFAULT_CONTEXT, night=None, weekday=None):
+    """
+    {name: sidereal longitude} of Kala, Mrityu, Ardhaprahara, Yamaghantaka,
+    Gulika and Mandi for a birth at jd_utc, using the day or night portions
+    the birth falls in (or `night` if given) and the weekday of the Vedic
+    day's sunrise (or `weekday`, Sunday = 0). None at polar latitudes.
+    """
+    tropical = tropical_time_upagrahas(jd_utc, lat, lon, night, weekday)
+    if tropical is None:
+        return None
+    longitudes, sunrise = tropical
+    # houses_ex subtracts the true ayanamsa (mean ayanamsa + nutation in longitude)
+    ayanamsa = ctx.true_ayanamsa_ut(sunrise)
+    return {name: (deg - ayanamsa) % 360.0 for name, deg in longitudes.items()}
+
+
+def get_upagrahas(jd_utc, lat, lon, sun_lon=None, ctx=DEFAULT_CONTEXT):
+    """All eleven upagrahas as {name: sidereal longitude}; time-based ones are absent at polar latitudes."""
+    if sun_lon is None:
+        sun_lon = ctx.calc_ut(jd_utc, swe.SUN)[0][0]
+    result = sun_upagrahas(sun_lon)
+    result.update(time_upagrahas(jd_utc, lat, lon, ctx) or {})
+    return result
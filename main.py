@@ -1,44 +1,89 @@
-from PyQt5.QtWidgets import QApplication
+import os
 import sys
-import json
-from gui.start_form import StartForm
-from gui.main_window import MainWindow
-from logic.geo_lookup import load_city_data
-from logic.astroniharEng import get_astro_data
-from logic.panchangWrapper import prepare_panchang_payload
-
-app = QApplication(sys.argv)
-
-if len(sys.argv) > 1 and sys.argv[1].endswith(".rhd"):
-    try:
-        with open(sys.argv[1], "r", encoding="utf-8") as f:
-            user_data = json.load(f)
-
-        first_name = user_data["first_name"]
-        last_name = user_data["last_name"]
-        date = user_data["date"]
-        time = user_data["time"]
-        ampm = user_data["ampm"]
-        full_time = f"{time} {ampm}"
-        state = user_data["state"]
-        city = user_data["city"]
-
-        city_data = load_city_data()
-        lat, lon = city_data[state][city]
-
-        # 🔍 Get Astro and Panchang data
-        astro_data = get_astro_data(date, full_time, lat, lon)
-        panchang_data = prepare_panchang_payload(date, time, ampm, lat, lon)
-
-        window = MainWindow(first_name, last_name, date, full_time, lat, lon, astro_data, panchang_data)
-        window.showMaximized()
-
-    except Exception as e:
-        print(f"[ERROR] Failed to load .rhd file: {e}")
-        window = StartForm()
-        window.show()
-else:
+import multiprocessing
+
+# 🕒 Import-time breakdown: python main.py --profile-startup
+PROFILE_STARTUP = "--profile-startup" in sys.argv
+if PROFILE_STARTUP:
+    sys.argv.remove("--profile-startup")
+    from helper.startup_profile import StartupProfiler
+    profiler = StartupProfiler().install()
+
+# 🔬 Per-chart Swiss Ephemeris call profile: python main.py --profile-ephemeris
+if "--profile-ephemeris" in sys.argv:
+    sys.argv.remove("--profile-ephemeris")
+    os.environ["ROGAHORA_EPHEMERIS_PROFILE"] = "1"
+
+# 🌐 Divisional charts through QtWebEngine instead of the native painter: python main.py --web-charts
+if "--web-charts" in sys.argv:
+    sys.argv.remove("--web-charts")
+    os.environ["ROGAHORA_CHART_BACKEND"] = "web"
+
+from PyQt5.QtWidgets import QApplication
+from PyQt5.QtCore import QCoreApplication, Qt, QTimer
+
+
+def open_rhd_window(path):
+    # MainWindow (and with --web-charts, QtWebEngine) is only imported when a chart opens
+    from gui.main_window import MainWindow
+    from gui.chart_worker import ChartComputation
+    from logic.gazetteer import load_gazetteer
+    from logic.rhd_file import load_rhd
+
+    user_data = load_rhd(path)
+
+    first_name = user_data["first_name"]
+    last_name = user_data["last_name"]
+    date = user_data["date"]
+    time = user_data["time"]
+    ampm = user_data["ampm"]
+    full_time = f"{time} {ampm}"
+    state = user_data["state"]
+    city = user_data["city"]
+
+    lat, lon = load_gazetteer().lookup(state, city)
+
+    # 🔍 Astro and Panchang data are computed in the background
+    computation = ChartComputation(date, full_time, time, ampm, lat, lon)
+    computation.start()
+    window = MainWindow(first_name, last_name, date, full_time, lat, lon, computation=computation)
+    window.showMaximized()
+    return window
+
+
+def open_start_form():
+    from gui.start_form import StartForm
     window = StartForm()
     window.show()
+    return window
+
+
+def main():
+    # Lets QtWebEngine be imported after the QApplication exists (deferred until first chart)
+    QCoreApplication.setAttribute(Qt.AA_ShareOpenGLContexts)
+    from logic.ephemeris_profile import install_if_enabled
+    install_if_enabled()
+    app = QApplication(sys.argv)
+    if PROFILE_STARTUP:
+        profiler.mark("QApplication created")
+
+    window = None
+    if len(sys.argv) > 1 and sys.argv[1].endswith(".rhd"):
+        try:
+            window = open_rhd_window(sys.argv[1])
+        except Exception as e:
+            print(f"[ERROR] Failed to load .rhd file: {e}")
+    if window is None:
+        window = open_start_form()
+
+    if PROFILE_STARTUP:
+        profiler.mark("first window shown")
+        # Report once the event loop has painted the first frame
+        QTimer.singleShot(0, lambda: (profiler.mark("event loop running"), profiler.report(), profiler.uninstall()))
+
+    return app.exec_()
+
 
-sys.exit(app.exec_())
+if __name__ == "__main__":
+    multiprocessing.freeze_support()  # process pools in the frozen build
+    sys.exit(main())